@@ -6,23 +6,36 @@ import argparse
 import logging
 import sys
 
-from adas.control import PIDLikeLongitudinalController, SafetyLimits, SafetyMonitor
+from adas.control import (
+    PIDLikeLongitudinalController,
+    SafetyLimits,
+    SafetyMonitor,
+    SafetyThread,
+)
 from adas.core.config import load_config
+from adas.core.jit import NUMBA_AVAILABLE, precompile_kernels
 from adas.core.logger import setup_logger
 from adas.perception.detection import ObjectDetector
 from adas.perception.lane import LaneEstimator
 from adas.planning import BehaviorPlanner
-from adas.runtime import ADASPipeline, PipelineRunner
+from adas.runtime import ADASPipeline, PipelineRunner, PlannerThread
 from adas.tracking import MultiObjectTracker
 
 logger = setup_logger(__name__)
 
 
-def build_pipeline(config_path: str | None = None) -> tuple[ADASPipeline, int]:
+def build_pipeline(
+    config_path: str | None = None,
+    async_safety: bool = False,
+    threaded_planner: bool = False,
+) -> tuple[ADASPipeline, int]:
     """Build ADAS pipeline from configuration.
     
     Args:
         config_path: Path to configuration file (None for defaults)
+        async_safety: Run safety checks on a dedicated thread instead of inline
+        threaded_planner: Run the planner on its own thread, handing plans to
+            control through a ring buffer
         
     Returns:
         Tuple of (pipeline, target_fps)
@@ -30,8 +43,7 @@ def build_pipeline(config_path: str | None = None) -> tuple[ADASPipeline, int]:
     config = load_config(config_path)
     
     # Configure logging level
-    log_level = getattr(logging, config.log_level)
-    logging.getLogger().setLevel(log_level)
+    logging.getLogger().setLevel(config.log_level_int)
     
     logger.info("Building ADAS pipeline from configuration")
     
@@ -48,6 +60,8 @@ def build_pipeline(config_path: str | None = None) -> tuple[ADASPipeline, int]:
         focal_length_px=config.tracker.focal_length_px,
         min_box_height_px=config.tracker.min_box_height_px,
         max_distance_m=config.tracker.max_distance_m,
+        association=config.tracker.association,
+        class_aware=config.tracker.class_aware,
     )
     
     planner = BehaviorPlanner(
@@ -65,6 +79,7 @@ def build_pipeline(config_path: str | None = None) -> tuple[ADASPipeline, int]:
         max_brake=config.controller.max_brake,
         max_steering_angle_deg=config.controller.max_steering_angle_deg,
         steering_deadband_deg=config.controller.steering_deadband_deg,
+        trust_inputs=True,  # Plans come from the in-process BehaviorPlanner
     )
     
     # Build safety monitor from config
@@ -79,6 +94,16 @@ def build_pipeline(config_path: str | None = None) -> tuple[ADASPipeline, int]:
     )
     safety_monitor = SafetyMonitor(limits=safety_limits)
     
+    planner_thread = None
+    if threaded_planner:
+        planner_thread = PlannerThread(planner)
+        planner_thread.start()
+    
+    safety_thread = None
+    if async_safety:
+        safety_thread = SafetyThread(monitor=safety_monitor)
+        safety_thread.start()
+    
     # Build pipeline
     pipeline = ADASPipeline(
         detector=detector,
@@ -87,6 +112,8 @@ def build_pipeline(config_path: str | None = None) -> tuple[ADASPipeline, int]:
         planner=planner,
         controller=controller,
         safety_monitor=safety_monitor,
+        safety_thread=safety_thread,
+        planner_thread=planner_thread,
     )
     
     logger.info("Pipeline built successfully")
@@ -116,6 +143,26 @@ def main() -> None:
         default=60, 
         help="Number of frames to process in synthetic mode"
     )
+    parser.add_argument(
+        "--async-safety",
+        action="store_true",
+        help="Run safety checks on a dedicated thread decoupled from control"
+    )
+    parser.add_argument(
+        "--threaded-planner",
+        action="store_true",
+        help="Run the planner on its own thread and hand plans to control via a ring buffer"
+    )
+    parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help="Overlap perception of the next frame with planning of the current one"
+    )
+    parser.add_argument(
+        "--precompile",
+        action="store_true",
+        help="Compile and cache the Numba kernels, then exit"
+    )
     parser.add_argument(
         "--log-level",
         type=str,
@@ -126,19 +173,32 @@ def main() -> None:
     
     args = parser.parse_args()
     
+    if args.precompile:
+        modules = precompile_kernels()
+        logger.info("Kernels ready (numba=%s): %s", NUMBA_AVAILABLE, ", ".join(modules))
+        return
+    
+    pipeline = None
     try:
         # Build pipeline
-        pipeline, fps = build_pipeline(args.config)
+        pipeline, fps = build_pipeline(
+            args.config,
+            async_safety=args.async_safety,
+            threaded_planner=args.threaded_planner,
+        )
         
         # Override log level if specified
         if args.log_level:
-            log_level = getattr(logging, args.log_level)
-            logging.getLogger().setLevel(log_level)
+            logging.getLogger().setLevel(args.log_level)  # Accepts level names directly
+            pipeline.controller.refresh_log_level()
         
         # Run synthetic test
-        logger.info(f"Starting ADAS system (FPS={fps})")
-        runner = PipelineRunner(pipeline, target_fps=float(fps))
-        runner.run_synthetic(max_frames=args.frames)
+        logger.info("Starting ADAS system (FPS=%s)", fps)
+        runner = PipelineRunner(pipeline, target_fps=float(fps), verbose=args.log_level == "DEBUG")
+        if args.pipelined:
+            runner.run_pipelined(max_frames=args.frames)
+        else:
+            runner.run_synthetic(max_frames=args.frames)
         
         logger.info("ADAS system shutdown complete")
         
@@ -146,8 +206,11 @@ def main() -> None:
         logger.info("Interrupted by user")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         sys.exit(1)
+    finally:
+        if pipeline is not None:
+            pipeline.close()
 
 
 if __name__ == "__main__":
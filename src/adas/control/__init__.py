@@ -1,14 +1,18 @@
 """Control modules.
 
 This package provides control functionality including
-PID controllers and safety monitoring.
+PID controllers, command buffering, and safety monitoring.
 """
 
+from adas.control.buffer import CommandBuffer
 from adas.control.controller import PIDLikeLongitudinalController
 from adas.control.safety import SafetyLimits, SafetyMonitor
+from adas.control.safety_thread import SafetyThread
 
 __all__ = [
+    "CommandBuffer",
     "PIDLikeLongitudinalController",
     "SafetyLimits",
     "SafetyMonitor",
+    "SafetyThread",
 ]
@@ -0,0 +1,165 @@
+"""Numeric kernels for the control hot path.
+
+Kernels take and return plain floats so they compile in Numba's nopython mode
+when Numba is installed and run as ordinary Python otherwise.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import lru_cache
+
+import numpy as np
+
+from adas.core.jit import NUMBA_AVAILABLE, njit, prange
+
+# Explicit signature compiles eagerly at import (and ``cache=True`` persists the
+# machine code), so the first control frame does not pay JIT latency. The only
+# caller of the compiled scalar kernel is the batch ``to_commands_kernel``; the
+# per-frame path runs its ``py_func`` (see ``_to_command_py``).
+_COMMAND_SIGNATURE = "UniTuple(float64, 3)(" + ", ".join(["float64"] * 8) + ")"
+_BATCH_SIGNATURE = "void(" + ", ".join(["float32[::1]"] * 6 + ["float64"] * 5) + ")"
+
+
+@njit(_COMMAND_SIGNATURE, cache=True, fastmath=True)
+def _to_command_kernel(
+    target_v: float,
+    cur_v: float,
+    steer_deg: float,
+    kp: float,
+    max_th: float,
+    max_br: float,
+    max_str_deg: float,
+    deadband: float,
+) -> tuple[float, float, float]:
+    """Compute ``(throttle, brake, steering)`` from a motion plan.
+
+    Args:
+        target_v: Target speed in m/s
+        cur_v: Current speed in m/s
+        steer_deg: Target steering angle in degrees
+        kp: Proportional speed gain
+        max_th: Maximum throttle command
+        max_br: Maximum brake command
+        max_str_deg: Maximum physical steering angle in degrees
+        deadband: Steering deadband in degrees
+
+    Returns:
+        Tuple of (throttle, brake, steering) with steering normalized to [-1, 1]
+    """
+    # Longitudinal control (speed)
+    speed_error = target_v - cur_v
+    if speed_error >= 0.0:
+        throttle = min(max_th, kp * speed_error)
+        brake = 0.0
+    else:
+        throttle = 0.0
+        brake = min(max_br, -kp * speed_error)
+
+    # Lateral control (steering) with deadband to avoid jitter; the clamp is
+    # written as compares so Numba emits selects and Python makes no calls
+    if abs(steer_deg) < deadband:
+        steering = 0.0
+    else:
+        steering = steer_deg / max_str_deg
+        if steering > 1.0:
+            steering = 1.0
+        elif steering < -1.0:
+            steering = -1.0
+
+    return throttle, brake, steering
+
+
+# Pure-Python body of the scalar kernel: for three scalars per frame a Numba
+# dispatcher call costs about as much as the arithmetic itself
+_to_command_py = getattr(_to_command_kernel, "py_func", _to_command_kernel)
+
+
+@lru_cache(maxsize=16)
+def make_command_kernel(
+    kp: float, max_th: float, max_br: float, max_str_deg: float, deadband: float
+) -> Callable[[float, float, float], tuple[float, float, float]]:
+    """Build a command function specialized to fixed controller gains.
+
+    The gains are captured as closure cells, which are faster to load than
+    per-call attribute lookups. The closure runs the plain Python kernel, so
+    building one for a new gain set involves no JIT compilation. Functions are
+    memoized per gain set, so controllers sharing a configuration share one.
+
+    Args:
+        kp: Proportional speed gain
+        max_th: Maximum throttle command
+        max_br: Maximum brake command
+        max_str_deg: Maximum physical steering angle in degrees
+        deadband: Steering deadband in degrees
+
+    Returns:
+        Function mapping (target_v, cur_v, steer_deg) to (throttle, brake, steering)
+    """
+    def command_kernel(
+        target_v: float, cur_v: float, steer_deg: float
+    ) -> tuple[float, float, float]:
+        return _to_command_py(
+            target_v, cur_v, steer_deg, kp, max_th, max_br, max_str_deg, deadband
+        )
+
+    return command_kernel
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(_BATCH_SIGNATURE, parallel=True, cache=True, fastmath=True)
+    def to_commands_kernel(
+        target_v: np.ndarray,
+        cur_v: np.ndarray,
+        steer_deg: np.ndarray,
+        throttle: np.ndarray,
+        brake: np.ndarray,
+        steering: np.ndarray,
+        kp: float,
+        max_th: float,
+        max_br: float,
+        max_str_deg: float,
+        deadband: float,
+    ) -> None:
+        """Compute commands for N independent frames in parallel.
+
+        Args:
+            target_v: Target speeds in m/s
+            cur_v: Current speeds in m/s
+            steer_deg: Target steering angles in degrees
+            throttle: Output throttle commands
+            brake: Output brake commands
+            steering: Output steering commands normalized to [-1, 1]
+            kp: Proportional speed gain
+            max_th: Maximum throttle command
+            max_br: Maximum brake command
+            max_str_deg: Maximum physical steering angle in degrees
+            deadband: Steering deadband in degrees
+        """
+        for i in prange(target_v.shape[0]):
+            throttle[i], brake[i], steering[i] = _to_command_kernel(
+                target_v[i], cur_v[i], steer_deg[i], kp, max_th, max_br, max_str_deg, deadband
+            )
+
+else:
+
+    def to_commands_kernel(
+        target_v: np.ndarray,
+        cur_v: np.ndarray,
+        steer_deg: np.ndarray,
+        throttle: np.ndarray,
+        brake: np.ndarray,
+        steering: np.ndarray,
+        kp: float,
+        max_th: float,
+        max_br: float,
+        max_str_deg: float,
+        deadband: float,
+    ) -> None:
+        """Vectorized NumPy equivalent of the parallel kernel (no Numba)."""
+        speed_error = kp * (target_v - cur_v)
+        np.clip(speed_error, 0.0, max_th, out=throttle)
+        np.clip(-speed_error, 0.0, max_br, out=brake)
+        np.clip(steer_deg / max_str_deg, -1.0, 1.0, out=steering)
+        steering[np.abs(steer_deg) < deadband] = 0.0
@@ -0,0 +1,99 @@
+"""Pre-allocated ring buffer for control commands.
+
+Commands are stored in structure-of-arrays layout so consecutive frames can be
+post-processed with vectorized NumPy operations instead of per-frame objects.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from adas.core.exceptions import ValidationError
+from adas.core.models import ControlCommand
+
+
+class CommandBuffer:
+    """Fixed-capacity ring buffer holding the last N control commands.
+
+    Each actuator channel is a contiguous ``float32`` array. Writing a command
+    only stores three scalars into pre-allocated memory, so the control loop
+    allocates nothing per frame.
+    """
+
+    __slots__ = ("_count", "brake", "capacity", "steering", "throttle")
+
+    def __init__(self, capacity: int = 256):
+        """Initialize command buffer.
+
+        Args:
+            capacity: Number of commands retained before the oldest is overwritten
+
+        Raises:
+            ValidationError: If capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValidationError(f"Buffer capacity must be positive, got {capacity}")
+
+        self.capacity = capacity
+        self.throttle = np.zeros(capacity, dtype=np.float32)
+        self.brake = np.zeros(capacity, dtype=np.float32)
+        self.steering = np.zeros(capacity, dtype=np.float32)
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Number of valid commands currently stored."""
+        return min(self._count, self.capacity)
+
+    @property
+    def total_written(self) -> int:
+        """Total number of commands written since creation or last clear."""
+        return self._count
+
+    def append(self, throttle: float, brake: float, steering: float) -> int:
+        """Write one command into the next slot.
+
+        Args:
+            throttle: Throttle command
+            brake: Brake command
+            steering: Normalized steering command
+
+        Returns:
+            Slot index the command was written to
+        """
+        idx = self._count % self.capacity
+        self.throttle[idx] = throttle
+        self.brake[idx] = brake
+        self.steering[idx] = steering
+        self._count += 1
+        return idx
+
+    def window(self, start: int, stop: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return writable views over a contiguous range of slots.
+
+        Args:
+            start: First slot index (inclusive)
+            stop: Last slot index (exclusive)
+
+        Returns:
+            Tuple of (throttle, brake, steering) array views
+        """
+        return self.throttle[start:stop], self.brake[start:stop], self.steering[start:stop]
+
+    def latest(self) -> ControlCommand | None:
+        """Materialize the most recently written command.
+
+        Returns:
+            Latest control command, or None if the buffer is empty
+        """
+        if self._count == 0:
+            return None
+        idx = (self._count - 1) % self.capacity
+        return ControlCommand(
+            throttle=float(self.throttle[idx]),
+            brake=float(self.brake[idx]),
+            steering=float(self.steering[idx]),
+        )
+
+    def clear(self) -> None:
+        """Discard all stored commands."""
+        self._count = 0
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import logging
 import math
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 
+import numpy as np
+
+from adas.control._kernels import make_command_kernel, to_commands_kernel
+from adas.control.buffer import CommandBuffer
 from adas.core.exceptions import ControlError, ValidationError
 from adas.core.logger import setup_logger
 from adas.core.models import ControlCommand, MotionPlan
@@ -12,6 +18,8 @@ from adas.core.validation import validate_control_command, validate_motion_plan
 
 logger = setup_logger(__name__)
 
+_INF = math.inf
+
 
 @dataclass(slots=True)
 class PIDLikeLongitudinalController:
@@ -30,6 +38,17 @@ class PIDLikeLongitudinalController:
     max_steering_angle_deg: float = 25.0  # Maximum physical steering angle
     steering_deadband_deg: float = 0.5  # Ignore small steering commands
     
+    # Skip plan validation for plans from trusted in-process planners
+    trust_inputs: bool = False
+    
+    # Control kernel specialized to the gains above (built in __post_init__)
+    _impl: Callable[[float, float, float], tuple[float, float, float]] = field(
+        init=False, repr=False, compare=False
+    )
+    
+    # Cached DEBUG gate for the per-frame log (see refresh_log_level)
+    _debug: bool = field(default=False, init=False, repr=False, compare=False)
+    
     def __post_init__(self) -> None:
         """Validate controller configuration."""
         if self.kp_speed <= 0:
@@ -37,11 +56,31 @@ class PIDLikeLongitudinalController:
         if self.max_steering_angle_deg <= 0:
             raise ValidationError(f"Max steering must be positive, got {self.max_steering_angle_deg}")
         
+        # Gains are fixed after construction, so bind them into the kernel once
+        self._impl = make_command_kernel(
+            float(self.kp_speed),
+            float(self.max_throttle),
+            float(self.max_brake),
+            float(self.max_steering_angle_deg),
+            float(self.steering_deadband_deg),
+        )
+        
+        self.refresh_log_level()
+        
         logger.info(
-            f"PIDController initialized: kp={self.kp_speed}, "
-            f"max_steering={self.max_steering_angle_deg}°"
+            "PIDController initialized: kp=%s, max_steering=%s°",
+            self.kp_speed,
+            self.max_steering_angle_deg,
         )
 
+    def refresh_log_level(self) -> None:
+        """Re-read whether DEBUG logging is enabled.
+        
+        The per-frame debug log is gated on a cached flag instead of asking the
+        logging hierarchy every frame; call this after changing log levels.
+        """
+        self._debug = logger.isEnabledFor(logging.DEBUG)
+
     def to_command(self, plan: MotionPlan, current_speed_mps: float) -> ControlCommand:
         """Convert motion plan to control command.
         
@@ -56,34 +95,21 @@ class PIDLikeLongitudinalController:
             ControlError: If command generation fails
         """
         try:
-            # Validate inputs
-            validate_motion_plan(plan)
-            
-            if current_speed_mps < 0:
-                raise ValidationError(f"Current speed must be non-negative, got {current_speed_mps}")
-            
-            if not math.isfinite(current_speed_mps):
-                raise ValidationError(f"Current speed must be finite, got {current_speed_mps}")
-            
-            # Longitudinal control (speed)
-            throttle, brake = self._compute_longitudinal_control(
-                plan.target_speed_mps, current_speed_mps
-            )
-            
-            # Lateral control (steering)
-            steering = self._compute_steering_control(plan.steering_angle_deg)
+            throttle, brake, steering = self._compute(plan, current_speed_mps)
             
             # Create control command
             cmd = ControlCommand(throttle=throttle, brake=brake, steering=steering)
             
-            # Validate output
-            validate_control_command(cmd)
+            # Validate output (elided under python -O)
+            if __debug__ and not self.trust_inputs:
+                validate_control_command(cmd)
             
-            logger.debug(
-                f"Control: throttle={throttle:.2f}, brake={brake:.2f}, "
-                f"steering={steering:.3f} (target={plan.target_speed_mps:.1f} m/s, "
-                f"current={current_speed_mps:.1f} m/s)"
-            )
+            if self._debug:
+                logger.debug(
+                    "Control: throttle=%.2f, brake=%.2f, steering=%.3f "
+                    "(target=%.1f m/s, current=%.1f m/s)",
+                    throttle, brake, steering, plan.target_speed_mps, current_speed_mps,
+                )
             
             return cmd
             
@@ -92,48 +118,111 @@ class PIDLikeLongitudinalController:
         except Exception as e:
             raise ControlError(f"Control command generation failed: {e}") from e
     
-    def _compute_longitudinal_control(
-        self, target_speed_mps: float, current_speed_mps: float
-    ) -> tuple[float, float]:
-        """Compute throttle and brake commands.
+    def write_command(
+        self, plan: MotionPlan, current_speed_mps: float, buffer: CommandBuffer
+    ) -> int:
+        """Convert motion plan to control command stored in a command buffer.
+        
+        Allocation-free alternative to ``to_command`` for loops that keep
+        their command history in a ``CommandBuffer``.
         
         Args:
-            target_speed_mps: Target speed
-            current_speed_mps: Current speed
+            plan: Motion plan with target speed and steering
+            current_speed_mps: Current vehicle speed in m/s
+            buffer: Ring buffer receiving the command
             
         Returns:
-            Tuple of (throttle, brake) in range [0, 1]
+            Slot index the command was written to
+            
+        Raises:
+            ControlError: If command generation fails
         """
-        speed_error = target_speed_mps - current_speed_mps
-        
-        if speed_error >= 0:
-            # Accelerate
-            throttle = min(self.max_throttle, self.kp_speed * speed_error)
-            brake = 0.0
-        else:
-            # Decelerate
-            throttle = 0.0
-            brake = min(self.max_brake, self.kp_speed * abs(speed_error))
-        
-        return throttle, brake
+        try:
+            throttle, brake, steering = self._compute(plan, current_speed_mps)
+        except ValidationError as e:
+            raise ControlError(f"Control validation failed: {e}") from e
+        except Exception as e:
+            raise ControlError(f"Control command generation failed: {e}") from e
+        
+        return buffer.append(throttle, brake, steering)
     
-    def _compute_steering_control(self, target_steering_deg: float) -> float:
-        """Compute normalized steering command.
+    def to_commands(
+        self,
+        target_speed_mps: np.ndarray,
+        current_speed_mps: np.ndarray,
+        steering_angle_deg: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Convert a batch of independent motion plans to control commands.
+        
+        Batched counterpart of ``to_command`` for offline evaluation. Frames
+        are processed in parallel, so each frame's current speed must be known
+        up front (e.g. recorded), not fed back from the previous command.
         
         Args:
-            target_steering_deg: Target steering angle in degrees
+            target_speed_mps: Target speeds in m/s, shape (N,)
+            current_speed_mps: Current vehicle speeds in m/s, shape (N,)
+            steering_angle_deg: Target steering angles in degrees, shape (N,)
             
         Returns:
-            Normalized steering in range [-1, 1]
+            Tuple of float32 (throttle, brake, steering) arrays, shape (N,)
+            
+        Raises:
+            ControlError: If inputs are invalid
         """
-        # Apply deadband to avoid jitter
-        if abs(target_steering_deg) < self.steering_deadband_deg:
-            return 0.0
+        target_v = np.ascontiguousarray(target_speed_mps, dtype=np.float32)
+        cur_v = np.ascontiguousarray(current_speed_mps, dtype=np.float32)
+        steer_deg = np.ascontiguousarray(steering_angle_deg, dtype=np.float32)
+        
+        if not (target_v.ndim == 1 and target_v.shape == cur_v.shape == steer_deg.shape):
+            raise ControlError(
+                f"Batch arrays must be 1-D with equal length, got shapes "
+                f"{target_v.shape}, {cur_v.shape}, {steer_deg.shape}"
+            )
         
-        # Normalize to [-1, 1]
-        steering_normalized = target_steering_deg / self.max_steering_angle_deg
+        # Validation stays outside the fastmath kernel, which assumes finite inputs
+        if not (np.isfinite(target_v).all() and np.isfinite(cur_v).all()
+                and np.isfinite(steer_deg).all()):
+            raise ControlError("Batch contains non-finite values")
+        if (target_v < 0).any() or (cur_v < 0).any():
+            raise ControlError("Batch contains negative speeds")
         
-        # Clamp to valid range
-        steering_normalized = max(-1.0, min(1.0, steering_normalized))
+        throttle = np.empty_like(target_v)
+        brake = np.empty_like(target_v)
+        steering = np.empty_like(target_v)
+        to_commands_kernel(
+            target_v, cur_v, steer_deg, throttle, brake, steering,
+            float(self.kp_speed), float(self.max_throttle), float(self.max_brake),
+            float(self.max_steering_angle_deg), float(self.steering_deadband_deg),
+        )
+        
+        return throttle, brake, steering
+    
+    def _compute(self, plan: MotionPlan, current_speed_mps: float) -> tuple[float, float, float]:
+        """Validate inputs and run the control kernel.
+        
+        Args:
+            plan: Motion plan with target speed and steering
+            current_speed_mps: Current vehicle speed in m/s
+            
+        Returns:
+            Tuple of (throttle, brake, steering)
+            
+        Raises:
+            ValidationError: If inputs are invalid
+        """
+        # In-process planners already clamp their output to configured bounds
+        if not self.trust_inputs:
+            validate_motion_plan(plan)
+        
+        # Speed comes from vehicle sensors, so it is always checked. One chained
+        # comparison rejects negatives, NaN and +inf without calling into libm;
+        # it cannot live in the fastmath kernel, which assumes finite inputs.
+        if not 0.0 <= current_speed_mps < _INF:
+            if current_speed_mps < 0:
+                raise ValidationError(
+                    f"Current speed must be non-negative, got {current_speed_mps}"
+                )
+            raise ValidationError(f"Current speed must be finite, got {current_speed_mps}")
         
-        return steering_normalized
+        # Longitudinal (speed) and lateral (steering) control
+        return self._impl(plan.target_speed_mps, current_speed_mps, plan.steering_angle_deg)
@@ -5,15 +5,21 @@ This module implements safety checks and bounds enforcement.
 
 from __future__ import annotations
 
+import logging
 import math
 from dataclasses import dataclass
 
+import numpy as np
+
 from adas.core.exceptions import SafetyViolation
 from adas.core.logger import setup_logger
 from adas.core.models import ControlCommand, MotionPlan, TrackedObject
 
 logger = setup_logger(__name__)
 
+# Time horizon used to turn a requested speed change into an acceleration
+_PLAN_HORIZON_S = 0.1
+
 
 @dataclass(slots=True)
 class SafetyLimits:
@@ -26,6 +32,11 @@ class SafetyLimits:
     max_steering_angle_rad: float = 0.52  # ~30 degrees
     min_following_distance_m: float = 2.0  # Minimum safe distance
     max_lateral_offset_m: float = 1.5  # Lane keeping limit
+    
+    @property
+    def max_steering_angle_deg(self) -> float:
+        """Steering angle limit in degrees, the unit used by motion plans."""
+        return math.degrees(self.max_steering_angle_rad)
 
 
 class SafetyMonitor:
@@ -42,6 +53,10 @@ class SafetyMonitor:
         self._last_speed = 0.0
         self._last_timestamp = 0.0
         
+        # Derived bounds precomputed once for the per-frame checks
+        self._max_steer_deg = self.limits.max_steering_angle_deg
+        self._inv_dt = 1.0 / _PLAN_HORIZON_S
+        
     def check_motion_plan(self, plan: MotionPlan, current_speed_mps: float) -> None:
         """Check if motion plan violates safety constraints.
         
@@ -59,11 +74,10 @@ class SafetyMonitor:
                 f"{self.limits.max_speed_mps:.1f} m/s"
             )
         
-        # Check steering angle (convert from degrees to radians)
-        steering_rad = math.radians(plan.steering_angle_deg)
-        if abs(steering_rad) > self.limits.max_steering_angle_rad:
+        # Check steering angle against the precomputed degree bound
+        if abs(plan.steering_angle_deg) > self._max_steer_deg:
             raise SafetyViolation(
-                f"Steering angle {steering_rad:.3f} rad exceeds limit "
+                f"Steering angle {math.radians(plan.steering_angle_deg):.3f} rad exceeds limit "
                 f"±{self.limits.max_steering_angle_rad:.3f} rad"
             )
         
@@ -71,15 +85,16 @@ class SafetyMonitor:
         speed_delta = plan.target_speed_mps - current_speed_mps
         if speed_delta > 0:
             # Accelerating - assume 0.1s time horizon
-            accel = speed_delta / 0.1
+            accel = speed_delta * self._inv_dt
             if accel > self.limits.max_acceleration_mps2:
                 logger.warning(
-                    f"High acceleration requested: {accel:.2f} m/s² "
-                    f"(limit: {self.limits.max_acceleration_mps2:.2f} m/s²)"
+                    "High acceleration requested: %.2f m/s² (limit: %.2f m/s²)",
+                    accel,
+                    self.limits.max_acceleration_mps2,
                 )
         else:
             # Decelerating
-            decel = abs(speed_delta) / 0.1
+            decel = -speed_delta * self._inv_dt
             if decel > self.limits.max_deceleration_mps2:
                 raise SafetyViolation(
                     f"Deceleration {decel:.2f} m/s² exceeds limit "
@@ -133,8 +148,10 @@ class SafetyMonitor:
         safe_distance = max(self.limits.min_following_distance_m, ego_speed_mps * 2.0)
         if distance < safe_distance:
             logger.warning(
-                f"Following distance {distance:.1f}m below recommended "
-                f"{safe_distance:.1f}m at {ego_speed_mps:.1f} m/s"
+                "Following distance %.1fm below recommended %.1fm at %.1f m/s",
+                distance,
+                safe_distance,
+                ego_speed_mps,
             )
     
     def sanitize_control_command(self, cmd: ControlCommand) -> ControlCommand:
@@ -146,15 +163,60 @@ class SafetyMonitor:
         Returns:
             Sanitized control command
         """
-        throttle = max(-1.0, min(1.0, cmd.throttle))
-        brake = max(0.0, min(1.0, cmd.brake))
-        steering = max(-1.0, min(1.0, cmd.steering))
+        # Chained comparisons avoid builtin min/max calls on the common in-range
+        # path; NaN fails the range test and clamps to the upper bound as before
+        throttle = cmd.throttle
+        if not -1.0 <= throttle <= 1.0:
+            throttle = -1.0 if throttle < -1.0 else 1.0
+        brake = cmd.brake
+        if not 0.0 <= brake <= 1.0:
+            brake = 0.0 if brake < 0.0 else 1.0
+        steering = cmd.steering
+        if not -1.0 <= steering <= 1.0:
+            steering = -1.0 if steering < -1.0 else 1.0
         
-        if throttle != cmd.throttle or brake != cmd.brake or steering != cmd.steering:
+        if logger.isEnabledFor(logging.WARNING) and (
+            throttle != cmd.throttle or brake != cmd.brake or steering != cmd.steering
+        ):
             logger.warning(
-                f"Control command clamped: throttle {cmd.throttle:.2f}->{throttle:.2f}, "
-                f"brake {cmd.brake:.2f}->{brake:.2f}, "
-                f"steering {cmd.steering:.3f}->{steering:.3f}"
+                "Control command clamped: throttle %.2f->%.2f, brake %.2f->%.2f, "
+                "steering %.3f->%.3f",
+                cmd.throttle, throttle, cmd.brake, brake, cmd.steering, steering,
             )
         
         return ControlCommand(throttle=throttle, brake=brake, steering=steering)
+    
+    def sanitize_batch(
+        self, throttle: np.ndarray, brake: np.ndarray, steering: np.ndarray
+    ) -> int:
+        """Clamp a window of buffered control commands to safe ranges in place.
+        
+        Vectorized counterpart of ``sanitize_control_command`` for commands held
+        in a ``CommandBuffer``. Clamping is reported once per window rather than
+        once per frame.
+        
+        Args:
+            throttle: Throttle commands (modified in place)
+            brake: Brake commands (modified in place)
+            steering: Steering commands (modified in place)
+            
+        Returns:
+            Number of frames in the window that were clamped
+        """
+        # Negated "in range" tests so NaN is flagged as well
+        clamped = ~(
+            (throttle >= -1.0) & (throttle <= 1.0)
+            & (brake >= 0.0) & (brake <= 1.0)
+            & (steering >= -1.0) & (steering <= 1.0)
+        )
+        num_clamped = int(np.count_nonzero(clamped))
+        
+        if num_clamped:
+            # NaN clamps to the upper bound, as in ``sanitize_control_command``
+            bounds = ((throttle, -1.0, 1.0), (brake, 0.0, 1.0), (steering, -1.0, 1.0))
+            for values, low, high in bounds:
+                values[np.isnan(values)] = high
+                np.clip(values, low, high, out=values)
+            logger.warning("Control commands clamped in %d of %d frames", num_clamped, len(clamped))
+        
+        return num_clamped
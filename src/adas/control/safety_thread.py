@@ -0,0 +1,152 @@
+"""Asynchronous safety supervision decoupled from the control loop.
+
+The control loop publishes each plan/command pair optimistically and keeps
+running; a dedicated thread validates them against the safety limits and
+latches a veto that the control loop polls once per frame.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+
+from adas.control.safety import SafetyMonitor
+from adas.core.exceptions import SafetyViolation
+from adas.core.logger import log_safety_event, setup_logger
+from adas.core.models import ControlCommand, MotionPlan, TrackedObject
+
+logger = setup_logger(__name__)
+
+_STOP = object()  # Queue sentinel that terminates the worker
+
+
+class SafetyThread:
+    """Run ``SafetyMonitor`` checks on a dedicated thread.
+
+    Submitted frames are checked in order. The first violation sets a veto
+    that stays latched until ``clear_veto`` is called; while it is set the
+    control loop should send ``fail_safe_command`` instead of its own output.
+    """
+
+    def __init__(self, monitor: SafetyMonitor | None = None, default_dt: float = 0.1):
+        """Initialize safety thread.
+
+        Args:
+            monitor: Safety monitor performing the checks (uses defaults if None)
+            default_dt: Time step assumed when frames carry no timestamp
+        """
+        self.monitor = monitor or SafetyMonitor()
+        self.default_dt = default_dt
+        self.last_violation: str | None = None
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._veto = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_timestamp_s: float | None = None
+
+    @property
+    def vetoed(self) -> bool:
+        """True once a safety violation has been detected."""
+        return self._veto.is_set()
+
+    @property
+    def is_running(self) -> bool:
+        """True while the worker thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        if self.is_running:
+            return
+        self._thread = threading.Thread(target=self._run, name="adas-safety", daemon=True)
+        self._thread.start()
+        logger.info("Safety thread started")
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Process pending frames and stop the worker thread.
+
+        Args:
+            timeout: Maximum time to wait for the worker in seconds
+        """
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            # Keep the handle so ``is_running`` stays truthful and ``start``
+            # does not spawn a second worker next to the stuck one
+            logger.warning("Safety thread did not stop within %.1fs", timeout)
+            return
+        self._thread = None
+        logger.info("Safety thread stopped")
+
+    def submit(
+        self,
+        plan: MotionPlan,
+        command: ControlCommand,
+        current_speed_mps: float,
+        lead_vehicle: TrackedObject | None = None,
+        timestamp_s: float | None = None,
+    ) -> None:
+        """Queue a frame for safety checking without blocking.
+
+        Args:
+            plan: Motion plan sent to the controller
+            command: Control command published for the frame
+            current_speed_mps: Ego vehicle speed
+            lead_vehicle: Nearest tracked object (None if no vehicle)
+            timestamp_s: Frame timestamp used to derive the control time step
+        """
+        self._queue.put((plan, command, current_speed_mps, lead_vehicle, timestamp_s))
+
+    def clear_veto(self) -> None:
+        """Release a latched veto, e.g. after a driver takeover or reset."""
+        self._veto.clear()
+        self.last_violation = None
+
+    def fail_safe_command(self, command: ControlCommand) -> ControlCommand:
+        """Build the command substituted while vetoed.
+
+        Releases throttle and brakes fully while holding the current steering,
+        so the vehicle does not swerve while it slows down.
+
+        Args:
+            command: Command the controller proposed
+
+        Returns:
+            Fail-safe control command
+        """
+        return ControlCommand(throttle=0.0, brake=1.0, steering=command.steering)
+
+    def _run(self) -> None:
+        """Worker loop consuming queued frames until the stop sentinel arrives."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+
+            plan, command, current_speed_mps, lead_vehicle, timestamp_s = item
+            try:
+                self.monitor.check_motion_plan(plan, current_speed_mps)
+                self.monitor.check_following_distance(lead_vehicle, current_speed_mps)
+                self.monitor.check_control_command(command, self._dt(timestamp_s))
+            except SafetyViolation as e:
+                self._latch_veto(str(e))
+            except Exception as e:  # noqa: BLE001 - fail closed on any check error
+                # A check that cannot run must not let the controller continue
+                # unsupervised, so it fails closed like a violation
+                self._latch_veto(f"Safety check failed: {e}")
+
+    def _latch_veto(self, reason: str) -> None:
+        """Record a violation and engage the veto (logged once per latch)."""
+        self.last_violation = reason
+        if not self._veto.is_set():
+            self._veto.set()
+            log_safety_event(logger, f"Veto engaged: {reason}", "CRITICAL")
+
+    def _dt(self, timestamp_s: float | None) -> float:
+        """Time step since the previous frame, falling back to ``default_dt``."""
+        last, self._last_timestamp_s = self._last_timestamp_s, timestamp_s
+        if timestamp_s is None or last is None or timestamp_s <= last:
+            return self.default_dt
+        return timestamp_s - last
@@ -3,17 +3,54 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, ClassVar, TypeVar
 
 from adas.core.exceptions import ConfigurationError
 from adas.core.logger import setup_logger
 from adas.core.validation import validate_config_value
 
+try:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = setup_logger(__name__)
 
+_SectionT = TypeVar("_SectionT")
+
+# Set while constructing configs from values already known to be valid
+_VALIDATED: ContextVar[bool] = ContextVar("_validated", default=False)
+
+
+@contextmanager
+def validated_construction() -> Iterator[None]:
+    """Skip ``__post_init__`` validation for configs built inside this block.
+    
+    Only for trusted code paths whose values were validated before (e.g. the
+    literal defaults); anything derived from user input must be validated.
+    """
+    token = _VALIDATED.set(True)
+    try:
+        yield
+    finally:
+        _VALIDATED.reset(token)
+
+
+def _validate_spec(section: Any) -> None:
+    """Check every field named in a config class's ``_VALIDATION_SPEC``."""
+    for name, min_val, max_val in section._VALIDATION_SPEC:
+        validate_config_value(name, getattr(section, name), min_val, max_val)
 
-@dataclass(slots=True)
+
+@dataclass(slots=True, frozen=True)
 class DetectorConfig:
     """Object detection configuration."""
     
@@ -22,14 +59,20 @@ class DetectorConfig:
     iou_threshold: float = 0.5
     max_detections: int = 100
     
+    # (field, min, max) bounds checked by __post_init__
+    _VALIDATION_SPEC: ClassVar[tuple[tuple[str, float, float], ...]] = (
+        ("confidence_threshold", 0.0, 1.0),
+        ("iou_threshold", 0.0, 1.0),
+        ("max_detections", 1, 1000),
+    )
+    
     def __post_init__(self) -> None:
         """Validate detector configuration."""
-        validate_config_value("confidence_threshold", self.confidence_threshold, 0.0, 1.0)
-        validate_config_value("iou_threshold", self.iou_threshold, 0.0, 1.0)
-        validate_config_value("max_detections", self.max_detections, 1, 1000)
+        if not _VALIDATED.get():
+            _validate_spec(self)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class TrackerConfig:
     """Multi-object tracker configuration."""
     
@@ -38,15 +81,26 @@ class TrackerConfig:
     focal_length_px: float = 35.0
     min_box_height_px: float = 1.0
     max_distance_m: float = 200.0
+    association: str = "optimal"  # "optimal" (Hungarian) or "greedy"
+    class_aware: bool = True  # Associate tracks only with detections of the same label
+    
+    # (field, min, max) bounds checked by __post_init__
+    _VALIDATION_SPEC: ClassVar[tuple[tuple[str, float, float], ...]] = (
+        ("max_missed_frames", 1, 100),
+        ("association_threshold_px", 1.0, 1000.0),
+        ("focal_length_px", 1.0, 1000.0),
+    )
     
     def __post_init__(self) -> None:
         """Validate tracker configuration."""
-        validate_config_value("max_missed_frames", self.max_missed_frames, 1, 100)
-        validate_config_value("association_threshold_px", self.association_threshold_px, 1.0, 1000.0)
-        validate_config_value("focal_length_px", self.focal_length_px, 1.0, 1000.0)
+        if not _VALIDATED.get():
+            _validate_spec(self)
+            
+            if self.association not in ("optimal", "greedy"):
+                raise ConfigurationError(f"Invalid association method: {self.association}")
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class PlannerConfig:
     """Behavior planner configuration."""
     
@@ -57,15 +111,21 @@ class PlannerConfig:
     max_decel_mps2: float = 3.0
     lane_center_gain: float = 1.0
     
+    # (field, min, max) bounds checked by __post_init__
+    _VALIDATION_SPEC: ClassVar[tuple[tuple[str, float, float], ...]] = (
+        ("cruise_speed_mps", 0.0, 50.0),
+        ("min_follow_distance_m", 0.0, 100.0),
+        ("max_steering_deg", 0.0, 45.0),
+        ("time_gap_s", 0.5, 5.0),
+    )
+    
     def __post_init__(self) -> None:
         """Validate planner configuration."""
-        validate_config_value("cruise_speed_mps", self.cruise_speed_mps, 0.0, 50.0)
-        validate_config_value("min_follow_distance_m", self.min_follow_distance_m, 0.0, 100.0)
-        validate_config_value("max_steering_deg", self.max_steering_deg, 0.0, 45.0)
-        validate_config_value("time_gap_s", self.time_gap_s, 0.5, 5.0)
+        if not _VALIDATED.get():
+            _validate_spec(self)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ControllerConfig:
     """Controller configuration."""
     
@@ -75,14 +135,20 @@ class ControllerConfig:
     max_steering_angle_deg: float = 25.0
     steering_deadband_deg: float = 0.5
     
+    # (field, min, max) bounds checked by __post_init__
+    _VALIDATION_SPEC: ClassVar[tuple[tuple[str, float, float], ...]] = (
+        ("kp_speed", 0.0, 10.0),
+        ("max_throttle", 0.0, 1.0),
+        ("max_brake", 0.0, 1.0),
+    )
+    
     def __post_init__(self) -> None:
         """Validate controller configuration."""
-        validate_config_value("kp_speed", self.kp_speed, 0.0, 10.0)
-        validate_config_value("max_throttle", self.max_throttle, 0.0, 1.0)
-        validate_config_value("max_brake", self.max_brake, 0.0, 1.0)
+        if not _VALIDATED.get():
+            _validate_spec(self)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class SafetyConfig:
     """Safety limits configuration."""
     
@@ -94,14 +160,20 @@ class SafetyConfig:
     min_following_distance_m: float = 2.0
     max_lateral_offset_m: float = 1.5
     
+    # (field, min, max) bounds checked by __post_init__
+    _VALIDATION_SPEC: ClassVar[tuple[tuple[str, float, float], ...]] = (
+        ("max_speed_mps", 0.0, 100.0),
+        ("max_acceleration_mps2", 0.0, 10.0),
+        ("max_deceleration_mps2", 0.0, 15.0),
+    )
+    
     def __post_init__(self) -> None:
         """Validate safety configuration."""
-        validate_config_value("max_speed_mps", self.max_speed_mps, 0.0, 100.0)
-        validate_config_value("max_acceleration_mps2", self.max_acceleration_mps2, 0.0, 10.0)
-        validate_config_value("max_deceleration_mps2", self.max_deceleration_mps2, 0.0, 15.0)
+        if not _VALIDATED.get():
+            _validate_spec(self)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class RuntimeConfig:
     """Complete runtime configuration for ADAS system."""
     
@@ -112,27 +184,37 @@ class RuntimeConfig:
     safety: SafetyConfig
     fps: int = 20
     log_level: str = "INFO"
+    log_level_int: int = field(init=False, repr=False, compare=False)  # Resolved logging level
     
     def __post_init__(self) -> None:
         """Validate runtime configuration."""
-        validate_config_value("fps", self.fps, 1, 120)
+        if not _VALIDATED.get():
+            validate_config_value("fps", self.fps, 1, 120)
+            
+            if self.log_level not in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
+                raise ConfigurationError(f"Invalid log level: {self.log_level}")
         
-        if self.log_level not in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-            raise ConfigurationError(f"Invalid log level: {self.log_level}")
+        object.__setattr__(self, "log_level_int", getattr(logging, self.log_level))
 
 
-DEFAULT_CONFIG = RuntimeConfig(
-    detector=DetectorConfig(),
-    tracker=TrackerConfig(),
-    planner=PlannerConfig(),
-    controller=ControllerConfig(),
-    safety=SafetyConfig(),
-)
+# Class defaults are constants covered by the test suite, so skip re-validating them
+with validated_construction():
+    DEFAULT_CONFIG = RuntimeConfig(
+        detector=DetectorConfig(),
+        tracker=TrackerConfig(),
+        planner=PlannerConfig(),
+        controller=ControllerConfig(),
+        safety=SafetyConfig(),
+    )
 
 
 def load_config(path: str | Path | None = None) -> RuntimeConfig:
     """Load configuration from JSON file or return defaults.
     
+    Parsed configurations are cached by resolved path and modification time,
+    so repeated loads of an unchanged file return the same instance without
+    re-reading it.
+    
     Args:
         path: Path to JSON configuration file (None for defaults)
         
@@ -147,32 +229,11 @@ def load_config(path: str | Path | None = None) -> RuntimeConfig:
         return DEFAULT_CONFIG
 
     try:
-        config_path = Path(path)
+        config_path = Path(path).resolve()
         if not config_path.exists():
             raise ConfigurationError(f"Configuration file not found: {path}")
         
-        logger.info(f"Loading configuration from {path}")
-        payload = json.loads(config_path.read_text())
-        
-        # Parse each section with defaults
-        detector = _parse_detector_config(payload.get("detector", {}))
-        tracker = _parse_tracker_config(payload.get("tracker", {}))
-        planner = _parse_planner_config(payload.get("planner", {}))
-        controller = _parse_controller_config(payload.get("controller", {}))
-        safety = _parse_safety_config(payload.get("safety", {}))
-        
-        config = RuntimeConfig(
-            detector=detector,
-            tracker=tracker,
-            planner=planner,
-            controller=controller,
-            safety=safety,
-            fps=int(payload.get("fps", DEFAULT_CONFIG.fps)),
-            log_level=payload.get("log_level", DEFAULT_CONFIG.log_level),
-        )
-        
-        logger.info("Configuration loaded and validated successfully")
-        return config
+        return _load_cached(str(config_path), config_path.stat().st_mtime_ns)
         
     except json.JSONDecodeError as e:
         raise ConfigurationError(f"Invalid JSON in config file: {e}") from e
@@ -180,58 +241,80 @@ def load_config(path: str | Path | None = None) -> RuntimeConfig:
         raise ConfigurationError(f"Failed to load configuration: {e}") from e
 
 
-def _parse_detector_config(data: dict) -> DetectorConfig:
-    """Parse detector configuration from dict."""
-    return DetectorConfig(
-        model_path=data.get("model_path", DEFAULT_CONFIG.detector.model_path),
-        confidence_threshold=float(data.get("confidence_threshold", DEFAULT_CONFIG.detector.confidence_threshold)),
-        iou_threshold=float(data.get("iou_threshold", DEFAULT_CONFIG.detector.iou_threshold)),
-        max_detections=int(data.get("max_detections", DEFAULT_CONFIG.detector.max_detections)),
-    )
-
-
-def _parse_tracker_config(data: dict) -> TrackerConfig:
-    """Parse tracker configuration from dict."""
-    return TrackerConfig(
-        max_missed_frames=int(data.get("max_missed_frames", DEFAULT_CONFIG.tracker.max_missed_frames)),
-        association_threshold_px=float(data.get("association_threshold_px", DEFAULT_CONFIG.tracker.association_threshold_px)),
-        focal_length_px=float(data.get("focal_length_px", DEFAULT_CONFIG.tracker.focal_length_px)),
-        min_box_height_px=float(data.get("min_box_height_px", DEFAULT_CONFIG.tracker.min_box_height_px)),
-        max_distance_m=float(data.get("max_distance_m", DEFAULT_CONFIG.tracker.max_distance_m)),
-    )
-
-
-def _parse_planner_config(data: dict) -> PlannerConfig:
-    """Parse planner configuration from dict."""
-    return PlannerConfig(
-        cruise_speed_mps=float(data.get("cruise_speed_mps", DEFAULT_CONFIG.planner.cruise_speed_mps)),
-        min_follow_distance_m=float(data.get("min_follow_distance_m", DEFAULT_CONFIG.planner.min_follow_distance_m)),
-        max_steering_deg=float(data.get("max_steering_deg", DEFAULT_CONFIG.planner.max_steering_deg)),
-        time_gap_s=float(data.get("time_gap_s", DEFAULT_CONFIG.planner.time_gap_s)),
-        max_decel_mps2=float(data.get("max_decel_mps2", DEFAULT_CONFIG.planner.max_decel_mps2)),
-        lane_center_gain=float(data.get("lane_center_gain", DEFAULT_CONFIG.planner.lane_center_gain)),
+@lru_cache(maxsize=8)
+def _load_cached(path: str, mtime_ns: int) -> RuntimeConfig:
+    """Parse and validate a configuration file.
+    
+    Args:
+        path: Resolved path to JSON configuration file
+        mtime_ns: File modification time, part of the cache key so edits are picked up
+        
+    Returns:
+        Validated runtime configuration
+    """
+    logger.info("Loading configuration from %s", path)
+    payload = _json_loads(Path(path).read_bytes())
+    
+    # Parse each section on top of the defaults (memoized per section payload)
+    detector = _parse_section(DEFAULT_CONFIG.detector, _section_items(payload, "detector"))
+    tracker = _parse_section(DEFAULT_CONFIG.tracker, _section_items(payload, "tracker"))
+    planner = _parse_section(DEFAULT_CONFIG.planner, _section_items(payload, "planner"))
+    controller = _parse_section(DEFAULT_CONFIG.controller, _section_items(payload, "controller"))
+    safety = _parse_section(DEFAULT_CONFIG.safety, _section_items(payload, "safety"))
+    
+    config = RuntimeConfig(
+        detector=detector,
+        tracker=tracker,
+        planner=planner,
+        controller=controller,
+        safety=safety,
+        fps=int(payload.get("fps", DEFAULT_CONFIG.fps)),
+        log_level=payload.get("log_level", DEFAULT_CONFIG.log_level),
     )
+    
+    logger.info("Configuration loaded and validated successfully")
+    return config
 
 
-def _parse_controller_config(data: dict) -> ControllerConfig:
-    """Parse controller configuration from dict."""
-    return ControllerConfig(
-        kp_speed=float(data.get("kp_speed", DEFAULT_CONFIG.controller.kp_speed)),
-        max_throttle=float(data.get("max_throttle", DEFAULT_CONFIG.controller.max_throttle)),
-        max_brake=float(data.get("max_brake", DEFAULT_CONFIG.controller.max_brake)),
-        max_steering_angle_deg=float(data.get("max_steering_angle_deg", DEFAULT_CONFIG.controller.max_steering_angle_deg)),
-        steering_deadband_deg=float(data.get("steering_deadband_deg", DEFAULT_CONFIG.controller.steering_deadband_deg)),
-    )
+def _section_items(payload: dict[str, Any], name: str) -> frozenset[tuple[str, type, Any]]:
+    """Hashable view of one JSON config section, used as a parse cache key.
+    
+    Value types are part of the key because ``0 == False`` and ``1 == True``
+    hash alike, and only the boolean forms are valid for boolean fields.
+    """
+    return frozenset((k, type(v), v) for k, v in payload.get(name, {}).items())
 
 
-def _parse_safety_config(data: dict) -> SafetyConfig:
-    """Parse safety configuration from dict."""
-    return SafetyConfig(
-        max_speed_mps=float(data.get("max_speed_mps", DEFAULT_CONFIG.safety.max_speed_mps)),
-        max_acceleration_mps2=float(data.get("max_acceleration_mps2", DEFAULT_CONFIG.safety.max_acceleration_mps2)),
-        max_deceleration_mps2=float(data.get("max_deceleration_mps2", DEFAULT_CONFIG.safety.max_deceleration_mps2)),
-        max_steering_rate_rad_s=float(data.get("max_steering_rate_rad_s", DEFAULT_CONFIG.safety.max_steering_rate_rad_s)),
-        max_steering_angle_rad=float(data.get("max_steering_angle_rad", DEFAULT_CONFIG.safety.max_steering_angle_rad)),
-        min_following_distance_m=float(data.get("min_following_distance_m", DEFAULT_CONFIG.safety.min_following_distance_m)),
-        max_lateral_offset_m=float(data.get("max_lateral_offset_m", DEFAULT_CONFIG.safety.max_lateral_offset_m)),
-    )
+@lru_cache(maxsize=32)
+def _parse_section(default: _SectionT, items: frozenset[tuple[str, type, Any]]) -> _SectionT:
+    """Overlay a JSON config section onto its frozen default.
+    
+    Values are cast to the type of the corresponding default; unknown keys are
+    ignored. Boolean fields take only JSON booleans, since casting would turn
+    strings such as ``"false"`` into True. The result is built with
+    ``dataclasses.replace`` so validation in ``__post_init__`` still runs.
+    Results are memoized on the section payload, so identical sections across
+    loads skip casting and validation.
+    
+    Args:
+        default: Default configuration section
+        items: Section payload from the JSON file as (key, type, value) triples
+        
+    Returns:
+        Validated configuration section
+        
+    Raises:
+        ConfigurationError: If a boolean field has a non-boolean value
+    """
+    if not items:
+        return default  # Nothing overridden: reuse the validated default
+    
+    data = {k: v for k, _, v in items}
+    overrides = {}
+    for f in fields(default):
+        if f.name in data:
+            field_type, value = type(getattr(default, f.name)), data[f.name]
+            if field_type is bool and not isinstance(value, bool):
+                raise ConfigurationError(f"{f.name} must be true or false, got {value!r}")
+            overrides[f.name] = field_type(value)
+    return replace(default, **overrides)
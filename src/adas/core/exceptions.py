@@ -8,44 +8,44 @@ from __future__ import annotations
 
 class ADASException(Exception):
     """Base exception for all ADAS errors."""
-    pass
+    __slots__ = ()
 
 
 class ValidationError(ADASException):
     """Raised when input validation fails."""
-    pass
+    __slots__ = ()
 
 
 class SensorError(ADASException):
     """Raised when sensor data is invalid or unavailable."""
-    pass
+    __slots__ = ()
 
 
 class SafetyViolation(ADASException):
     """Raised when a safety constraint is violated."""
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(ADASException):
     """Raised when configuration is invalid."""
-    pass
+    __slots__ = ()
 
 
 class PerceptionError(ADASException):
     """Raised when perception pipeline fails."""
-    pass
+    __slots__ = ()
 
 
 class TrackingError(ADASException):
     """Raised when object tracking fails."""
-    pass
+    __slots__ = ()
 
 
 class PlanningError(ADASException):
     """Raised when motion planning fails."""
-    pass
+    __slots__ = ()
 
 
 class ControlError(ADASException):
     """Raised when control command generation fails."""
-    pass
+    __slots__ = ()
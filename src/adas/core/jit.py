@@ -0,0 +1,60 @@
+"""Optional Numba acceleration for numeric kernels.
+
+Numba is an optional dependency (``pip install adas-core[accel]``). When it is
+not installed, ``njit`` degrades to a no-op decorator so kernels run as plain
+Python with identical results.
+
+Kernels with explicit signatures compile at import and persist their machine
+code with ``cache=True``; ``adas-run --precompile`` fills that cache ahead of
+time (e.g. at install or image build) so no process start pays JIT cost.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args: Any, **kwargs: Any) -> Callable:
+        """Fallback for ``numba.njit`` that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func: Callable) -> Callable:
+            return func
+
+        return decorator
+
+    prange = range
+
+# Modules whose kernels compile eagerly from explicit signatures at import
+KERNEL_MODULES: tuple[str, ...] = (
+    "adas.control._kernels",
+    "adas.planning._kernels",
+    "adas.tracking._kernels",
+)
+
+
+def precompile_kernels() -> tuple[str, ...]:
+    """Compile and cache all eagerly typed kernels before the first frame.
+    
+    Importing a kernel module compiles its kernels and writes them to Numba's
+    on-disk cache (``NUMBA_CACHE_DIR``, or ``__pycache__`` next to the
+    source). Later processes load the cached code instead of invoking LLVM.
+    Without Numba this only imports the modules.
+    
+    Returns:
+        Names of the loaded kernel modules
+    """
+    for name in KERNEL_MODULES:
+        importlib.import_module(name)
+    return KERNEL_MODULES
+
+
+__all__ = ["KERNEL_MODULES", "NUMBA_AVAILABLE", "njit", "prange", "precompile_kernels"]
@@ -7,9 +7,34 @@ from __future__ import annotations
 
 import logging
 import sys
+import time
 from typing import Any
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders each wall-clock second's timestamp only once.
+    
+    The date format has one-second resolution, so consecutive records within
+    the same second reuse the cached ``strftime`` result.
+    """
+    
+    default_msec_format = None  # Date format has no sub-second field
+    
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._cached_second = -1
+        self._cached_time = ""
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = time.strftime(
+                datefmt or self.default_time_format, self.converter(record.created)
+            )
+            self._cached_second = second
+        return self._cached_time
+
+
 def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     """Setup a logger with consistent formatting.
     
@@ -32,7 +57,7 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     handler.setLevel(level)
     
     # Format: timestamp - name - level - message
-    formatter = logging.Formatter(
+    formatter = _CachedTimeFormatter(
         fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
@@ -50,7 +75,8 @@ def log_performance(logger: logging.Logger, operation: str, duration_ms: float)
         operation: Operation name
         duration_ms: Duration in milliseconds
     """
-    logger.info(f"PERF: {operation} took {duration_ms:.2f}ms")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("PERF: %s took %.2fms", operation, duration_ms)
 
 
 def log_safety_event(logger: logging.Logger, event: str, severity: str, **kwargs: Any) -> None:
@@ -5,13 +5,31 @@ This module provides performance metrics and system health monitoring.
 
 from __future__ import annotations
 
+import logging
 import time
 from dataclasses import dataclass, field
 
+import numpy as np
+
+from adas.core.exceptions import ValidationError
 from adas.core.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+_SUMMARY_TEMPLATE = (
+    "Performance Metrics:\n"
+    "  Frames: {frames}\n"
+    "  Detections: {detections} (avg: {det_per_frame:.1f}/frame)\n"
+    "  Tracks: {tracks} (avg: {tracks_per_frame:.1f}/frame)\n"
+    "  Lane Detection: {lane_rate:.1f}%\n"
+    "  Avg FPS: {fps:.1f}\n"
+    "  Avg Frame Time: {avg_ms:.2f}ms\n"
+    "  Min Frame Time: {min_ms:.2f}ms\n"
+    "  Max Frame Time: {max_ms:.2f}ms\n"
+    "  Safety Warnings: {warnings}\n"
+    "  Safety Violations: {violations}\n"
+)
+
 
 @dataclass
 class PerformanceMetrics:
@@ -22,24 +40,31 @@ class PerformanceMetrics:
     total_tracks: int = 0
     frames_with_lane: int = 0
     
-    # Timing metrics (in seconds)
-    total_processing_time: float = 0.0
-    min_frame_time: float = float('inf')
-    max_frame_time: float = 0.0
+    # Timing metrics (integer nanoseconds from time.perf_counter_ns)
+    total_processing_ns: int = 0
+    history_size: int = 10000  # Frame times kept for min/max/percentile statistics
     
     # Safety metrics
     safety_warnings: int = 0
     safety_violations: int = 0
     
-    # Component timing
-    perception_time: float = 0.0
-    tracking_time: float = 0.0
-    planning_time: float = 0.0
-    control_time: float = 0.0
+    # Component timing (nanoseconds)
+    perception_ns: int = 0
+    tracking_ns: int = 0
+    planning_ns: int = 0
+    control_ns: int = 0
+    
+    # Ring buffer of recent frame times (nanoseconds)
+    _frame_times: np.ndarray = field(init=False, repr=False)
+    _frame_idx: int = field(default=0, init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        """Allocate the frame time history."""
+        self._frame_times = np.zeros(self.history_size, dtype=np.int64)
     
     def update_frame(
         self,
-        frame_time: float,
+        frame_time_ns: int,
         num_detections: int,
         num_tracks: int,
         has_lane: bool,
@@ -47,7 +72,7 @@ class PerformanceMetrics:
         """Update metrics for a processed frame.
         
         Args:
-            frame_time: Frame processing time in seconds
+            frame_time_ns: Frame processing time in nanoseconds
             num_detections: Number of detections
             num_tracks: Number of tracks
             has_lane: Whether lane was detected
@@ -58,9 +83,9 @@ class PerformanceMetrics:
         if has_lane:
             self.frames_with_lane += 1
         
-        self.total_processing_time += frame_time
-        self.min_frame_time = min(self.min_frame_time, frame_time)
-        self.max_frame_time = max(self.max_frame_time, frame_time)
+        self.total_processing_ns += frame_time_ns
+        self._frame_times[self._frame_idx % self.history_size] = frame_time_ns
+        self._frame_idx += 1
     
     def record_safety_event(self, is_violation: bool = False) -> None:
         """Record a safety warning or violation.
@@ -73,19 +98,41 @@ class PerformanceMetrics:
         else:
             self.safety_warnings += 1
     
+    @property
+    def total_processing_time(self) -> float:
+        """Total frame processing time in seconds."""
+        return self.total_processing_ns * 1e-9
+    
     @property
     def avg_frame_time(self) -> float:
         """Average frame processing time in seconds."""
         if self.total_frames == 0:
             return 0.0
-        return self.total_processing_time / self.total_frames
+        return self.total_processing_ns * 1e-9 / self.total_frames
+    
+    @property
+    def frame_times_ns(self) -> np.ndarray:
+        """Recent frame times in nanoseconds (unordered once the history wraps)."""
+        return self._frame_times[:min(self._frame_idx, self.history_size)]
+    
+    @property
+    def min_frame_time(self) -> float:
+        """Minimum frame time over the recent history in seconds."""
+        times = self.frame_times_ns
+        return int(times.min()) * 1e-9 if len(times) else 0.0
+    
+    @property
+    def max_frame_time(self) -> float:
+        """Maximum frame time over the recent history in seconds."""
+        times = self.frame_times_ns
+        return int(times.max()) * 1e-9 if len(times) else 0.0
     
     @property
     def avg_fps(self) -> float:
         """Average frames per second."""
-        if self.total_processing_time == 0:
+        if self.total_processing_ns == 0:
             return 0.0
-        return self.total_frames / self.total_processing_time
+        return self.total_frames * 1e9 / self.total_processing_ns
     
     @property
     def lane_detection_rate(self) -> float:
@@ -100,42 +147,65 @@ class PerformanceMetrics:
         Returns:
             Formatted metrics summary
         """
-        return (
-            f"Performance Metrics:\n"
-            f"  Frames: {self.total_frames}\n"
-            f"  Detections: {self.total_detections} (avg: {self.total_detections/max(1, self.total_frames):.1f}/frame)\n"
-            f"  Tracks: {self.total_tracks} (avg: {self.total_tracks/max(1, self.total_frames):.1f}/frame)\n"
-            f"  Lane Detection: {self.lane_detection_rate:.1f}%\n"
-            f"  Avg FPS: {self.avg_fps:.1f}\n"
-            f"  Avg Frame Time: {self.avg_frame_time*1000:.2f}ms\n"
-            f"  Min Frame Time: {self.min_frame_time*1000:.2f}ms\n"
-            f"  Max Frame Time: {self.max_frame_time*1000:.2f}ms\n"
-            f"  Safety Warnings: {self.safety_warnings}\n"
-            f"  Safety Violations: {self.safety_violations}\n"
+        frames = max(1, self.total_frames)
+        return _SUMMARY_TEMPLATE.format(
+            frames=self.total_frames,
+            detections=self.total_detections,
+            det_per_frame=self.total_detections / frames,
+            tracks=self.total_tracks,
+            tracks_per_frame=self.total_tracks / frames,
+            lane_rate=self.lane_detection_rate,
+            fps=self.avg_fps,
+            avg_ms=self.avg_frame_time * 1000,
+            min_ms=self.min_frame_time * 1000,
+            max_ms=self.max_frame_time * 1000,
+            warnings=self.safety_warnings,
+            violations=self.safety_violations,
         )
     
     def log_summary(self) -> None:
         """Log metrics summary."""
-        logger.info(f"\n{self.summary()}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n%s", self.summary())
 
 
 @dataclass
 class SystemHealthMonitor:
-    """Monitor system health and resource usage."""
+    """Monitor system health and resource usage.
     
-    start_time: float = field(default_factory=time.time)
-    last_heartbeat: float = field(default_factory=time.time)
+    ``heartbeat`` is cheap enough to call every frame: it reads the monotonic
+    clock only on every ``sample_every``-th call.
+    """
+    
+    start_ns: int = field(default_factory=time.monotonic_ns)
+    last_heartbeat_ns: int = field(default_factory=time.monotonic_ns)
     heartbeat_interval: float = 5.0  # seconds
+    sample_every: int = 16  # Calls between clock reads (power of two)
+    
+    _call_count: int = field(default=0, init=False, repr=False)
+    _sample_mask: int = field(init=False, repr=False)
+    _interval_ns: int = field(init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        """Precompute the sampling mask and interval in nanoseconds."""
+        if self.sample_every < 1 or self.sample_every & (self.sample_every - 1):
+            raise ValidationError(
+                f"Heartbeat sample_every must be a power of two, got {self.sample_every}"
+            )
+        self._sample_mask = self.sample_every - 1
+        self._interval_ns = int(self.heartbeat_interval * 1e9)
     
     def heartbeat(self) -> None:
         """Record heartbeat and check system health."""
-        now = time.time()
-        elapsed = now - self.last_heartbeat
+        count = self._call_count
+        self._call_count = count + 1
+        if count & self._sample_mask:
+            return
         
-        if elapsed >= self.heartbeat_interval:
-            uptime = now - self.start_time
-            logger.info(f"System heartbeat: uptime={uptime:.1f}s")
-            self.last_heartbeat = now
+        now_ns = time.monotonic_ns()
+        if now_ns - self.last_heartbeat_ns >= self._interval_ns:
+            logger.info("System heartbeat: uptime=%.1fs", (now_ns - self.start_ns) * 1e-9)
+            self.last_heartbeat_ns = now_ns
     
     def check_watchdog(self, timeout: float = 10.0) -> bool:
         """Check if system is responsive.
@@ -146,5 +216,4 @@ class SystemHealthMonitor:
         Returns:
             True if system is responsive, False otherwise
         """
-        elapsed = time.time() - self.last_heartbeat
-        return elapsed < timeout
+        return (time.monotonic_ns() - self.last_heartbeat_ns) * 1e-9 < timeout
@@ -2,8 +2,30 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
-from typing import Any, List
+from enum import IntEnum
+from typing import Any
+
+import numpy as np
+
+
+class LabelId(IntEnum):
+    """Object class ids stored in ``BoundingBoxArray.label_ids``."""
+    
+    UNKNOWN = 0
+    VEHICLE = 1
+    CAR = 2
+    TRUCK = 3
+    PEDESTRIAN = 4
+    CYCLIST = 5
+    SIGN = 6
+
+
+# Interned class names indexed by ``LabelId``, so labels compare by identity
+LABEL_NAMES: tuple[str, ...] = tuple(sys.intern(label.name.lower()) for label in LabelId)
+LABEL_IDS: dict[str, int] = {name: idx for idx, name in enumerate(LABEL_NAMES)}
 
 
 @dataclass(slots=True)
@@ -17,11 +39,78 @@ class BoundingBox:
 
 
 @dataclass(slots=True)
+class BoundingBoxArray:
+    """Structure-of-arrays batch of bounding boxes.
+    
+    Columns are contiguous NumPy arrays so geometry (areas, IoU, gating) runs
+    as vectorized operations over all boxes at once. Indexing and iteration
+    yield ``BoundingBox`` objects for callers that work box by box.
+    """
+    
+    coords: np.ndarray  # (N, 4) float32 as x1, y1, x2, y2
+    conf: np.ndarray  # (N,) float32
+    label_ids: np.ndarray  # (N,) int8 LabelId values
+    
+    @classmethod
+    def empty(cls) -> BoundingBoxArray:
+        """Create a batch with no boxes."""
+        return cls(
+            coords=np.empty((0, 4), dtype=np.float32),
+            conf=np.empty(0, dtype=np.float32),
+            label_ids=np.empty(0, dtype=np.int8),
+        )
+    
+    @classmethod
+    def from_boxes(cls, boxes: Iterable[BoundingBox]) -> BoundingBoxArray:
+        """Pack boxes into columns; unknown labels map to ``"unknown"``."""
+        boxes = list(boxes)
+        if not boxes:
+            return cls.empty()
+        return cls(
+            coords=np.array([(b.x1, b.y1, b.x2, b.y2) for b in boxes], dtype=np.float32),
+            conf=np.array([b.confidence for b in boxes], dtype=np.float32),
+            label_ids=np.array([LABEL_IDS.get(b.label, 0) for b in boxes], dtype=np.int8),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.conf)
+    
+    def __getitem__(self, i: int) -> BoundingBox:
+        x1, y1, x2, y2 = self.coords[i].tolist()
+        return BoundingBox(
+            x1=x1, y1=y1, x2=x2, y2=y2,
+            confidence=float(self.conf[i]),
+            label=LABEL_NAMES[self.label_ids[i]],
+        )
+    
+    def __iter__(self) -> Iterator[BoundingBox]:
+        return (self[i] for i in range(len(self)))
+    
+    def areas(self) -> np.ndarray:
+        """Box areas in square pixels, shape (N,)."""
+        c = self.coords
+        return (c[:, 2] - c[:, 0]) * (c[:, 3] - c[:, 1])
+    
+    def iou(self, other: BoundingBoxArray) -> np.ndarray:
+        """Pairwise intersection-over-union with another batch, shape (N, M)."""
+        a = self.coords[:, None, :]
+        b = other.coords[None, :, :]
+        top_left = np.maximum(a[..., :2], b[..., :2])
+        bottom_right = np.minimum(a[..., 2:], b[..., 2:])
+        wh = np.clip(bottom_right - top_left, 0.0, None)
+        inter = wh[..., 0] * wh[..., 1]
+        union = self.areas()[:, None] + other.areas()[None, :] - inter
+        return np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+
+
+@dataclass(slots=True, frozen=True)
 class LaneModel:
     left_coeffs: tuple[float, float, float]
     right_coeffs: tuple[float, float, float]
     lane_center_px: float
     curvature_m: float
+    lateral_offset_m: float = 0.0  # Ego offset from lane center, positive = right of center
+    heading_error_rad: float = 0.0  # Ego heading relative to the lane direction
 
 
 @dataclass(slots=True)
@@ -32,22 +121,143 @@ class TrackedObject:
     distance_m: float
 
 
+@dataclass(slots=True)
+class TrackedObjectArray:
+    """Structure-of-arrays batch of tracked objects.
+    
+    The tracker returns its live tracks as columns, so a frame costs a few
+    array copies instead of one ``TrackedObject`` per track. Indexing and
+    iteration yield ``TrackedObject`` for callers that work track by track.
+    """
+    
+    track_ids: np.ndarray  # (N,) int64
+    coords: np.ndarray  # (N, 4) float64 as x1, y1, x2, y2
+    conf: np.ndarray  # (N,) float64
+    label_ids: np.ndarray  # (N,) int8 LabelId values
+    velocity_mps: np.ndarray  # (N,) float64
+    distance_m: np.ndarray  # (N,) float64
+    
+    @classmethod
+    def empty(cls) -> TrackedObjectArray:
+        """Create a batch with no tracks."""
+        return cls(
+            track_ids=np.empty(0, dtype=np.int64),
+            coords=np.empty((0, 4), dtype=np.float64),
+            conf=np.empty(0, dtype=np.float64),
+            label_ids=np.empty(0, dtype=np.int8),
+            velocity_mps=np.empty(0, dtype=np.float64),
+            distance_m=np.empty(0, dtype=np.float64),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.track_ids)
+    
+    def __getitem__(self, i: int) -> TrackedObject:
+        x1, y1, x2, y2 = self.coords[i].tolist()
+        box = BoundingBox(
+            x1=x1, y1=y1, x2=x2, y2=y2,
+            confidence=float(self.conf[i]),
+            label=LABEL_NAMES[self.label_ids[i]],
+        )
+        return TrackedObject(
+            int(self.track_ids[i]), box, float(self.velocity_mps[i]), float(self.distance_m[i])
+        )
+    
+    def __iter__(self) -> Iterator[TrackedObject]:
+        return (self[i] for i in range(len(self)))
+    
+    def as_objects(self) -> list[TrackedObject]:
+        """Materialize the batch as a list of ``TrackedObject``."""
+        return list(self)
+
+
 @dataclass(slots=True)
 class PerceptionFrame:
     frame_id: int
     timestamp_s: float
-    rgb: Any
+    rgb: np.ndarray | None  # (H, W, 3) uint8 image, None when pixels are unavailable
     width: int
     height: int
-    detections: List[BoundingBox] = field(default_factory=list)
+    detections: list[BoundingBox] | BoundingBoxArray = field(default_factory=list)
     lane: LaneModel | None = None
 
 
-@dataclass(slots=True)
 class MotionPlan:
-    target_speed_mps: float
-    steering_angle_deg: float
-    reason: str
+    """Target speed and steering produced by the behavior planner.
+    
+    ``reason`` is always a plain ``str``. Planners on the hot path build plans
+    with ``deferred`` instead: the reason formatter and its payload are kept
+    in private slots and the text is formatted on first access, then cached,
+    so plans nobody inspects never pay for string formatting.
+    """
+    
+    __slots__ = (
+        "_reason",
+        "_reason_args",
+        "_reason_format",
+        "steering_angle_deg",
+        "target_speed_mps",
+    )
+    
+    def __init__(self, target_speed_mps: float, steering_angle_deg: float, reason: str):
+        self.target_speed_mps = target_speed_mps
+        self.steering_angle_deg = steering_angle_deg
+        self._reason: str | None = reason
+        self._reason_format: Callable[..., str] | None = None
+        self._reason_args: tuple[Any, ...] = ()
+    
+    @classmethod
+    def deferred(
+        cls,
+        target_speed_mps: float,
+        steering_angle_deg: float,
+        format_fn: Callable[..., str],
+        *args: Any,
+    ) -> MotionPlan:
+        """Create a plan whose reason is ``format_fn(*args)``, built on first access."""
+        plan = cls(target_speed_mps, steering_angle_deg, "")
+        plan._reason = None
+        plan._reason_format = format_fn
+        plan._reason_args = args
+        return plan
+    
+    @property
+    def reason(self) -> str:
+        """Human-readable decision rationale."""
+        if self._reason is None:
+            self._reason = self._reason_format(*self._reason_args)
+            self._reason_format = None
+            self._reason_args = ()
+        return self._reason
+    
+    @reason.setter
+    def reason(self, value: str) -> None:
+        self._reason = value
+        self._reason_format = None
+        self._reason_args = ()
+    
+    def with_motion(self, target_speed_mps: float, steering_angle_deg: float) -> MotionPlan:
+        """Copy with new speed and steering, keeping the reason unformatted if it still is."""
+        plan = MotionPlan(target_speed_mps, steering_angle_deg, "")
+        plan._reason = self._reason
+        plan._reason_format = self._reason_format
+        plan._reason_args = self._reason_args
+        return plan
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MotionPlan):
+            return NotImplemented
+        return (self.target_speed_mps, self.steering_angle_deg, self.reason) == (
+            other.target_speed_mps, other.steering_angle_deg, other.reason
+        )
+    
+    __hash__ = None  # Mutable, like the other models
+    
+    def __repr__(self) -> str:
+        return (
+            f"MotionPlan(target_speed_mps={self.target_speed_mps!r}, "
+            f"steering_angle_deg={self.steering_angle_deg!r}, reason={self.reason!r})"
+        )
 
 
 @dataclass(slots=True)
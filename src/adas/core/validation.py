@@ -6,10 +6,13 @@ This module provides validation functions for sensor data and system parameters.
 from __future__ import annotations
 
 import math
+import numbers
 from typing import Any
 
+import numpy as np
+
 from adas.core.exceptions import ValidationError
-from adas.core.models import BoundingBox, ControlCommand, LaneModel, MotionPlan
+from adas.core.models import BoundingBox, BoundingBoxArray, ControlCommand, LaneModel, MotionPlan
 
 
 def validate_bounding_box(box: BoundingBox) -> None:
@@ -34,6 +37,45 @@ def validate_bounding_box(box: BoundingBox) -> None:
         raise ValidationError(f"Confidence must be in [0, 1], got {box.confidence}")
 
 
+def invalid_box_mask(boxes: BoundingBoxArray) -> np.ndarray:
+    """Flag boxes that fail ``validate_bounding_box`` checks, vectorized.
+    
+    Conditions are written as negated "valid" tests so NaN coordinates or
+    confidences are flagged as well.
+    
+    Args:
+        boxes: Batch of bounding boxes
+        
+    Returns:
+        Boolean mask of shape (N,), True for invalid boxes
+    """
+    x1, y1, x2, y2 = boxes.coords.T
+    return ~(
+        (x1 >= 0) & (y1 >= 0) & (x2 > x1) & (y2 > y1)
+        & (boxes.conf >= 0.0) & (boxes.conf <= 1.0)
+    )
+
+
+def validate_bounding_box_array(boxes: BoundingBoxArray) -> None:
+    """Validate a batch of bounding boxes in one vectorized pass.
+    
+    Args:
+        boxes: Batch of bounding boxes to validate
+        
+    Raises:
+        ValidationError: If any box is invalid (reports the first one)
+    """
+    bad = invalid_box_mask(boxes)
+    if bad.any():
+        idx = int(np.argmax(bad))
+        box = boxes[idx]
+        try:
+            validate_bounding_box(box)
+        except ValidationError as e:
+            raise ValidationError(f"Box {idx}: {e}") from None
+        raise ValidationError(f"Box {idx}: non-finite values in {box}")
+
+
 def validate_lane_model(lane: LaneModel) -> None:
     """Validate lane model parameters.
     
@@ -121,14 +163,21 @@ def validate_config_value(name: str, value: Any, min_val: float | None = None,
     Raises:
         ValidationError: If value is invalid
     """
-    if not isinstance(value, (int, float)):
+    # Duck-typed numeric check: strings and other non-numbers raise TypeError,
+    # while complex values and arrays add fine but are not real scalars
+    try:
+        v = value + 0.0
+    except TypeError:
+        v = None
+    if not isinstance(v, numbers.Real):
         raise ValidationError(f"{name} must be numeric, got {type(value)}")
     
-    if not math.isfinite(value):
+    # x - x is 0.0 for every finite float and NaN for NaN or +/-inf
+    if v - v != 0.0:
         raise ValidationError(f"{name} must be finite, got {value}")
     
-    if min_val is not None and value < min_val:
+    if min_val is not None and v < min_val:
         raise ValidationError(f"{name} must be >= {min_val}, got {value}")
     
-    if max_val is not None and value > max_val:
+    if max_val is not None and v > max_val:
         raise ValidationError(f"{name} must be <= {max_val}, got {value}")
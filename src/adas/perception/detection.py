@@ -6,29 +6,44 @@ Production deployments should replace this with TensorRT/DeepStream-backed infer
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
-from adas.core.models import BoundingBox
+import numpy as np
+
+from adas.core.models import BoundingBoxArray, LabelId
 
 
 @dataclass(slots=True)
 class ObjectDetector:
     confidence_threshold: float = 0.35
 
-    def infer(self, frame: object, width: int, height: int) -> list[BoundingBox]:
+    def infer(self, frame: object, width: int, height: int) -> BoundingBoxArray:
         # Deterministic placeholder: one lead-vehicle-like box in the ego lane.
-        conf = 0.8
-        if conf < self.confidence_threshold:
-            return []
-
-        box_w, box_h = width * 0.12, height * 0.18
-        center_x, bottom_y = width / 2, height * 0.7
-        return [
-            BoundingBox(
-                x1=center_x - box_w / 2,
-                y1=bottom_y - box_h,
-                x2=center_x + box_w / 2,
-                y2=bottom_y,
-                confidence=conf,
-                label="vehicle",
-            )
-        ]
+        if _PLACEHOLDER_CONF < self.confidence_threshold:
+            return BoundingBoxArray.empty()
+        return _boxes_for_size(width, height)
+
+
+_PLACEHOLDER_CONF = 0.8
+
+
+@lru_cache(maxsize=4)
+def _boxes_for_size(width: int, height: int) -> BoundingBoxArray:
+    """Build the placeholder detections for an image size.
+    
+    The resolution rarely changes within a run, so the batch is built once
+    per size and shared; its columns are read-only to make sharing safe.
+    """
+    box_w, box_h = width * 0.12, height * 0.18
+    center_x, bottom_y = width / 2, height * 0.7
+    boxes = BoundingBoxArray(
+        coords=np.array(
+            [[center_x - box_w / 2, bottom_y - box_h, center_x + box_w / 2, bottom_y]],
+            dtype=np.float32,
+        ),
+        conf=np.array([_PLACEHOLDER_CONF], dtype=np.float32),
+        label_ids=np.array([LabelId.VEHICLE], dtype=np.int8),
+    )
+    for column in (boxes.coords, boxes.conf, boxes.label_ids):
+        column.flags.writeable = False
+    return boxes
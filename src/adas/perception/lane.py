@@ -5,17 +5,37 @@ Production deployments can replace this with learned lane segmentation + spline
 
 from __future__ import annotations
 
+import math
+from functools import lru_cache
+
 from adas.core.models import LaneModel
 
+LANE_WIDTH_M = 3.7  # Standard highway lane width used for pixel-to-meter scaling
+
 
 class LaneEstimator:
     def estimate(self, frame: object, width: int, height: int) -> LaneModel | None:
-        left_base = width * 0.36
-        right_base = width * 0.64
-        lane_center = (left_base + right_base) / 2.0
-        return LaneModel(
-            left_coeffs=(0.0, 0.0, left_base),
-            right_coeffs=(0.0, 0.0, right_base),
-            lane_center_px=lane_center,
-            curvature_m=220.0,
-        )
+        # Placeholder geometry depends only on the image size, so it is built
+        # once per resolution; LaneModel is frozen, so sharing it is safe.
+        return _lane_for_size(width, height)
+
+
+@lru_cache(maxsize=4)
+def _lane_for_size(width: int, height: int) -> LaneModel:
+    """Build the placeholder lane model for an image size."""
+    left_coeffs = (0.0, 0.0, width * 0.36)
+    right_coeffs = (0.0, 0.0, width * 0.64)
+    lane_center = (left_coeffs[2] + right_coeffs[2]) / 2.0
+    
+    # Ego position is the image center; lane width in pixels sets the scale
+    px_to_m = LANE_WIDTH_M / (right_coeffs[2] - left_coeffs[2])
+    # Lane boundaries are x = a*y^2 + b*y + c, so the mean linear term is the slope
+    slope = (left_coeffs[1] + right_coeffs[1]) / 2.0
+    return LaneModel(
+        left_coeffs=left_coeffs,
+        right_coeffs=right_coeffs,
+        lane_center_px=lane_center,
+        curvature_m=220.0,
+        lateral_offset_m=(width / 2.0 - lane_center) * px_to_m,
+        heading_error_rad=math.atan(slope),
+    )
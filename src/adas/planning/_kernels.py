@@ -0,0 +1,107 @@
+"""Numeric kernels for behavior planning.
+
+Kernels take plain floats and float64 arrays so they compile in Numba's
+nopython mode when Numba is installed and run as ordinary Python otherwise.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from adas.core.jit import njit
+
+# Longitudinal modes returned by plan_core
+SPEED_CRUISE = 0  # No objects
+SPEED_FOLLOW_CLOSE = 1  # Nearest object inside the minimum following distance
+SPEED_FOLLOW = 2  # Nearest object inside the desired time gap
+SPEED_CLEAR = 3  # Nearest object beyond the time gap
+SPEED_INVALID = 4  # Nearest distance is not finite
+
+# Lateral modes returned by plan_core
+STEER_LANE = 0  # Steering toward the lane center
+STEER_NO_LANE = 1  # No lane detected
+STEER_INVALID_LANE = 2  # Lane center outside the image
+
+# Explicit signature compiles at import (persisted by ``cache=True``), so the
+# first planning step does not pay JIT latency; mode codes come back as int64.
+_PLAN_SIGNATURE = (
+    "Tuple((float64, float64, int64, float64, float64, int64))"
+    "(float64[:], " + ", ".join(["float64"] * 7) + ")"
+)
+
+
+@njit(_PLAN_SIGNATURE, cache=True)
+def plan_core(
+    distances: np.ndarray,
+    cruise_speed: float,
+    min_follow: float,
+    time_gap: float,
+    inv_half_width: float,
+    lane_center_px: float,
+    steer_scale: float,
+    max_steer: float,
+) -> tuple[float, float, int, float, float, int]:
+    """Compute target speed and steering for one planning step.
+
+    Args:
+        distances: Distances to tracked objects in meters
+        cruise_speed: Cruise speed in m/s
+        min_follow: Minimum following distance in meters
+        time_gap: Desired time gap to the lead vehicle in seconds
+        inv_half_width: Reciprocal of half the image width (2 / width) in 1/pixels
+        lane_center_px: Lane center in pixels (NaN if no lane was detected)
+        steer_scale: Lane-centering gain times the maximum steering angle
+        max_steer: Maximum steering angle in degrees
+
+    Returns:
+        Tuple of (target_speed, nearest_distance, speed_mode,
+        steering_deg, lateral_error, steer_mode)
+    """
+    # Longitudinal: nearest object drives adaptive cruise control
+    target_speed = cruise_speed
+    nearest = math.inf
+    speed_mode = SPEED_CRUISE
+    if distances.shape[0] > 0:
+        has_nan = False
+        for i in range(distances.shape[0]):
+            d = distances[i]
+            if math.isnan(d):
+                has_nan = True
+            elif d < nearest:
+                nearest = d
+
+        desired_distance = cruise_speed * time_gap
+        if has_nan or not math.isfinite(nearest):
+            speed_mode = SPEED_INVALID
+        elif nearest < min_follow:
+            target_speed = cruise_speed * max(0.0, nearest / min_follow)
+            speed_mode = SPEED_FOLLOW_CLOSE
+        elif nearest < desired_distance:
+            target_speed = cruise_speed * (nearest / desired_distance)
+            speed_mode = SPEED_FOLLOW
+        else:
+            speed_mode = SPEED_CLEAR
+        target_speed = max(0.0, target_speed)
+
+    # Lateral: proportional steering toward the lane center
+    steering_deg = 0.0
+    lateral_error = 0.0
+    if math.isnan(lane_center_px):
+        steer_mode = STEER_NO_LANE
+    else:
+        # Normalized offset from the image center; outside [-1, 1] is off-frame
+        offset = lane_center_px * inv_half_width - 1.0
+        if not (-1.0 <= offset <= 1.0):
+            steer_mode = STEER_INVALID_LANE
+        else:
+            lateral_error = offset
+            steering_deg = steer_scale * lateral_error
+            if steering_deg > max_steer:
+                steering_deg = max_steer
+            elif steering_deg < -max_steer:
+                steering_deg = -max_steer
+            steer_mode = STEER_LANE
+
+    return target_speed, nearest, speed_mode, steering_deg, lateral_error, steer_mode
@@ -2,16 +2,34 @@
 
 from __future__ import annotations
 
+import logging
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+import numpy as np
 
 from adas.core.exceptions import PlanningError, ValidationError
 from adas.core.logger import setup_logger
-from adas.core.models import MotionPlan, TrackedObject
+from adas.core.models import MotionPlan, TrackedObject, TrackedObjectArray
 from adas.core.validation import validate_motion_plan
+from adas.planning._kernels import (
+    SPEED_CRUISE,
+    SPEED_FOLLOW,
+    SPEED_FOLLOW_CLOSE,
+    SPEED_INVALID,
+    STEER_INVALID_LANE,
+    STEER_NO_LANE,
+    plan_core,
+)
 
 logger = setup_logger(__name__)
 
+# Reason codes without a numeric payload
+REASON_CRUISE = "cruise"
+REASON_INVALID_DISTANCE = "invalid_distance"
+REASON_NO_LANE = "no_lane"
+REASON_INVALID_LANE = "invalid_lane"
+
 
 @dataclass(slots=True)
 class BehaviorPlanner:
@@ -26,6 +44,11 @@ class BehaviorPlanner:
     # Steering control gains
     lane_center_gain: float = 1.0  # Proportional gain for centering
     
+    # Steering constants derived once from the fields above
+    _steer_scale: float = field(init=False, repr=False, compare=False)
+    _frame_width_px: int = field(default=0, init=False, repr=False, compare=False)
+    _inv_half_width: float = field(default=0.0, init=False, repr=False, compare=False)
+    
     def __post_init__(self) -> None:
         """Validate planner configuration."""
         if self.cruise_speed_mps <= 0:
@@ -35,23 +58,29 @@ class BehaviorPlanner:
         if self.max_steering_deg <= 0:
             raise ValidationError(f"Max steering must be positive, got {self.max_steering_deg}")
         
+        self._steer_scale = self.lane_center_gain * self.max_steering_deg
+        
         logger.info(
-            f"BehaviorPlanner initialized: cruise={self.cruise_speed_mps:.1f} m/s, "
-            f"min_distance={self.min_follow_distance_m:.1f} m"
+            "BehaviorPlanner initialized: cruise=%.1f m/s, min_distance=%.1f m",
+            self.cruise_speed_mps,
+            self.min_follow_distance_m,
         )
 
     def plan(
         self,
         frame_width_px: int,
         lane_center_px: float | None,
-        objects: list[TrackedObject],
+        objects: list[TrackedObject] | TrackedObjectArray,
+        distances: np.ndarray | None = None,
     ) -> MotionPlan:
         """Generate motion plan based on lane and object information.
         
         Args:
             frame_width_px: Image width in pixels
             lane_center_px: Detected lane center position (None if unavailable)
-            objects: List of tracked objects
+            objects: Tracked objects (list or SoA batch)
+            distances: Float64 distances of ``objects`` in meters, e.g.
+                ``MultiObjectTracker.distances`` (gathered from objects if None)
             
         Returns:
             Motion plan with target speed and steering
@@ -63,29 +92,70 @@ class BehaviorPlanner:
             # Input validation
             if frame_width_px <= 0:
                 raise ValidationError(f"Invalid frame width: {frame_width_px}")
+            if frame_width_px != self._frame_width_px:
+                # Camera streams keep a fixed width, so this runs once per stream
+                self._frame_width_px = frame_width_px
+                self._inv_half_width = 2.0 / frame_width_px
             
-            # Longitudinal planning (speed control)
-            target_speed, speed_reason = self._plan_speed(objects)
-            
-            # Lateral planning (steering control)
-            steering_deg, steer_reason = self._plan_steering(frame_width_px, lane_center_px)
+            # Longitudinal (speed) and lateral (steering) planning in one kernel
+            if distances is None and isinstance(objects, TrackedObjectArray):
+                distances = objects.distance_m
+            elif distances is None:
+                distances = np.fromiter(
+                    (obj.distance_m for obj in objects), dtype=np.float64, count=len(objects)
+                )
+            (
+                target_speed, nearest_distance, speed_mode,
+                steering_deg, lateral_error, steer_mode,
+            ) = plan_core(
+                distances,
+                self.cruise_speed_mps,
+                self.min_follow_distance_m,
+                self.time_gap_s,
+                self._inv_half_width,
+                math.nan if lane_center_px is None else float(lane_center_px),
+                self._steer_scale,
+                self.max_steering_deg,
+            )
             
-            # Combine reasoning
-            reason = f"{speed_reason}|{steer_reason}"
+            if speed_mode == SPEED_INVALID:
+                logger.warning("Non-finite distance in objects, using cruise speed")
+            elif speed_mode == SPEED_FOLLOW_CLOSE:
+                logger.debug(
+                    "Following at %.1fm, reducing speed to %.1f m/s",
+                    nearest_distance,
+                    target_speed,
+                )
+            if steer_mode == STEER_INVALID_LANE:
+                logger.warning(
+                    "Lane center %s outside frame [0, %s], going straight",
+                    lane_center_px,
+                    frame_width_px,
+                )
             
-            # Create motion plan
-            plan = MotionPlan(
-                target_speed_mps=target_speed,
-                steering_angle_deg=steering_deg,
-                reason=reason
+            # Create motion plan; reason text is only formatted if a consumer reads it
+            plan = MotionPlan.deferred(
+                target_speed,
+                steering_deg,
+                _format_reason,
+                speed_mode,
+                nearest_distance,
+                steer_mode,
+                lateral_error,
             )
             
-            # Validate output
-            validate_motion_plan(plan)
+            # plan_core bounds speed to [0, cruise] and steering to +/- max, so
+            # output validation is a debug check that ``python -O`` strips
+            if __debug__:
+                validate_motion_plan(plan)
             
-            logger.debug(
-                f"Plan: speed={target_speed:.1f} m/s, steering={steering_deg:.1f}°, reason={reason}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Plan: speed=%.1f m/s, steering=%.1f°, reason=%s",
+                    target_speed,
+                    steering_deg,
+                    plan.reason,
+                )
             
             return plan
             
@@ -93,83 +163,38 @@ class BehaviorPlanner:
             raise PlanningError(f"Planning validation failed: {e}") from e
         except Exception as e:
             raise PlanningError(f"Planning failed: {e}") from e
+
+
+def _format_reason(
+    speed_mode: int, nearest_distance: float, steer_mode: int, lateral_error: float
+) -> str:
+    """Describe the decisions returned by the planning kernel.
     
-    def _plan_speed(self, objects: list[TrackedObject]) -> tuple[float, str]:
-        """Plan target speed based on detected objects.
-        
-        Args:
-            objects: List of tracked objects
-            
-        Returns:
-            Tuple of (target_speed_mps, reason_string)
-        """
-        target_speed = self.cruise_speed_mps
-        reason = "cruise"
-        
-        if not objects:
-            return target_speed, reason
-        
-        # Find nearest object ahead
-        nearest_distance = min((obj.distance_m for obj in objects), default=float("inf"))
-        
-        if not math.isfinite(nearest_distance):
-            logger.warning("Non-finite distance in objects, using cruise speed")
-            return target_speed, "invalid_distance"
-        
-        # Adaptive cruise control logic
-        if nearest_distance < self.min_follow_distance_m:
-            # Too close - reduce speed proportionally
-            ratio = max(0.0, nearest_distance / self.min_follow_distance_m)
-            target_speed = self.cruise_speed_mps * ratio
-            reason = f"follow_close_{nearest_distance:.1f}m"
-            logger.debug(f"Following at {nearest_distance:.1f}m, reducing speed to {target_speed:.1f} m/s")
-        elif nearest_distance < self.cruise_speed_mps * self.time_gap_s:
-            # Within time gap - moderate speed
-            desired_distance = self.cruise_speed_mps * self.time_gap_s
-            ratio = nearest_distance / desired_distance
-            target_speed = self.cruise_speed_mps * ratio
-            reason = f"follow_{nearest_distance:.1f}m"
-        else:
-            # Clear ahead - cruise
-            reason = f"cruise_clear_{nearest_distance:.1f}m"
-        
-        # Ensure non-negative speed
-        target_speed = max(0.0, target_speed)
-        
-        return target_speed, reason
+    Args:
+        speed_mode: Longitudinal mode code from ``plan_core``
+        nearest_distance: Distance to the nearest object in meters
+        steer_mode: Lateral mode code from ``plan_core``
+        lateral_error: Normalized lateral error in [-1, 1]
+        
+    Returns:
+        Reason string as ``"<speed reason>|<steering reason>"``
+    """
+    if speed_mode == SPEED_CRUISE:
+        speed_reason = REASON_CRUISE
+    elif speed_mode == SPEED_INVALID:
+        speed_reason = REASON_INVALID_DISTANCE
+    elif speed_mode == SPEED_FOLLOW_CLOSE:
+        speed_reason = f"follow_close_{nearest_distance:.1f}m"
+    elif speed_mode == SPEED_FOLLOW:
+        speed_reason = f"follow_{nearest_distance:.1f}m"
+    else:
+        speed_reason = f"cruise_clear_{nearest_distance:.1f}m"
     
-    def _plan_steering(self, frame_width_px: int, lane_center_px: float | None) -> tuple[float, str]:
-        """Plan steering angle based on lane detection.
-        
-        Args:
-            frame_width_px: Image width in pixels
-            lane_center_px: Detected lane center (None if unavailable)
-            
-        Returns:
-            Tuple of (steering_angle_deg, reason_string)
-        """
-        if lane_center_px is None:
-            # No lane detected - go straight
-            return 0.0, "no_lane"
-        
-        # Validate lane position
-        if not (0 <= lane_center_px <= frame_width_px):
-            logger.warning(
-                f"Lane center {lane_center_px} outside frame [0, {frame_width_px}], going straight"
-            )
-            return 0.0, "invalid_lane"
-        
-        # Calculate lateral error (normalized to [-1, 1])
-        img_center = frame_width_px / 2.0
-        lateral_error = (lane_center_px - img_center) / img_center
-        
-        # Proportional steering control
-        steering_normalized = self.lane_center_gain * lateral_error
-        
-        # Clamp to [-1, 1] and scale to degrees
-        steering_normalized = max(-1.0, min(1.0, steering_normalized))
-        steering_deg = steering_normalized * self.max_steering_deg
-        
-        reason = f"lane_center_err_{lateral_error:.2f}"
-        
-        return steering_deg, reason
+    if steer_mode == STEER_NO_LANE:
+        steer_reason = REASON_NO_LANE
+    elif steer_mode == STEER_INVALID_LANE:
+        steer_reason = REASON_INVALID_LANE
+    else:
+        steer_reason = f"lane_center_err_{lateral_error:.2f}"
+    
+    return f"{speed_reason}|{steer_reason}"
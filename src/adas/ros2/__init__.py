@@ -19,6 +19,7 @@ if ROS2_AVAILABLE:
     from adas.ros2.bridge import ADASBridgeNode  # noqa: F401
     from adas.ros2.converters import (  # noqa: F401
         bbox_to_detection_msg,
+        bboxes_to_detection_array,
         detection_msg_to_bbox,
         control_cmd_to_msg,
     )
@@ -26,6 +27,7 @@ if ROS2_AVAILABLE:
     __all__.extend([
         "ADASBridgeNode",
         "bbox_to_detection_msg",
+        "bboxes_to_detection_array",
         "detection_msg_to_bbox",
         "control_cmd_to_msg",
     ])
@@ -7,16 +7,19 @@ perception, planning, and control outputs.
 
 from __future__ import annotations
 
+import threading
 import time
 
 try:
     import rclpy
+    from rclpy.callback_groups import MutuallyExclusiveCallbackGroup
+    from rclpy.executors import MultiThreadedExecutor
     from rclpy.node import Node
-    from rclpy.qos import QoSProfile, ReliabilityPolicy, DurabilityPolicy
     from sensor_msgs.msg import Image
-    from std_msgs.msg import Float32, String
+    from std_msgs.msg import Float32, Header, String
     from vision_msgs.msg import Detection2DArray
     from diagnostic_msgs.msg import DiagnosticArray, DiagnosticStatus, KeyValue
+    from adas.ros2.topics import CONTROL_QOS, SENSOR_QOS
     ROS2_AVAILABLE = True
 except ImportError:
     ROS2_AVAILABLE = False
@@ -27,30 +30,40 @@ from adas.core.models import PerceptionFrame
 from adas.runtime import ADASPipeline
 from adas.ros2.topics import ADASTopics
 from adas.ros2.converters import (
-    bbox_to_detection_msg,
+    bboxes_to_detection_array,
     control_cmd_to_msg,
     ros_image_to_numpy,
 )
 
 logger = setup_logger(__name__)
 
+_EMA_ALPHA = 0.1  # Smoothing factor for the published processing time
+
 
 class ADASBridgeNode(Node):
     """ROS2 node that bridges ADAS pipeline with ROS2 topics.
     
     This node:
     - Subscribes to camera and vehicle data
-    - Runs ADAS pipeline on incoming frames
+    - Runs ADAS pipeline on incoming frames on a worker thread, so a slow
+      frame never blocks the executor; frames arriving while the worker is
+      busy replace the pending one (latest wins)
     - Publishes perception, planning, and control outputs
     - Publishes diagnostics and performance metrics
     """
     
-    def __init__(self, pipeline: ADASPipeline, node_name: str = "adas_bridge"):
+    def __init__(
+        self,
+        pipeline: ADASPipeline,
+        node_name: str = "adas_bridge",
+        diagnostics_period_s: float = 0.2,
+    ):
         """Initialize ADAS bridge node.
         
         Args:
             pipeline: ADAS pipeline instance
             node_name: ROS2 node name
+            diagnostics_period_s: Interval between diagnostics/performance messages
         """
         if not ROS2_AVAILABLE:
             raise ImportError("ROS2 not available. Install with: pip install rclpy")
@@ -59,34 +72,40 @@ class ADASBridgeNode(Node):
         
         self.pipeline = pipeline
         self.frame_count = 0
+        self.dropped_frames = 0
         self.current_speed_mps = 0.0
         
-        # Create QoS profiles
-        sensor_qos = QoSProfile(
-            reliability=ReliabilityPolicy.BEST_EFFORT,
-            durability=DurabilityPolicy.VOLATILE,
-            depth=10
-        )
-        
-        control_qos = QoSProfile(
-            reliability=ReliabilityPolicy.RELIABLE,
-            durability=DurabilityPolicy.VOLATILE,
-            depth=5
-        )
+        # Latest-wins handoff from the image callback to the pipeline worker
+        self._next_frame_id = 0
+        self._pending: tuple[PerceptionFrame, Header, int] | None = None
+        self._pending_lock = threading.Lock()
+        self._frame_ready = threading.Event()
+        self._stopping = False
+        self._worker = threading.Thread(target=self._run_pipeline, name="adas-bridge", daemon=True)
+        self._worker.start()
+        
+        # Separate callback groups let the multi-threaded executor run image,
+        # speed and diagnostics callbacks concurrently; each group stays serial
+        # so per-callback state needs no locking
+        self._image_cbg = MutuallyExclusiveCallbackGroup()
+        self._speed_cbg = MutuallyExclusiveCallbackGroup()
+        self._diagnostics_cbg = MutuallyExclusiveCallbackGroup()
         
         # Subscribers
         self.image_sub = self.create_subscription(
             Image,
             ADASTopics.CAMERA_IMAGE,
             self.image_callback,
-            sensor_qos
+            SENSOR_QOS,
+            callback_group=self._image_cbg,
         )
         
         self.speed_sub = self.create_subscription(
             Float32,
             ADASTopics.VEHICLE_SPEED,
             self.speed_callback,
-            sensor_qos
+            SENSOR_QOS,
+            callback_group=self._speed_cbg,
         )
         
         # Publishers - Perception
@@ -100,19 +119,19 @@ class ADASBridgeNode(Node):
         self.throttle_pub = self.create_publisher(
             Float32,
             ADASTopics.THROTTLE_CMD,
-            control_qos
+            CONTROL_QOS
         )
         
         self.brake_pub = self.create_publisher(
             Float32,
             ADASTopics.BRAKE_CMD,
-            control_qos
+            CONTROL_QOS
         )
         
         self.steering_pub = self.create_publisher(
             Float32,
             ADASTopics.STEERING_CMD,
-            control_qos
+            CONTROL_QOS
         )
         
         # Publishers - Diagnostics
@@ -134,9 +153,21 @@ class ADASBridgeNode(Node):
             10
         )
         
-        logger.info(f"ADAS Bridge Node '{node_name}' initialized")
-        logger.info(f"Subscribed to: {ADASTopics.CAMERA_IMAGE}, {ADASTopics.VEHICLE_SPEED}")
-        logger.info(f"Publishing to: {ADASTopics.THROTTLE_CMD}, {ADASTopics.BRAKE_CMD}, {ADASTopics.STEERING_CMD}")
+        # Diagnostics are published by a timer from the latest frame statistics
+        self._stats: tuple[int, float, int, bool, float, object] | None = None
+        self._elapsed_ema_ms = 0.0
+        self.diagnostics_timer = self.create_timer(
+            diagnostics_period_s, self._publish_diagnostics, callback_group=self._diagnostics_cbg
+        )
+        
+        logger.info("ADAS Bridge Node '%s' initialized", node_name)
+        logger.info("Subscribed to: %s, %s", ADASTopics.CAMERA_IMAGE, ADASTopics.VEHICLE_SPEED)
+        logger.info(
+            "Publishing to: %s, %s, %s",
+            ADASTopics.THROTTLE_CMD,
+            ADASTopics.BRAKE_CMD,
+            ADASTopics.STEERING_CMD,
+        )
     
     def speed_callback(self, msg: Float32) -> None:
         """Handle vehicle speed updates.
@@ -149,10 +180,13 @@ class ADASBridgeNode(Node):
     def image_callback(self, msg: Image) -> None:
         """Handle incoming camera images.
         
+        Only converts the image and hands the frame to the pipeline worker, so
+        the executor is never blocked by a slow pipeline step.
+        
         Args:
             msg: ROS2 Image message
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Convert ROS image to numpy
@@ -160,47 +194,94 @@ class ADASBridgeNode(Node):
             
             # Create perception frame
             frame = PerceptionFrame(
-                frame_id=self.frame_count,
+                frame_id=self._next_frame_id,
                 timestamp_s=msg.header.stamp.sec + msg.header.stamp.nanosec * 1e-9,
-                rgb={"width": msg.width, "height": msg.height, "data": np_image},
+                rgb=np_image,
                 width=msg.width,
                 height=msg.height,
             )
+            self._next_frame_id += 1
             
+        except Exception as e:
+            logger.exception("Error converting frame")
+            self._publish_error(str(e))
+            return
+        
+        with self._pending_lock:
+            if self._pending is not None:
+                self.dropped_frames += 1
+            self._pending = (frame, msg.header, start_ns)
+        self._frame_ready.set()
+    
+    def destroy_node(self) -> None:
+        """Stop the pipeline worker and destroy the node."""
+        self._stopping = True
+        self._frame_ready.set()
+        self._worker.join(1.0)
+        super().destroy_node()
+    
+    def _run_pipeline(self) -> None:
+        """Worker loop running the pipeline on the newest frame until stopped."""
+        while True:
+            self._frame_ready.wait()
+            self._frame_ready.clear()
+            if self._stopping:
+                break
+            
+            with self._pending_lock:
+                pending, self._pending = self._pending, None
+            if pending is not None:
+                self._process_frame(*pending)
+    
+    def _process_frame(self, frame: PerceptionFrame, header: Header, start_ns: int) -> None:
+        """Run the pipeline on one frame and publish its outputs.
+        
+        Detections are stamped with the image time. Diagnostics are not built
+        here; the frame only updates the statistics the diagnostics timer reads.
+        
+        Args:
+            frame: Perception frame built from the image message
+            header: Header of the image message
+            start_ns: perf_counter_ns timestamp when the image arrived
+        """
+        try:
             # Run ADAS pipeline
             plan, command = self.pipeline.step(frame, current_speed_mps=self.current_speed_mps)
             
             # Publish detections
             if frame.detections:
-                self._publish_detections(frame.detections, msg.header.frame_id)
+                self._publish_detections(frame.detections, header.frame_id, header.stamp)
             
             # Publish control commands
             self._publish_control(command)
             
-            # Publish diagnostics
-            elapsed_ms = (time.time() - start_time) * 1000.0
-            self._publish_diagnostics(elapsed_ms, frame, plan)
-            
+            # Update statistics for the diagnostics timer
+            elapsed_ms = (time.perf_counter_ns() - start_ns) * 1e-6
+            self._elapsed_ema_ms += _EMA_ALPHA * (elapsed_ms - self._elapsed_ema_ms)
             self.frame_count += 1
+            self._stats = (
+                self.frame_count,
+                elapsed_ms,
+                len(frame.detections),
+                frame.lane is not None,
+                plan.target_speed_mps,
+                plan.reason,
+            )
             
         except Exception as e:
-            logger.error(f"Error processing frame: {e}", exc_info=True)
+            logger.exception("Error processing frame")
             self._publish_error(str(e))
     
-    def _publish_detections(self, detections, frame_id: str) -> None:
+    def _publish_detections(self, detections, frame_id: str, stamp) -> None:
         """Publish detection results.
         
         Args:
-            detections: List of BoundingBox
+            detections: BoundingBoxArray or list of BoundingBox
             frame_id: Frame ID for header
+            stamp: Header stamp (builtin_interfaces/Time)
         """
-        detection_array = Detection2DArray()
-        detection_array.header.frame_id = frame_id
-        detection_array.header.stamp = self.get_clock().now().to_msg()
-        
-        for bbox in detections:
-            detection_msg = bbox_to_detection_msg(bbox, frame_id, self.frame_count)
-            detection_array.detections.append(detection_msg)
+        detection_array = bboxes_to_detection_array(detections, frame_id, self.frame_count)
+        detection_array.header.stamp = stamp
         
         self.detections_pub.publish(detection_array)
     
@@ -216,38 +297,46 @@ class ADASBridgeNode(Node):
         self.brake_pub.publish(brake_msg)
         self.steering_pub.publish(steering_msg)
     
-    def _publish_diagnostics(self, elapsed_ms: float, frame, plan) -> None:
-        """Publish diagnostics information.
+    def _publish_diagnostics(self) -> None:
+        """Publish diagnostics for the latest processed frame (timer callback).
         
-        Args:
-            elapsed_ms: Processing time in milliseconds
-            frame: PerceptionFrame
-            plan: MotionPlan
+        Messages are only built for publishers that have subscribers.
         """
-        # Diagnostics array
-        diag_array = DiagnosticArray()
-        diag_array.header.stamp = self.get_clock().now().to_msg()
-        
-        # Pipeline status
-        status = DiagnosticStatus()
-        status.name = "ADAS Pipeline"
-        status.level = DiagnosticStatus.OK
-        status.message = "Operating normally"
-        
-        status.values.append(KeyValue(key="frame_count", value=str(self.frame_count)))
-        status.values.append(KeyValue(key="processing_time_ms", value=f"{elapsed_ms:.2f}"))
-        status.values.append(KeyValue(key="detections", value=str(len(frame.detections))))
-        status.values.append(KeyValue(key="has_lane", value=str(frame.lane is not None)))
-        status.values.append(KeyValue(key="target_speed_mps", value=f"{plan.target_speed_mps:.2f}"))
-        status.values.append(KeyValue(key="plan_reason", value=plan.reason))
-        
-        diag_array.status.append(status)
-        self.diagnostics_pub.publish(diag_array)
-        
-        # Performance metrics
-        perf_msg = String()
-        perf_msg.data = f"frame={self.frame_count},time={elapsed_ms:.2f}ms,fps={1000.0/elapsed_ms:.1f}"
-        self.performance_pub.publish(perf_msg)
+        stats = self._stats  # Single read: the worker swaps the whole tuple
+        if stats is None:
+            return
+        frame_count, elapsed_ms, num_detections, has_lane, target_speed_mps, reason = stats
+        
+        if self.diagnostics_pub.get_subscription_count() > 0:
+            # Diagnostics array
+            diag_array = DiagnosticArray()
+            diag_array.header.stamp = self.get_clock().now().to_msg()
+            
+            # Pipeline status
+            status = DiagnosticStatus()
+            status.name = "ADAS Pipeline"
+            status.level = DiagnosticStatus.OK
+            status.message = "Operating normally"
+            
+            status.values = [
+                KeyValue(key="frame_count", value=str(frame_count)),
+                KeyValue(key="processing_time_ms", value=f"{elapsed_ms:.2f}"),
+                KeyValue(key="detections", value=str(num_detections)),
+                KeyValue(key="has_lane", value=str(has_lane)),
+                KeyValue(key="target_speed_mps", value=f"{target_speed_mps:.2f}"),
+                KeyValue(key="plan_reason", value=str(reason)),
+            ]
+            
+            diag_array.status.append(status)
+            self.diagnostics_pub.publish(diag_array)
+        
+        if self.performance_pub.get_subscription_count() > 0:
+            # Performance metrics (smoothed over recent frames)
+            ema_ms = self._elapsed_ema_ms
+            fps = 1000.0 / ema_ms if ema_ms > 1e-6 else 0.0
+            self.performance_pub.publish(
+                String(data=f"frame={frame_count},time={ema_ms:.2f}ms,fps={fps:.1f}")
+            )
     
     def _publish_error(self, error_msg: str) -> None:
         """Publish error diagnostics.
@@ -280,16 +369,23 @@ def main(args=None):
         from adas.cli import build_pipeline
         pipeline, _ = build_pipeline()
         
-        # Create and spin node
+        # Create and spin node; the multi-threaded executor keeps the speed
+        # subscription responsive while images are being handed off
         node = ADASBridgeNode(pipeline)
+        executor = MultiThreadedExecutor(num_threads=3)
+        executor.add_node(node)
         
         logger.info("ADAS Bridge Node started. Spinning...")
-        rclpy.spin(node)
+        try:
+            executor.spin()
+        finally:
+            executor.shutdown()
+            node.destroy_node()
         
     except KeyboardInterrupt:
         logger.info("Shutting down...")
-    except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+    except Exception:
+        logger.exception("Fatal error")
     finally:
         if rclpy.ok():
             rclpy.shutdown()
@@ -6,15 +6,27 @@ data structures and standard ROS2 message types.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from functools import lru_cache
+
 import numpy as np
 
-from adas.core.models import BoundingBox, ControlCommand, LaneModel
+from adas.core.logger import setup_logger
+from adas.core.models import (
+    LABEL_NAMES,
+    BoundingBox,
+    BoundingBoxArray,
+    ControlCommand,
+    LaneModel,
+)
+
+logger = setup_logger(__name__)
 
 # Type hints for ROS2 messages (avoid hard dependency)
 try:
-    from sensor_msgs.msg import Image
-    from std_msgs.msg import Header, Float32
     from geometry_msgs.msg import Point
+    from sensor_msgs.msg import Image
+    from std_msgs.msg import Float32, Header
     from vision_msgs.msg import Detection2D, Detection2DArray, ObjectHypothesisWithPose
     from visualization_msgs.msg import Marker, MarkerArray
     ROS2_MSGS_AVAILABLE = True
@@ -28,6 +40,10 @@ except ImportError:
     Marker = None
     MarkerArray = None
 
+_ENCODING_CHANNELS = {"rgb8": 3, "bgr8": 3, "mono8": 1}
+_LANE_Y_SAMPLES = tuple(float(y) for y in range(0, 100, 10))  # Marker rows along the lane
+_warned_list_data = False  # One-time warning for bindings without buffer support
+
 
 def bbox_to_detection_msg(bbox: BoundingBox, frame_id: str = "camera", seq: int = 0):
     """Convert BoundingBox to ROS2 Detection2D message.
@@ -72,6 +88,63 @@ def bbox_to_detection_msg(bbox: BoundingBox, frame_id: str = "camera", seq: int
     return detection
 
 
+def bboxes_to_detection_array(
+    bboxes: BoundingBoxArray | Iterable[BoundingBox], frame_id: str = "camera", seq: int = 0
+):
+    """Convert a batch of bounding boxes to a ROS2 Detection2DArray message.
+    
+    Centers, sizes, scores and labels are computed for the whole batch with
+    NumPy first, so the per-detection loop only fills message fields.
+    
+    Args:
+        bboxes: Bounding boxes (SoA batch or iterable of BoundingBox)
+        frame_id: Frame ID for the headers
+        seq: Sequence number
+        
+    Returns:
+        Detection2DArray message
+        
+    Raises:
+        ImportError: If ROS2 messages not available
+    """
+    if not ROS2_MSGS_AVAILABLE:
+        raise ImportError("ROS2 vision_msgs not available. Install with: pip install vision-msgs")
+    
+    if not isinstance(bboxes, BoundingBoxArray):
+        bboxes = BoundingBoxArray.from_boxes(bboxes)
+    
+    coords = bboxes.coords.astype(np.float64)
+    centers = ((coords[:, :2] + coords[:, 2:]) * 0.5).tolist()
+    sizes = (coords[:, 2:] - coords[:, :2]).tolist()
+    scores = bboxes.conf.tolist()
+    labels = [LABEL_NAMES[i] for i in bboxes.label_ids.tolist()]
+    
+    detection_array = Detection2DArray()
+    detection_array.header.frame_id = frame_id
+    
+    detections = detection_array.detections
+    for (center_x, center_y), (size_x, size_y), score, label in zip(
+        centers, sizes, scores, labels
+    ):
+        detection = Detection2D()
+        detection.header.frame_id = frame_id
+        detection.header.stamp.sec = seq
+        
+        bbox = detection.bbox
+        bbox.center.position.x = center_x
+        bbox.center.position.y = center_y
+        bbox.size_x = size_x
+        bbox.size_y = size_y
+        
+        hypothesis = ObjectHypothesisWithPose()
+        hypothesis.hypothesis.class_id = label
+        hypothesis.hypothesis.score = score
+        detection.results.append(hypothesis)
+        detections.append(detection)
+    
+    return detection_array
+
+
 def detection_msg_to_bbox(detection: Detection2D) -> BoundingBox:
     """Convert ROS2 Detection2D message to BoundingBox.
     
@@ -120,16 +193,11 @@ def control_cmd_to_msg(cmd: ControlCommand):
     if not ROS2_MSGS_AVAILABLE:
         raise ImportError("ROS2 std_msgs not available")
     
-    throttle_msg = Float32()
-    throttle_msg.data = float(cmd.throttle)
-    
-    brake_msg = Float32()
-    brake_msg.data = float(cmd.brake)
-    
-    steering_msg = Float32()
-    steering_msg.data = float(cmd.steering)
-    
-    return throttle_msg, brake_msg, steering_msg
+    return (
+        Float32(data=float(cmd.throttle)),
+        Float32(data=float(cmd.brake)),
+        Float32(data=float(cmd.steering)),
+    )
 
 
 def lane_to_marker_array(lane: LaneModel, frame_id: str = "camera") -> MarkerArray:
@@ -164,12 +232,8 @@ def lane_to_marker_array(lane: LaneModel, frame_id: str = "camera") -> MarkerArr
     marker.scale.x = 0.1  # Line width
     
     # Create points along lane (simplified - just center line)
-    for y in range(0, 100, 10):
-        point = Point()
-        point.x = lane.lane_center_px / 100.0  # Normalize
-        point.y = float(y)
-        point.z = 0.0
-        marker.points.append(point)
+    x = lane.lane_center_px * 0.01  # Normalize
+    marker.points = [Point(x=x, y=y, z=0.0) for y in _LANE_Y_SAMPLES]
     
     marker_array.markers.append(marker)
     return marker_array
@@ -194,6 +258,7 @@ def numpy_to_ros_image(np_image: np.ndarray, encoding: str = "rgb8") -> Image:
     image_msg.encoding = encoding
     image_msg.is_bigendian = 0
     image_msg.step = np_image.shape[1] * np_image.shape[2]
+    # The only unavoidable copy: messages own their byte payload
     image_msg.data = np_image.tobytes()
     
     return image_msg
@@ -202,20 +267,77 @@ def numpy_to_ros_image(np_image: np.ndarray, encoding: str = "rgb8") -> Image:
 def ros_image_to_numpy(image_msg: Image) -> np.ndarray:
     """Convert ROS2 Image message to NumPy array.
     
+    The result is a read-only view of the message buffer, so no pixel data is
+    copied when the binding exposes ``data`` through the buffer protocol.
+    Row padding (``step`` larger than ``width * channels``) is sliced off
+    without a copy as well.
+    
     Args:
         image_msg: ROS2 Image message
         
     Returns:
-        NumPy array (H, W, C)
+        NumPy array (H, W, C), or (H, W) for mono8
+        
+    Raises:
+        ValueError: If the encoding is unsupported or the buffer is too small
     """
-    dtype = np.uint8
-    np_image = np.frombuffer(image_msg.data, dtype=dtype)
+    global _warned_list_data
     
-    if image_msg.encoding == "rgb8" or image_msg.encoding == "bgr8":
-        np_image = np_image.reshape((image_msg.height, image_msg.width, 3))
-    elif image_msg.encoding == "mono8":
-        np_image = np_image.reshape((image_msg.height, image_msg.width))
-    else:
-        raise ValueError(f"Unsupported encoding: {image_msg.encoding}")
+    row_bytes, frame_bytes, row_shape, shape = _image_layout(
+        image_msg.encoding, image_msg.height, image_msg.width, image_msg.step
+    )
+    
+    try:
+        flat = np.frombuffer(memoryview(image_msg.data), dtype=np.uint8)
+    except TypeError:
+        # Some bindings hand out a list of ints, which has to be copied once
+        if not _warned_list_data:
+            logger.warning("Image data does not support the buffer protocol; copying frames")
+            _warned_list_data = True
+        flat = np.asarray(image_msg.data, dtype=np.uint8)
+    flat.flags.writeable = False
+    
+    if flat.size < frame_bytes:
+        raise ValueError(
+            f"Image buffer of {flat.size} bytes too small for {image_msg.height}x"
+            f"{image_msg.width} {image_msg.encoding} with step {row_shape[1]}"
+        )
+    
+    rows = flat[:frame_bytes].reshape(row_shape)
+    if row_shape[1] != row_bytes:
+        rows = rows[:, :row_bytes]
+    return rows.reshape(shape)
+
+
+@lru_cache(maxsize=8)
+def _image_layout(
+    encoding: str, height: int, width: int, step: int
+) -> tuple[int, int, tuple[int, int], tuple[int, ...]]:
+    """Compute the memory layout of an image message format.
+    
+    Camera streams keep one format, so the shape tuples are built once and
+    reused for every frame.
+    
+    Args:
+        encoding: Image encoding
+        height: Image height in pixels
+        width: Image width in pixels
+        step: Row length in bytes (0 means unpadded)
+        
+    Returns:
+        Tuple of (row bytes, frame bytes, padded row shape, image shape)
+        
+    Raises:
+        ValueError: If the encoding is unsupported or step is too short
+    """
+    channels = _ENCODING_CHANNELS.get(encoding)
+    if channels is None:
+        raise ValueError(f"Unsupported encoding: {encoding}")
+    
+    row_bytes = width * channels
+    step = step or row_bytes
+    if step < row_bytes:
+        raise ValueError(f"Image step {step} shorter than a {width}px {encoding} row")
     
-    return np_image
+    shape = (height, width) if channels == 1 else (height, width, channels)
+    return row_bytes, height * step, (height, step), shape
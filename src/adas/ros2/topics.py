@@ -8,6 +8,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+try:
+    from rclpy.qos import DurabilityPolicy, HistoryPolicy, QoSProfile, ReliabilityPolicy
+    ROS2_QOS_AVAILABLE = True
+except ImportError:
+    ROS2_QOS_AVAILABLE = False
+
 
 @dataclass(frozen=True)
 class ADASTopics:
@@ -70,6 +76,23 @@ class QoSProfiles:
     }
 
 
+def _build_qos(spec: dict) -> QoSProfile:
+    """Build an rclpy QoS profile from a ``QoSProfiles`` entry."""
+    return QoSProfile(
+        reliability=ReliabilityPolicy[spec["reliability"].upper()],
+        durability=DurabilityPolicy[spec["durability"].upper()],
+        history=HistoryPolicy[spec["history"].upper()],
+        depth=spec["depth"],
+    )
+
+
+# rclpy QoS objects built once and shared by every node
+if ROS2_QOS_AVAILABLE:
+    SENSOR_QOS = _build_qos(QoSProfiles.SENSOR_DATA)
+    CONTROL_QOS = _build_qos(QoSProfiles.CONTROL)
+    DIAGNOSTICS_QOS = _build_qos(QoSProfiles.DIAGNOSTICS)
+
+
 # Message type hints (for documentation)
 MESSAGE_TYPES = {
     ADASTopics.CAMERA_IMAGE: "sensor_msgs/Image",
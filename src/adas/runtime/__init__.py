@@ -5,10 +5,14 @@ execution functionality.
 """
 
 from adas.runtime.pipeline import ADASPipeline
+from adas.runtime.plan_ring import PlanRing
+from adas.runtime.planner_thread import PlannerThread
 from adas.runtime.runner import PipelineRunner, synthetic_frame
 
 __all__ = [
     "ADASPipeline",
     "PipelineRunner",
+    "PlanRing",
+    "PlannerThread",
     "synthetic_frame",
 ]
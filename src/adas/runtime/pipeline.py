@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
-from adas.control import PIDLikeLongitudinalController, SafetyMonitor
+from adas.control import PIDLikeLongitudinalController, SafetyMonitor, SafetyThread
 from adas.core.exceptions import ADASException
 from adas.core.logger import setup_logger
-from adas.core.models import ControlCommand, MotionPlan, PerceptionFrame
+from adas.core.models import BoundingBoxArray, ControlCommand, MotionPlan, PerceptionFrame
 from adas.perception.detection import ObjectDetector
 from adas.perception.lane import LaneEstimator
 from adas.planning import BehaviorPlanner
+from adas.runtime.planner_thread import PlannerThread
 from adas.tracking import MultiObjectTracker
 
 logger = setup_logger(__name__)
@@ -26,11 +29,33 @@ class ADASPipeline:
     planner: BehaviorPlanner
     controller: PIDLikeLongitudinalController
     safety_monitor: SafetyMonitor = field(default_factory=SafetyMonitor)
+    safety_thread: SafetyThread | None = None  # Asynchronous safety supervision
+    planner_thread: PlannerThread | None = None  # Asynchronous planning via PlanRing
+    max_stale_ticks: int = 30  # Fail safe once the threaded plan is older than this
+    max_failed_plans: int = 3  # Fail safe after this many planner errors without a new plan
+    # Run detector and lane estimator concurrently on a worker pool (created on
+    # first use); only pays off with stages that release the GIL
+    parallel_perception: bool = False
     
     # State tracking
     _current_speed_mps: float = field(default=0.0, init=False)
     _frame_count: int = field(default=0, init=False)
-
+    _plan_seq: int = field(default=-1, init=False)
+    _stale_ticks: int = field(default=0, init=False)
+    _last_command: ControlCommand | None = field(default=None, init=False)
+    _failures_at_plan: int = field(default=0, init=False)  # failed_plans at the last fresh plan
+    _fail_safe: bool = field(default=False, init=False)
+    _perception_pool: ThreadPoolExecutor | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Overlapped stepping: the perceived frame waiting for its decide() call
+    _overlap_pool: ThreadPoolExecutor | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _perceived_frame: PerceptionFrame | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     def step(self, frame: PerceptionFrame, current_speed_mps: float = 0.0) -> tuple[MotionPlan, ControlCommand]:
         """Execute one pipeline step.
         
@@ -44,58 +69,177 @@ class ADASPipeline:
         Raises:
             ADASException: If pipeline step fails
         """
-        try:
-            self._current_speed_mps = current_speed_mps
-            self._frame_count += 1
+        self.perceive(frame)
+        return self.decide(frame, current_speed_mps)
+    
+    def step_overlapped(
+        self, frame: PerceptionFrame, current_speed_mps: float = 0.0
+    ) -> tuple[MotionPlan, ControlCommand]:
+        """Perceive ``frame`` while deciding on the previously perceived frame.
+        
+        Perception of frame N runs on a worker thread while tracking,
+        planning and control handle frame N-1 on the calling thread, so the
+        two halves of the pipeline overlap. The frames act as a double
+        buffer: perception only writes the new frame and ``decide`` only
+        reads the old one, so no locking is needed.
+        
+        Outputs lag the input by one frame. The first call has nothing to
+        decide on yet and returns a hold plan (``reason="awaiting_perception"``).
+        
+        Args:
+            frame: Newest perception frame with sensor data
+            current_speed_mps: Current vehicle speed (from odometry/CAN)
             
-            logger.debug(f"Processing frame {frame.frame_id} (count={self._frame_count})")
+        Returns:
+            Tuple of (motion_plan, control_command) for the previous frame
             
-            # Perception stage
-            try:
+        Raises:
+            ADASException: If a downstream stage fails
+        """
+        if self._overlap_pool is None:
+            self._overlap_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="adas-overlap"
+            )
+        
+        perceiving = self._overlap_pool.submit(self.perceive, frame)
+        previous, self._perceived_frame = self._perceived_frame, frame
+        try:
+            if previous is not None:
+                return self.decide(previous, current_speed_mps)
+            plan = MotionPlan(
+                target_speed_mps=current_speed_mps,
+                steering_angle_deg=0.0,
+                reason="awaiting_perception",
+            )
+            command = self.controller.to_command(plan, current_speed_mps)
+            return plan, self.safety_monitor.sanitize_control_command(command)
+        finally:
+            perceiving.result()  # Frame N is ready for the next call
+    
+    def perceive(self, frame: PerceptionFrame) -> None:
+        """Run the perception stage, filling ``frame.detections`` and ``frame.lane``.
+        
+        Perception only reads the frame, so it may run on a worker thread for
+        frame N+1 while ``decide`` handles frame N. The detector and lane
+        estimator are independent and run concurrently when
+        ``parallel_perception`` is set. Failures fall back to empty perception
+        instead of raising.
+        
+        Args:
+            frame: Perception frame with sensor data
+        """
+        if self.parallel_perception and self._perception_pool is None:
+            self._perception_pool = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="adas-perception"
+            )
+        
+        try:
+            if not self.parallel_perception:
                 frame.detections = self.detector.infer(frame.rgb, frame.width, frame.height)
                 frame.lane = self.lane_estimator.estimate(frame.rgb, frame.width, frame.height)
-            except Exception as e:
-                logger.error(f"Perception failed: {e}")
-                # Continue with empty perception - fail gracefully
-                frame.detections = []
-                frame.lane = None
+            else:
+                lane_future = self._perception_pool.submit(
+                    self.lane_estimator.estimate, frame.rgb, frame.width, frame.height
+                )
+                detections_future = self._perception_pool.submit(
+                    self.detector.infer, frame.rgb, frame.width, frame.height
+                )
+                frame.detections = detections_future.result()
+                frame.lane = lane_future.result()
+        except Exception as e:
+            logger.error("Perception failed: %s", e)
+            # Continue with empty perception - fail gracefully
+            frame.detections = BoundingBoxArray.empty()
+            frame.lane = None
+    
+    def decide(
+        self, frame: PerceptionFrame, current_speed_mps: float = 0.0
+    ) -> tuple[MotionPlan, ControlCommand]:
+        """Run tracking, planning and control on an already perceived frame.
+        
+        Frames must be passed in order: tracking and the controller carry
+        state from one frame to the next.
+        
+        Args:
+            frame: Frame processed by ``perceive``
+            current_speed_mps: Current vehicle speed (from odometry/CAN)
+            
+        Returns:
+            Tuple of (motion_plan, control_command)
+            
+        Raises:
+            ADASException: If a downstream stage fails
+        """
+        try:
+            self._current_speed_mps = current_speed_mps
+            self._frame_count += 1
+            
+            logger.debug("Processing frame %s (count=%s)", frame.frame_id, self._frame_count)
             
             # Tracking stage
-            tracked = self.tracker.update(frame.detections)
+            tracked = self.tracker.update(frame.detections, frame.timestamp_s)
             
             # Planning stage
             lane_center = frame.lane.lane_center_px if frame.lane else None
-            plan = self.planner.plan(
-                frame_width_px=frame.width,
-                lane_center_px=lane_center,
-                objects=tracked,
-            )
+            if self.planner_thread is None:
+                plan = self.planner.plan(
+                    frame_width_px=frame.width,
+                    lane_center_px=lane_center,
+                    objects=tracked,
+                    distances=self.tracker.distances,
+                )
+            else:
+                self.planner_thread.submit(frame.width, lane_center, tracked)
+                plan = self._read_latest_plan(current_speed_mps)
+            
+            # Lead vehicle for following-distance checks
+            nearest = self.tracker.nearest_index
+            lead_vehicle = tracked[nearest] if nearest >= 0 else None
             
-            # Safety check on plan
-            try:
-                self.safety_monitor.check_motion_plan(plan, current_speed_mps)
-                
-                # Check following distance if tracking objects
-                if tracked:
-                    lead_vehicle = min(tracked, key=lambda obj: obj.distance_m)
+            # Safety check on plan (runs asynchronously when a safety thread supervises)
+            if self.safety_thread is None:
+                try:
+                    self.safety_monitor.check_motion_plan(plan, current_speed_mps)
                     self.safety_monitor.check_following_distance(lead_vehicle, current_speed_mps)
-            except Exception as e:
-                logger.warning(f"Safety check: {e}")
+                except Exception as e:
+                    logger.warning("Safety check: %s", e)
             
-            # Control stage
-            command = self.controller.to_command(plan, current_speed_mps)
+            # Control stage; a planner thread that died, keeps failing or stopped
+            # publishing is replaced by a fail-safe command
+            if self._planner_failed():
+                command = self._fail_safe_command()
+            else:
+                command = self.controller.to_command(plan, current_speed_mps)
             
             # Safety sanitization of command
             command = self.safety_monitor.sanitize_control_command(command)
             
-            # Final safety check
-            self.safety_monitor.check_control_command(command)
+            if self.safety_thread is None:
+                # Final safety check
+                self.safety_monitor.check_control_command(command)
+            else:
+                # Publish optimistically; a latched veto overrides with a fail-safe command
+                self.safety_thread.submit(
+                    plan, command, current_speed_mps, lead_vehicle, frame.timestamp_s
+                )
+                if self.safety_thread.vetoed:
+                    command = self.safety_thread.fail_safe_command(command)
             
-            logger.info(
-                f"Frame {frame.frame_id}: detections={len(frame.detections)}, "
-                f"tracks={len(tracked)}, lane={'✓' if frame.lane else '✗'}, "
-                f"plan={plan.reason}, cmd=t{command.throttle:.2f}/b{command.brake:.2f}/s{command.steering:.2f}"
-            )
+            self._last_command = command
+            
+            # Per-frame summary; skip gathering its arguments when INFO is filtered
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Frame %s: detections=%d, tracks=%d, lane=%s, plan=%s, cmd=t%.2f/b%.2f/s%.2f",
+                    frame.frame_id,
+                    len(frame.detections),
+                    len(tracked),
+                    "✓" if frame.lane else "✗",
+                    plan.reason,
+                    command.throttle,
+                    command.brake,
+                    command.steering,
+                )
             
             return plan, command
             
@@ -103,12 +247,93 @@ class ADASPipeline:
             # Re-raise ADAS exceptions
             raise
         except Exception as e:
-            logger.error(f"Pipeline step failed: {e}", exc_info=True)
+            logger.error("Pipeline step failed: %s", e, exc_info=True)
             raise ADASException(f"Pipeline execution failed: {e}") from e
     
+    def _read_latest_plan(self, current_speed_mps: float) -> MotionPlan:
+        """Take the freshest plan published by the planner thread.
+        
+        Args:
+            current_speed_mps: Current vehicle speed, held until a plan arrives
+            
+        Returns:
+            Latest motion plan
+        """
+        latest = self.planner_thread.ring.read_latest()
+        if latest is None:
+            return MotionPlan(
+                target_speed_mps=current_speed_mps,
+                steering_angle_deg=0.0,
+                reason="awaiting_plan",
+            )
+        
+        seq, plan = latest
+        if seq == self._plan_seq:
+            self._stale_ticks += 1
+        else:
+            self._plan_seq = seq
+            self._stale_ticks = 0
+            self._failures_at_plan = self.planner_thread.failed_plans
+        return plan
+    
+    def _planner_failed(self) -> bool:
+        """Whether the planner thread can no longer be trusted to drive control.
+        
+        True once the latest plan is older than ``max_stale_ticks``, the
+        thread is not running, or ``max_failed_plans`` planner calls failed
+        since the last fresh plan. The transition is logged once.
+        """
+        planner_thread = self.planner_thread
+        if planner_thread is None:
+            return False
+        
+        failures = planner_thread.failed_plans - self._failures_at_plan
+        failed = (
+            self._stale_ticks > self.max_stale_ticks
+            or not planner_thread.is_running
+            or failures >= self.max_failed_plans
+        )
+        if failed and not self._fail_safe:
+            logger.error(
+                "Planner unavailable (running=%s, stale=%s ticks, failures=%s), failing safe",
+                planner_thread.is_running, self._stale_ticks, failures,
+            )
+        elif not failed and self._fail_safe:
+            logger.info("Planner recovered, resuming control")
+        self._fail_safe = failed
+        return failed
+    
+    def _fail_safe_command(self) -> ControlCommand:
+        """Release throttle and brake fully, holding the last steering command."""
+        steering = self._last_command.steering if self._last_command is not None else 0.0
+        return ControlCommand(throttle=0.0, brake=1.0, steering=steering)
+    
     def reset(self) -> None:
         """Reset pipeline state."""
         logger.info("Pipeline reset")
         self.tracker.reset()
+        if self.safety_thread is not None:
+            self.safety_thread.clear_veto()
         self._current_speed_mps = 0.0
         self._frame_count = 0
+        self._plan_seq = -1
+        self._stale_ticks = 0
+        self._last_command = None
+        self._failures_at_plan = (
+            self.planner_thread.failed_plans if self.planner_thread is not None else 0
+        )
+        self._fail_safe = False
+        self._perceived_frame = None
+    
+    def close(self) -> None:
+        """Release background resources owned by the pipeline."""
+        if self.planner_thread is not None:
+            self.planner_thread.stop()
+        if self.safety_thread is not None:
+            self.safety_thread.stop()
+        if self._perception_pool is not None:
+            self._perception_pool.shutdown(wait=True)
+            self._perception_pool = None
+        if self._overlap_pool is not None:
+            self._overlap_pool.shutdown(wait=True)
+            self._overlap_pool = None
@@ -0,0 +1,101 @@
+"""Single-producer/single-consumer handoff of motion plans between threads.
+
+The planner thread publishes plans into a small fixed ring and the control loop
+reads only the newest one, so a slow planner never blocks the control rate and
+stale intermediate plans are dropped instead of queued.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from adas.core.exceptions import ValidationError
+from adas.core.models import MotionPlan
+
+_PLAN_DTYPE = np.dtype([
+    ("seq", np.uint64),
+    ("target_speed_mps", np.float64),
+    ("steering_angle_deg", np.float64),
+])
+_WRITING = np.iinfo(np.uint64).max  # Slot sequence marker while a write is in progress
+
+
+class PlanRing:
+    """Lock-free SPSC ring buffer holding the most recent motion plans.
+
+    Exactly one thread may call ``try_publish`` and one thread may call
+    ``read_latest``. The writer marks a slot busy, fills it, stamps its
+    sequence number and only then advances ``head``; the reader re-checks the
+    stamp after copying and retries if the writer lapped the ring mid-read (a
+    seqlock). Under the GIL, integer attribute stores are atomic, so no lock
+    or shared-memory counter is needed.
+    """
+
+    __slots__ = ("_head", "_plans", "_slots", "capacity")
+
+    def __init__(self, capacity: int = 8):
+        """Initialize plan ring.
+
+        Args:
+            capacity: Number of slots; the writer may run this far ahead of a read
+
+        Raises:
+            ValidationError: If capacity is less than 2
+        """
+        if capacity < 2:
+            raise ValidationError(f"Plan ring capacity must be at least 2, got {capacity}")
+
+        self.capacity = capacity
+        self._slots = np.zeros(capacity, dtype=_PLAN_DTYPE)
+        self._plans: list[MotionPlan | None] = [None] * capacity  # Carries the reason
+        self._head = 0  # Sequence number of the next plan to publish
+
+    @property
+    def published(self) -> int:
+        """Total number of plans published."""
+        return self._head
+
+    def try_publish(self, plan: MotionPlan) -> bool:
+        """Publish a plan, overwriting the oldest slot.
+
+        The ring never blocks the producer: unread older plans are superseded
+        by newer ones, which is the desired drop policy for control handoff.
+
+        Args:
+            plan: Motion plan to publish
+
+        Returns:
+            True once the plan is visible to the reader
+        """
+        seq = self._head
+        slot = self._slots[seq % self.capacity]
+        slot["seq"] = _WRITING
+        slot["target_speed_mps"] = plan.target_speed_mps
+        slot["steering_angle_deg"] = plan.steering_angle_deg
+        self._plans[seq % self.capacity] = plan
+        slot["seq"] = seq
+        self._head = seq + 1  # Publish after the slot is fully written
+        return True
+
+    def read_latest(self) -> tuple[int, MotionPlan] | None:
+        """Read the newest published plan.
+
+        Returns:
+            Tuple of (sequence number, plan), or None if nothing was published
+        """
+        while True:
+            head = self._head
+            if head == 0:
+                return None
+
+            seq = head - 1
+            idx = seq % self.capacity
+            record = self._slots[idx].copy()
+            stored = self._plans[idx]
+
+            # Slot unchanged while copying: the snapshot is consistent
+            if int(self._slots[idx]["seq"]) == seq == int(record["seq"]):
+                return seq, stored.with_motion(
+                    float(record["target_speed_mps"]),
+                    float(record["steering_angle_deg"]),
+                )
@@ -0,0 +1,114 @@
+"""Behavior planning on a dedicated thread feeding a ``PlanRing``."""
+
+from __future__ import annotations
+
+import threading
+
+from adas.core.logger import setup_logger
+from adas.core.models import TrackedObject, TrackedObjectArray
+from adas.planning import BehaviorPlanner
+from adas.runtime.plan_ring import PlanRing
+
+logger = setup_logger(__name__)
+
+
+class PlannerThread:
+    """Run ``BehaviorPlanner.plan`` off the control loop.
+
+    Planning inputs are handed over through a single latest-wins mailbox: if
+    the planner is still busy when newer inputs arrive, the pending ones are
+    discarded. Finished plans are published to ``ring`` for the control loop.
+    """
+
+    def __init__(self, planner: BehaviorPlanner, ring: PlanRing | None = None):
+        """Initialize planner thread.
+
+        Args:
+            planner: Behavior planner producing motion plans
+            ring: Ring receiving published plans (creates one if None)
+        """
+        self.planner = planner
+        self.ring = ring or PlanRing()
+        self.dropped_inputs = 0
+        self.failed_plans = 0  # Planner calls that raised; no plan was published for them
+        self.last_error: str | None = None
+
+        self._pending: (
+            tuple[int, float | None, list[TrackedObject] | TrackedObjectArray] | None
+        ) = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """True while the worker thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        if self.is_running:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="adas-planner", daemon=True)
+        self._thread.start()
+        logger.info("Planner thread started")
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop the worker thread, discarding inputs not yet planned.
+
+        Args:
+            timeout: Maximum time to wait for the worker in seconds
+        """
+        if self._thread is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            # Keep the handle so ``is_running`` stays truthful and ``start``
+            # does not spawn a second worker next to the stuck one
+            logger.warning("Planner thread did not stop within %.1fs", timeout)
+            return
+        self._thread = None
+        logger.info("Planner thread stopped")
+
+    def submit(
+        self,
+        frame_width_px: int,
+        lane_center_px: float | None,
+        objects: list[TrackedObject] | TrackedObjectArray,
+    ) -> None:
+        """Hand the latest planning inputs to the worker without blocking.
+
+        Args:
+            frame_width_px: Image width in pixels
+            lane_center_px: Detected lane center position (None if unavailable)
+            objects: Tracked objects (list or SoA batch)
+        """
+        with self._lock:
+            if self._pending is not None:
+                self.dropped_inputs += 1
+            self._pending = (frame_width_px, lane_center_px, objects)
+        self._wakeup.set()
+
+    def _run(self) -> None:
+        """Worker loop planning the newest inputs until stopped."""
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._stopping:
+                break
+
+            with self._lock:
+                inputs, self._pending = self._pending, None
+            if inputs is None:
+                continue
+
+            try:
+                self.ring.try_publish(self.planner.plan(*inputs))
+            except Exception as e:  # noqa: BLE001 - keep planning; decide() fails safe
+                self.failed_plans += 1
+                self.last_error = str(e)
+                logger.error("Planner thread failed (%d failures): %s", self.failed_plans, e)
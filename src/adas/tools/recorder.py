@@ -8,29 +8,65 @@ from __future__ import annotations
 
 import json
 import pickle
+import threading
 import time
-from dataclasses import dataclass, asdict
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO
+
+import numpy as np
 
 from adas.core.logger import setup_logger
-from adas.core.models import ControlCommand, MotionPlan, PerceptionFrame
+from adas.core.models import (
+    LABEL_NAMES,
+    BoundingBox,
+    BoundingBoxArray,
+    ControlCommand,
+    MotionPlan,
+    PerceptionFrame,
+)
+
+try:
+    from orjson import OPT_INDENT_2, OPT_SERIALIZE_NUMPY
+    from orjson import dumps as _orjson_dumps
+    _json_dumps = partial(_orjson_dumps, option=OPT_SERIALIZE_NUMPY)
+    _json_dumps_indented = partial(_orjson_dumps, option=OPT_SERIALIZE_NUMPY | OPT_INDENT_2)
+except ImportError:
+    def _json_dumps(obj: object) -> bytes:
+        """Compact stdlib fallback for ``orjson.dumps``."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def _json_dumps_indented(obj: object) -> bytes:
+        """Indented stdlib fallback for ``orjson.dumps``."""
+        return json.dumps(obj, indent=2).encode()
 
 logger = setup_logger(__name__)
 
+# Frame data file per recording format; records are appended one at a time
+FRAME_FILES = {"json": "frames.jsonl", "pickle": "frames.pkl"}
+# Raw image bytes, referenced from records by offset so replay can memory-map them
+IMAGE_FILE = "frames.bin"
+# Column order of each recorded detection row
+DETECTION_FIELDS = ("x1", "y1", "x2", "y2", "confidence", "label")
+
 
 @dataclass
 class RecordingConfig:
     """Configuration for data recording."""
     
     output_dir: str = "recordings"
-    recording_name: Optional[str] = None
+    recording_name: str | None = None
     record_images: bool = False  # Images can be large
     record_detections: bool = True
     record_plans: bool = True
     record_commands: bool = True
     compression: bool = True
-    format: str = "json"  # json or pickle
+    format: str = "json"  # json (one record per line) or pickle (one record per dump)
+    flush_every: int = 30  # Frames between flushes of the frame data file
+    buffer_frames: int = 256  # Records queued for the writer thread before frames are dropped
     
     def __post_init__(self):
         """Generate recording name if not provided."""
@@ -39,6 +75,262 @@ class RecordingConfig:
             self.recording_name = f"adas_recording_{timestamp}"
 
 
+class _FrameWriter:
+    """Background thread serializing frame records to the frame data file.
+    
+    The recording thread only appends records to a bounded deque (atomic
+    under the GIL, so no lock) and never waits on serialization or disk I/O.
+    The writer drains everything queued per wakeup and writes it in one
+    call. When the queue is full, new records are dropped and counted.
+    
+    A record's ``"image"`` array is appended raw to the image file and
+    replaced by an ``"image_ref"`` holding its offset, length, shape and
+    dtype.
+    """
+    
+    def __init__(
+        self,
+        fp: BinaryIO,
+        serialize: Callable[[dict], bytes],
+        capacity: int,
+        flush_every: int,
+        image_fp: BinaryIO | None = None,
+    ):
+        """Start the writer thread.
+        
+        Args:
+            fp: Frame data file, owned and closed by the writer
+            serialize: Encodes one record, including any framing
+            capacity: Maximum number of queued records
+            flush_every: Records written between file flushes
+            image_fp: Raw image file, owned and closed by the writer (None
+                to discard images)
+        """
+        self.capacity = capacity
+        self.flush_every = flush_every
+        self.dropped_frames = 0
+        
+        self._fp = fp
+        self._image_fp = image_fp
+        self._image_offset = 0
+        self._serialize = serialize
+        self._queue: deque[dict] = deque()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="adas-recorder", daemon=True)
+        self._thread.start()
+    
+    def submit(self, record: dict) -> bool:
+        """Queue a record without blocking.
+        
+        Returns:
+            False if the queue was full and the record was dropped
+        """
+        if len(self._queue) >= self.capacity:
+            self.dropped_frames += 1
+            return False
+        self._queue.append(record)
+        self._wakeup.set()
+        return True
+    
+    def close(self) -> None:
+        """Write all queued records, close the file and stop the thread."""
+        self._stopping = True
+        self._wakeup.set()
+        self._thread.join()
+    
+    def _run(self) -> None:
+        """Worker loop draining queued records until closed."""
+        unflushed = 0
+        try:
+            while True:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                
+                batch = []
+                while self._queue:
+                    record = self._queue.popleft()
+                    image = record.pop("image", None)
+                    if image is not None and self._image_fp is not None:
+                        record["image_ref"] = self._write_image(image)
+                    batch.append(self._serialize(record))
+                if batch:
+                    self._fp.write(b"".join(batch))
+                    unflushed += len(batch)
+                    if unflushed >= self.flush_every:
+                        self._fp.flush()
+                        if self._image_fp is not None:
+                            self._image_fp.flush()
+                        unflushed = 0
+                
+                if self._stopping and not self._queue:
+                    break
+        except Exception as e:  # noqa: BLE001 - report instead of dying silently
+            logger.error("Recorder writer failed: %s", e)
+        finally:
+            self._fp.close()
+            if self._image_fp is not None:
+                self._image_fp.close()
+    
+    def _write_image(self, image: np.ndarray) -> dict:
+        """Append an image's bytes to the image file and describe where they are."""
+        data = np.ascontiguousarray(image)
+        self._image_fp.write(data.data)
+        ref = {
+            "offset": self._image_offset,
+            "length": data.nbytes,
+            "shape": list(data.shape),
+            "dtype": data.dtype.str,
+        }
+        self._image_offset += data.nbytes
+        return ref
+
+
+def _detection_rows(detections: list[BoundingBox] | BoundingBoxArray) -> list[list]:
+    """Encode detections as positional rows in ``DETECTION_FIELDS`` order.
+    
+    Rows avoid building a keyed dict per detection; batches are converted
+    column-wise with ``tolist`` instead of box by box.
+    """
+    if isinstance(detections, BoundingBoxArray):
+        rows = np.column_stack((detections.coords, detections.conf)).tolist()
+        for row, label_id in zip(rows, detections.label_ids.tolist()):
+            row.append(LABEL_NAMES[label_id])
+        return rows
+    return [[d.x1, d.y1, d.x2, d.y2, d.confidence, d.label] for d in detections]
+
+
+# Builds a frame record from (frame, plan, command, timing_info)
+_FrameEncoder = Callable[
+    [PerceptionFrame, MotionPlan | None, ControlCommand | None, dict | None], dict
+]
+
+
+# Record sections, each adding its key when the frame has that data; which
+# ones run is decided once per recording by ``_make_encoder``
+def _encode_image(
+    record: dict,
+    frame: PerceptionFrame,
+    plan: MotionPlan | None,
+    command: ControlCommand | None,
+) -> None:
+    # The writer thread stores the pixels in frames.bin. Read-only images
+    # cannot change before then, so only writable ones are copied.
+    rgb = frame.rgb
+    if rgb is not None:
+        record["image"] = rgb if not rgb.flags.writeable else rgb.copy()
+
+
+def _encode_detections(
+    record: dict,
+    frame: PerceptionFrame,
+    plan: MotionPlan | None,
+    command: ControlCommand | None,
+) -> None:
+    if frame.detections:
+        record["detections"] = _detection_rows(frame.detections)
+
+
+def _encode_lane(
+    record: dict,
+    frame: PerceptionFrame,
+    plan: MotionPlan | None,
+    command: ControlCommand | None,
+) -> None:
+    lane = frame.lane
+    if lane:
+        record["lane"] = {
+            "lane_center_px": lane.lane_center_px,
+            "left_coeffs": list(lane.left_coeffs),
+            "right_coeffs": list(lane.right_coeffs),
+            "curvature_m": lane.curvature_m,
+            "lateral_offset_m": lane.lateral_offset_m,
+            "heading_error_rad": lane.heading_error_rad,
+        }
+
+
+def _encode_plan(
+    record: dict,
+    frame: PerceptionFrame,
+    plan: MotionPlan | None,
+    command: ControlCommand | None,
+) -> None:
+    if plan:
+        record["plan"] = {
+            "target_speed_mps": plan.target_speed_mps,
+            "steering_angle_deg": plan.steering_angle_deg,
+            "reason": plan.reason,
+        }
+
+
+def _encode_command(
+    record: dict,
+    frame: PerceptionFrame,
+    plan: MotionPlan | None,
+    command: ControlCommand | None,
+) -> None:
+    if command:
+        record["command"] = {
+            "throttle": command.throttle,
+            "brake": command.brake,
+            "steering": command.steering,
+        }
+
+
+def _make_encoder(config: RecordingConfig) -> _FrameEncoder:
+    """Build the frame record encoder for a recording configuration.
+    
+    The ``record_*`` flags are resolved here, once, into a fixed tuple of
+    section encoders, so encoding a frame does not re-check the config.
+    
+    Args:
+        config: Recording configuration
+        
+    Returns:
+        Function mapping (frame, plan, command, timing_info) to a frame record
+    """
+    flagged = (
+        (config.record_images, _encode_image),
+        (config.record_detections, _encode_detections),
+        (True, _encode_lane),  # Lanes are always recorded
+        (config.record_plans, _encode_plan),
+        (config.record_commands, _encode_command),
+    )
+    sections = tuple(section for enabled, section in flagged if enabled)
+    
+    def encode(
+        frame: PerceptionFrame,
+        plan: MotionPlan | None,
+        command: ControlCommand | None,
+        timing_info: dict | None,
+    ) -> dict:
+        record = {
+            "frame_id": frame.frame_id,
+            "timestamp": frame.timestamp_s,
+            "width": frame.width,
+            "height": frame.height,
+        }
+        for section in sections:
+            section(record, frame, plan, command)
+        if timing_info:
+            record["timing"] = timing_info
+        return record
+    
+    return encode
+
+
+def _json_line(record: dict) -> bytes:
+    """Encode a record as one line of JSON."""
+    return _json_dumps(record) + b"\n"
+
+
+# Record encoders per recording format
+_SERIALIZERS: dict[str, Callable[[dict], bytes]] = {
+    "json": _json_line,
+    "pickle": partial(pickle.dumps, protocol=5),
+}
+
+
 class DataRecorder:
     """Records ADAS pipeline data for debugging and analysis.
     
@@ -51,7 +343,7 @@ class DataRecorder:
     - Metadata
     """
     
-    def __init__(self, config: Optional[RecordingConfig] = None):
+    def __init__(self, config: RecordingConfig | None = None):
         """Initialize data recorder.
         
         Args:
@@ -61,39 +353,64 @@ class DataRecorder:
         self.recording_dir = Path(self.config.output_dir) / self.config.recording_name
         self.recording_dir.mkdir(parents=True, exist_ok=True)
         
-        self.frame_data = []
+        self._frame_count = 0
+        self._writer: _FrameWriter | None = None  # Active while recording
+        self._encode = _make_encoder(self.config)
         self.metadata = {
             "recording_name": self.config.recording_name,
+            "detection_fields": list(DETECTION_FIELDS),
             "start_time": time.time(),
             "config": asdict(self.config),
         }
         
         self.is_recording = False
-        logger.info(f"DataRecorder initialized: {self.recording_dir}")
+        logger.info("DataRecorder initialized: %s", self.recording_dir)
     
     def start_recording(self) -> None:
-        """Start recording data."""
+        """Start recording data, opening the frame data file for streaming."""
+        self._encode = _make_encoder(self.config)  # Picks up config changes
+        frame_file = FRAME_FILES.get(self.config.format)
+        if frame_file is not None and self._writer is None:
+            image_fp = None
+            if self.config.record_images:
+                image_fp = open(self.recording_dir / IMAGE_FILE, "wb")  # noqa: SIM115
+            self._writer = _FrameWriter(
+                open(self.recording_dir / frame_file, "wb"),  # noqa: SIM115 (writer closes it)
+                _SERIALIZERS[self.config.format],
+                capacity=self.config.buffer_frames,
+                flush_every=self.config.flush_every,
+                image_fp=image_fp,
+            )
         self.is_recording = True
         self.metadata["start_time"] = time.time()
         logger.info("Recording started")
     
     def stop_recording(self) -> None:
-        """Stop recording and save data."""
+        """Stop recording, drain queued frames to disk and save metadata."""
         self.is_recording = False
+        if self._writer is not None:
+            self._writer.close()
+            self._frame_count -= self._writer.dropped_frames
+            self.metadata["dropped_frames"] = self._writer.dropped_frames
+            self._writer = None
         self.metadata["end_time"] = time.time()
-        self.metadata["total_frames"] = len(self.frame_data)
+        self.metadata["total_frames"] = self._frame_count
         self._save_recording()
-        logger.info(f"Recording stopped. Saved {len(self.frame_data)} frames")
+        logger.info("Recording stopped. Saved %s frames", self._frame_count)
     
     def record_frame(
         self,
         frame: PerceptionFrame,
-        plan: Optional[MotionPlan] = None,
-        command: Optional[ControlCommand] = None,
-        timing_info: Optional[dict] = None,
+        plan: MotionPlan | None = None,
+        command: ControlCommand | None = None,
+        timing_info: dict | None = None,
     ) -> None:
         """Record a single frame's data.
         
+        The record is handed to a background writer, so serialization and
+        disk I/O stay off the calling thread and memory use is bounded by
+        ``buffer_frames``.
+        
         Args:
             frame: Perception frame
             plan: Motion plan (optional)
@@ -103,80 +420,24 @@ class DataRecorder:
         if not self.is_recording:
             return
         
-        frame_record = {
-            "frame_id": frame.frame_id,
-            "timestamp": frame.timestamp_s,
-            "width": frame.width,
-            "height": frame.height,
-        }
+        frame_record = self._encode(frame, plan, command, timing_info)
         
-        # Record image data if enabled
-        if self.config.record_images and frame.rgb is not None:
-            if isinstance(frame.rgb, dict):
-                frame_record["image"] = frame.rgb
-            else:
-                frame_record["image"] = {"data": "binary"}  # Placeholder
-        
-        # Record detections
-        if self.config.record_detections and frame.detections:
-            frame_record["detections"] = [
-                {
-                    "x1": d.x1, "y1": d.y1, "x2": d.x2, "y2": d.y2,
-                    "confidence": d.confidence,
-                    "label": d.label,
-                }
-                for d in frame.detections
-            ]
-        
-        # Record lane
-        if frame.lane:
-            frame_record["lane"] = {
-                "lane_center_px": frame.lane.lane_center_px,
-                "coefficients": frame.lane.coefficients,
-                "lateral_offset_m": frame.lane.lateral_offset_m,
-                "heading_error_rad": frame.lane.heading_error_rad,
-            }
-        
-        # Record plan
-        if self.config.record_plans and plan:
-            frame_record["plan"] = {
-                "target_speed_mps": plan.target_speed_mps,
-                "steering_angle_deg": plan.steering_angle_deg,
-                "reason": plan.reason,
-            }
-        
-        # Record command
-        if self.config.record_commands and command:
-            frame_record["command"] = {
-                "throttle": command.throttle,
-                "brake": command.brake,
-                "steering": command.steering,
-            }
-        
-        # Record timing
-        if timing_info:
-            frame_record["timing"] = timing_info
-        
-        self.frame_data.append(frame_record)
+        self._frame_count += 1
+        if (
+            self._writer is not None
+            and not self._writer.submit(frame_record)
+            and self._writer.dropped_frames == 1
+        ):
+            logger.warning("Recorder queue full, dropping frames (first: %s)", frame.frame_id)
     
     def _save_recording(self) -> None:
-        """Save recorded data to disk."""
+        """Save recording metadata and summary to disk."""
         # Save metadata
         metadata_path = self.recording_dir / "metadata.json"
-        with open(metadata_path, "w") as f:
-            json.dump(self.metadata, f, indent=2)
+        with open(metadata_path, "wb") as f:
+            f.write(_json_dumps_indented(self.metadata))
         
-        # Save frame data
-        if self.config.format == "json":
-            data_path = self.recording_dir / "frames.json"
-            with open(data_path, "w") as f:
-                json.dump(self.frame_data, f, indent=2)
-        elif self.config.format == "pickle":
-            data_path = self.recording_dir / "frames.pkl"
-            with open(data_path, "wb") as f:
-                pickle.dump(self.frame_data, f)
-        
-        logger.info(f"Recording saved to {self.recording_dir}")
+        logger.info("Recording saved to %s", self.recording_dir)
         
         # Save summary
         summary_path = self.recording_dir / "summary.txt"
@@ -184,7 +445,7 @@ class DataRecorder:
             f.write("ADAS Recording Summary\n")
             f.write("=" * 50 + "\n\n")
             f.write(f"Recording: {self.config.recording_name}\n")
-            f.write(f"Total Frames: {len(self.frame_data)}\n")
+            f.write(f"Total Frames: {self._frame_count}\n")
             f.write(f"Duration: {self.metadata.get('end_time', 0) - self.metadata['start_time']:.2f}s\n")
             f.write(f"Format: {self.config.format}\n")
             f.write(f"Images Recorded: {self.config.record_images}\n")
@@ -196,7 +457,7 @@ class DataRecorder:
             Dictionary with recording stats
         """
         return {
-            "total_frames": len(self.frame_data),
+            "total_frames": self._frame_count,
             "recording_time": time.time() - self.metadata["start_time"],
             "is_recording": self.is_recording,
             "output_dir": str(self.recording_dir),
@@ -218,6 +479,17 @@ class RecordingPipeline:
         """
         self.pipeline = pipeline
         self.recorder = recorder
+        
+        # Forward the commonly used pipeline surface as plain attributes, so
+        # accesses in loops skip the ``__getattr__`` fallback
+        self.reset = pipeline.reset
+        self.close = pipeline.close
+        self.detector = pipeline.detector
+        self.lane_estimator = pipeline.lane_estimator
+        self.tracker = pipeline.tracker
+        self.planner = pipeline.planner
+        self.controller = pipeline.controller
+        self.safety_monitor = pipeline.safety_monitor
     
     def step(self, frame: PerceptionFrame, current_speed_mps: float = 0.0):
         """Execute pipeline step and record data.
@@ -229,12 +501,12 @@ class RecordingPipeline:
         Returns:
             Tuple of (plan, command)
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Execute pipeline
         plan, command = self.pipeline.step(frame, current_speed_mps)
         
-        elapsed_ms = (time.time() - start_time) * 1000.0
+        elapsed_ms = (time.perf_counter_ns() - start_ns) * 1e-6
         
         # Record data
         self.recorder.record_frame(
@@ -247,5 +519,5 @@ class RecordingPipeline:
         return plan, command
     
     def __getattr__(self, name):
-        """Delegate other attributes to wrapped pipeline."""
+        """Delegate remaining attributes to the wrapped pipeline."""
         return getattr(self.pipeline, name)
@@ -7,15 +7,25 @@ for offline analysis, debugging, and testing.
 from __future__ import annotations
 
 import json
+import math
+import mmap
 import pickle
+import sys
 import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator, Optional
+
+import numpy as np
 
 from adas.core.logger import setup_logger
 from adas.core.models import BoundingBox, LaneModel, PerceptionFrame
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = setup_logger(__name__)
 
 
@@ -27,7 +37,7 @@ class ReplayConfig:
     playback_speed: float = 1.0  # 1.0 = real-time, 0.0 = as fast as possible
     loop: bool = False
     start_frame: int = 0
-    end_frame: Optional[int] = None
+    end_frame: int | None = None
 
 
 class DataReplayer:
@@ -54,11 +64,21 @@ class DataReplayer:
         
         # Load frame data
         self.frames = self._load_frames()
+        self._timestamps = np.fromiter(
+            (frame["timestamp"] for frame in self.frames), dtype=np.float64, count=len(self.frames)
+        )
+        
+        # Map recorded images; frames are served as views without copying
+        self._images = self._map_images()
+        
+        # Detections and lanes are decoded once, here, and handed out by
+        # reference; the pipeline only reads them
+        self._perception = [_decode_perception(frame_data) for frame_data in self.frames]
         
         self.current_frame_idx = config.start_frame
         
-        logger.info(f"DataReplayer initialized: {self.recording_dir}")
-        logger.info(f"Loaded {len(self.frames)} frames")
+        logger.info("DataReplayer initialized: %s", self.recording_dir)
+        logger.info("Loaded %s frames", len(self.frames))
     
     def _load_metadata(self) -> dict:
         """Load recording metadata.
@@ -68,8 +88,8 @@ class DataReplayer:
         """
         metadata_path = self.recording_dir / "metadata.json"
         if metadata_path.exists():
-            with open(metadata_path, "r") as f:
-                return json.load(f)
+            with open(metadata_path, "rb") as f:
+                return _json_loads(f.read())
         return {}
     
     def _load_frames(self) -> list:
@@ -78,25 +98,74 @@ class DataReplayer:
         Returns:
             List of frame data dictionaries
         """
-        # Try JSON first
+        # Streamed JSON lines (one record per line)
+        jsonl_path = self.recording_dir / "frames.jsonl"
+        if jsonl_path.exists():
+            with open(jsonl_path, "rb") as f:
+                frames = [_json_loads(line) for line in f if line.strip()]
+                logger.info("Loaded %s frames from JSON lines", len(frames))
+                return frames
+        
+        # Single JSON document (older recordings)
         json_path = self.recording_dir / "frames.json"
         if json_path.exists():
-            with open(json_path, "r") as f:
-                frames = json.load(f)
-                logger.info(f"Loaded {len(frames)} frames from JSON")
+            with open(json_path, "rb") as f:
+                frames = _json_loads(f.read())
+                logger.info("Loaded %s frames from JSON", len(frames))
                 return frames
         
-        # Try pickle
+        # Pickle: one dump per record, or a single list in older recordings
         pkl_path = self.recording_dir / "frames.pkl"
         if pkl_path.exists():
+            frames = []
             with open(pkl_path, "rb") as f:
-                frames = pickle.load(f)
-                logger.info(f"Loaded {len(frames)} frames from pickle")
-                return frames
+                while True:
+                    try:
+                        record = pickle.load(f)
+                    except EOFError:
+                        break
+                    if isinstance(record, list):
+                        frames.extend(record)
+                    else:
+                        frames.append(record)
+            logger.info("Loaded %s frames from pickle", len(frames))
+            return frames
+        
+        raise FileNotFoundError("No frame data found (frames.jsonl, frames.json or frames.pkl)")
+    
+    def _map_images(self) -> mmap.mmap | None:
+        """Memory-map the raw image file read-only.
         
-        raise FileNotFoundError("No frame data found (frames.json or frames.pkl)")
+        Returns:
+            Mapped image bytes, or None if the recording has no images
+        """
+        image_path = self.recording_dir / "frames.bin"
+        if not image_path.exists() or image_path.stat().st_size == 0:
+            return None
+        with open(image_path, "rb") as f:
+            # The mapping stays valid after the file object is closed
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
     
-    def get_frame(self, frame_idx: int) -> Optional[dict]:
+    def get_image(self, frame_idx: int) -> np.ndarray | None:
+        """Get a frame's recorded image as a read-only view of the mapped file.
+        
+        Args:
+            frame_idx: Frame index
+            
+        Returns:
+            Image array, or None if the frame has no recorded image
+        """
+        frame_data = self.get_frame(frame_idx)
+        if frame_data is None or self._images is None or "image_ref" not in frame_data:
+            return None
+        
+        ref = frame_data["image_ref"]
+        dtype = np.dtype(ref["dtype"])
+        return np.frombuffer(
+            self._images, dtype=dtype, count=ref["length"] // dtype.itemsize, offset=ref["offset"]
+        ).reshape(ref["shape"])
+    
+    def get_frame(self, frame_idx: int) -> dict | None:
         """Get a specific frame by index.
         
         Args:
@@ -109,7 +178,7 @@ class DataReplayer:
             return self.frames[frame_idx]
         return None
     
-    def get_perception_frame(self, frame_idx: int) -> Optional[PerceptionFrame]:
+    def get_perception_frame(self, frame_idx: int) -> PerceptionFrame | None:
         """Reconstruct PerceptionFrame from recorded data.
         
         Args:
@@ -122,37 +191,18 @@ class DataReplayer:
         if frame_data is None:
             return None
         
-        # Reconstruct perception frame
-        perception_frame = PerceptionFrame(
+        # The frame itself is always new because the pipeline overwrites its
+        # fields; the decoded detections and lane are shared without copying
+        detections, lane = self._perception[frame_idx]
+        return PerceptionFrame(
             frame_id=frame_data["frame_id"],
             timestamp_s=frame_data["timestamp"],
-            rgb=frame_data.get("image", {"width": frame_data["width"], "height": frame_data["height"]}),
+            rgb=self.get_image(frame_idx),  # None unless images were recorded
             width=frame_data["width"],
             height=frame_data["height"],
+            detections=detections,
+            lane=lane,
         )
-        
-        # Reconstruct detections
-        if "detections" in frame_data:
-            perception_frame.detections = [
-                BoundingBox(
-                    x1=d["x1"], y1=d["y1"], x2=d["x2"], y2=d["y2"],
-                    confidence=d["confidence"],
-                    label=d["label"]
-                )
-                for d in frame_data["detections"]
-            ]
-        
-        # Reconstruct lane
-        if "lane" in frame_data:
-            lane_data = frame_data["lane"]
-            perception_frame.lane = LaneModel(
-                lane_center_px=lane_data["lane_center_px"],
-                coefficients=lane_data.get("coefficients", [0.0, 0.0, 0.0]),
-                lateral_offset_m=lane_data.get("lateral_offset_m", 0.0),
-                heading_error_rad=lane_data.get("heading_error_rad", 0.0),
-            )
-        
-        return perception_frame
     
     def replay_iterator(self) -> Iterator[dict]:
         """Create iterator for replaying frames.
@@ -160,27 +210,28 @@ class DataReplayer:
         Yields:
             Frame data dictionaries
         """
+        start_frame = self.config.start_frame
         end_frame = self.config.end_frame or len(self.frames)
+        speed = self.config.playback_speed
+        
+        # Playback offset of each frame from the first one, computed once;
+        # backward timestamp jumps add no delay
+        offsets = None
+        if speed > 0:
+            deltas = np.diff(self._timestamps[start_frame:end_frame])
+            offsets = np.concatenate(([0.0], np.cumsum(np.maximum(deltas, 0.0)) / speed)).tolist()
         
         while True:
-            for idx in range(self.config.start_frame, end_frame):
-                frame_data = self.frames[idx]
-                
-                # Handle playback speed
-                if self.config.playback_speed > 0:
-                    if idx > self.config.start_frame:
-                        # Calculate time delta from recording
-                        prev_timestamp = self.frames[idx - 1]["timestamp"]
-                        curr_timestamp = frame_data["timestamp"]
-                        dt = curr_timestamp - prev_timestamp
-                        
-                        # Sleep to maintain playback speed
-                        sleep_time = dt / self.config.playback_speed
-                        if sleep_time > 0:
-                            time.sleep(sleep_time)
+            # Sleep toward absolute deadlines so per-frame overhead does not accumulate
+            start_s = time.perf_counter()
+            for idx in range(start_frame, end_frame):
+                if offsets is not None:
+                    sleep_time = start_s + offsets[idx - start_frame] - time.perf_counter()
+                    if sleep_time > 0:
+                        time.sleep(sleep_time)
                 
                 self.current_frame_idx = idx
-                yield frame_data
+                yield self.frames[idx]
             
             if not self.config.loop:
                 break
@@ -241,7 +292,7 @@ class DataReplayer:
         
         return "\n".join(lines)
     
-    def export_summary(self, output_path: Optional[str] = None) -> None:
+    def export_summary(self, output_path: str | None = None) -> None:
         """Export replay summary to file.
         
         Args:
@@ -263,7 +314,47 @@ class DataReplayer:
                 f.write(self.get_frame_summary(idx))
                 f.write("\n\n")
         
-        logger.info(f"Summary exported to {output_path}")
+        logger.info("Summary exported to %s", output_path)
+
+
+def _decode_perception(frame_data: dict) -> tuple[list[BoundingBox], LaneModel | None]:
+    """Rebuild detections and lane from a frame record.
+    
+    Args:
+        frame_data: Recorded frame dictionary
+        
+    Returns:
+        Tuple of (detections, lane); lane is None if none was recorded
+    """
+    # Detections are positional rows; older recordings use dicts
+    detections = [
+        BoundingBox(
+            x1=d["x1"], y1=d["y1"], x2=d["x2"], y2=d["y2"],
+            confidence=d["confidence"],
+            label=sys.intern(d["label"]),
+        )
+        if isinstance(d, dict)
+        else BoundingBox(
+            x1=d[0], y1=d[1], x2=d[2], y2=d[3],
+            confidence=d[4],
+            label=sys.intern(d[5]),
+        )
+        for d in frame_data.get("detections", ())
+    ]
+    
+    lane = None
+    if "lane" in frame_data:
+        lane_data = frame_data["lane"]
+        lane = LaneModel(
+            left_coeffs=tuple(lane_data.get("left_coeffs", (0.0, 0.0, 0.0))),
+            right_coeffs=tuple(lane_data.get("right_coeffs", (0.0, 0.0, 0.0))),
+            lane_center_px=lane_data["lane_center_px"],
+            curvature_m=lane_data.get("curvature_m", math.inf),
+            lateral_offset_m=lane_data.get("lateral_offset_m", 0.0),
+            heading_error_rad=lane_data.get("heading_error_rad", 0.0),
+        )
+    
+    return detections, lane
 
 
 def replay_with_pipeline(replayer: DataReplayer, pipeline):
@@ -2,157 +2,357 @@
 
 from __future__ import annotations
 
-import math
+import logging
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
-from adas.core.exceptions import TrackingError, ValidationError
+import numpy as np
+
+from adas.core.exceptions import ConfigurationError, TrackingError
 from adas.core.logger import setup_logger
-from adas.core.models import BoundingBox, TrackedObject
-from adas.core.validation import validate_bounding_box
+from adas.core.models import LABEL_IDS, BoundingBox, BoundingBoxArray, TrackedObjectArray
+from adas.core.validation import invalid_box_mask
+from adas.tracking._kernels import SCIPY_AVAILABLE, associate, associate_optimal
 
 logger = setup_logger(__name__)
 
+_warned_no_scipy = False  # One-time warning when "optimal" falls back to greedy
 
-@dataclass
-class _TrackState:
-    box: BoundingBox
-    missed: int = 0
+
+def _box_centers(coords: np.ndarray) -> np.ndarray:
+    """Centers of (N, 4) x1, y1, x2, y2 boxes as a C-contiguous (N, 2) float64 array."""
+    return (coords[:, :2] + coords[:, 2:]) * 0.5
 
 
 @dataclass
 class MultiObjectTracker:
-    """Multi-object tracker with data association and track management."""
+    """Multi-object tracker with data association and track management.
+    
+    Track state is stored as parallel arrays (structure of arrays), so
+    association, aging and distance estimation run over all tracks at once.
+    """
     
     max_missed: int = 5
     association_threshold_px: float = 120.0
     focal_length_px: float = 35.0
     min_box_height_px: float = 1.0
     max_distance_m: float = 200.0
+    association: str = "optimal"  # "optimal" (Hungarian, needs SciPy) or "greedy"
+    class_aware: bool = True  # Only associate tracks and detections of the same label
+    history_len: int = 5  # Distance samples kept per track for velocity estimation
+    default_dt_s: float = 0.05  # Frame period assumed when update gets no timestamp
     
     _next_track_id: int = 1
-    _tracks: dict[int, _TrackState] = field(default_factory=dict)
+    
+    # Track state, one row per live track in creation order
+    _ids: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.int64), repr=False
+    )
+    _boxes: np.ndarray = field(  # (N, 4) float64 as x1, y1, x2, y2
+        default_factory=lambda: np.empty((0, 4), dtype=np.float64), repr=False
+    )
+    _centers: np.ndarray = field(  # (N, 2) float64 box centers, kept in step with _boxes
+        default_factory=lambda: np.empty((0, 2), dtype=np.float64), repr=False
+    )
+    _missed: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.int32), repr=False
+    )
+    _conf: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.float64), repr=False
+    )
+    _label_ids: np.ndarray = field(  # LabelId values of the last associated detection
+        default_factory=lambda: np.empty(0, dtype=np.int8), repr=False
+    )
+    
+    # Distances of the objects returned by the last update, in output order
+    distances: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.float64), init=False, repr=False
+    )
+    # Index of the nearest returned object (-1 if none were returned)
+    nearest_index: int = field(default=-1, init=False, repr=False)
+    # Association kernel selected by ``association``
+    _associate: Callable[[np.ndarray, np.ndarray, float], np.ndarray] = field(
+        init=False, repr=False, compare=False
+    )
+    
+    # Per-track ring buffers of observed distances and their times, shape
+    # (N, history_len); head is the next slot to write, count the filled slots
+    _hist_dist: np.ndarray = field(init=False, repr=False)
+    _hist_t: np.ndarray = field(init=False, repr=False)
+    _hist_head: np.ndarray = field(init=False, repr=False)
+    _hist_count: np.ndarray = field(init=False, repr=False)
+    _time_s: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Resolve the association method and allocate the history buffers."""
+        global _warned_no_scipy
+        methods = {"optimal": associate_optimal, "greedy": associate}
+        if self.association not in methods:
+            raise ConfigurationError(f"Invalid association method: {self.association}")
+        if self.history_len < 2:
+            raise ConfigurationError(f"History length must be at least 2, got {self.history_len}")
+        if self.association == "optimal" and not SCIPY_AVAILABLE and not _warned_no_scipy:
+            logger.warning(
+                "SciPy is not installed, 'optimal' association falls back to greedy; "
+                "install adas-core[accel] or set association='greedy'"
+            )
+            _warned_no_scipy = True
+        self._associate = methods[self.association]
+        self._reset_history()
 
-    def update(self, detections: list[BoundingBox]) -> list[TrackedObject]:
+    @property
+    def num_tracks(self) -> int:
+        """Number of live tracks, including ones missed in recent frames."""
+        return len(self._ids)
+
+    def update(
+        self,
+        detections: list[BoundingBox] | BoundingBoxArray,
+        timestamp_s: float | None = None,
+    ) -> TrackedObjectArray:
         """Update tracker with new detections.
         
+        Labels outside ``LabelId`` are reported as ``"unknown"``, as in
+        ``BoundingBoxArray``.
+        
         Args:
-            detections: List of detected bounding boxes
+            detections: Detected bounding boxes (list or SoA batch)
+            timestamp_s: Frame timestamp for velocity estimation (advances
+                by ``default_dt_s`` if None)
             
         Returns:
-            List of tracked objects with persistent IDs
+            Batch of tracked objects with persistent IDs; use ``as_objects()``
+            where a list of ``TrackedObject`` is needed
             
         Raises:
             TrackingError: If tracking fails
         """
         try:
-            # Validate all detections first
-            valid_detections = []
-            for det in detections:
-                try:
-                    validate_bounding_box(det)
-                    valid_detections.append(det)
-                except ValidationError as e:
-                    logger.warning(f"Invalid detection skipped: {e}")
+            if timestamp_s is None:
+                self._time_s += self.default_dt_s
+            else:
+                self._time_s = timestamp_s
+            
+            # Lists are packed into float64 columns, so their boxes keep exact
+            # coordinates and share the vectorized validation below
+            batch = detections
+            if not isinstance(batch, BoundingBoxArray):
+                batch = BoundingBoxArray(
+                    coords=np.array(
+                        [(d.x1, d.y1, d.x2, d.y2) for d in detections], dtype=np.float64
+                    ).reshape(-1, 4),
+                    conf=np.array([d.confidence for d in detections], dtype=np.float64),
+                    label_ids=np.array(
+                        [LABEL_IDS.get(d.label, 0) for d in detections], dtype=np.int8
+                    ),
+                )
+            
+            # Validate all detections in one pass; only the (rare) invalid
+            # boxes are reported
+            bad = invalid_box_mask(batch)
+            for idx in np.flatnonzero(bad).tolist():
+                logger.warning("Invalid detection skipped: %s", detections[idx])
+            valid_idx = np.flatnonzero(~bad)
+            det_coords = batch.coords[valid_idx].astype(np.float64, copy=False)
+            det_conf = batch.conf[valid_idx].astype(np.float64, copy=False)
+            det_labels = batch.label_ids[valid_idx]
             
-            assigned: set[int] = set()
-
             # Associate existing tracks to detections
-            for track_id, state in list(self._tracks.items()):
-                best_idx = None
-                best_dist = float("inf")
-                
-                # Track center
-                tx = (state.box.x1 + state.box.x2) / 2.0
-                ty = (state.box.y1 + state.box.y2) / 2.0
-
-                # Find nearest detection
-                for idx, det in enumerate(valid_detections):
-                    if idx in assigned:
-                        continue
-                    
-                    # Detection center
-                    dx = (det.x1 + det.x2) / 2.0 - tx
-                    dy = (det.y1 + det.y2) / 2.0 - ty
-                    
-                    # Euclidean distance (optimized with math.hypot)
-                    dist = math.hypot(dx, dy)
-                    
-                    if dist < best_dist:
-                        best_dist = dist
-                        best_idx = idx
-
-                # Associate if within threshold
-                if best_idx is not None and best_dist < self.association_threshold_px:
-                    state.box = valid_detections[best_idx]
-                    state.missed = 0
-                    assigned.add(best_idx)
-                    logger.debug(f"Track {track_id} associated with det {best_idx} (dist={best_dist:.1f})")
-                else:
-                    state.missed += 1
-                    if state.missed > self.max_missed:
-                        logger.debug(f"Track {track_id} deleted (missed {state.missed} frames)")
-                        self._tracks.pop(track_id)
+            det_centers = _box_centers(det_coords)
+            assignment = self._associate_by_class(
+                det_centers,
+                det_labels,
+                self.association_threshold_px * self.association_threshold_px,
+            )
+            matched = assignment >= 0
+            det_idx = assignment[matched]
+            self._boxes[matched] = det_coords[det_idx]
+            self._centers[matched] = det_centers[det_idx]
+            self._conf[matched] = det_conf[det_idx]
+            self._label_ids[matched] = det_labels[det_idx]
+            self._missed[matched] = 0
+            self._missed[~matched] += 1
+            
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                for track_id, idx in zip(self._ids[matched].tolist(), det_idx.tolist()):
+                    logger.debug("Track %s associated with det %s", track_id, idx)
+            
+            # Drop tracks missed for too long, compacting the arrays
+            keep = self._missed <= self.max_missed
+            if not keep.all():
+                if debug:
+                    for track_id, missed in zip(self._ids[~keep].tolist(), self._missed[~keep]):
+                        logger.debug("Track %s deleted (missed %s frames)", track_id, missed)
+                self._ids = self._ids[keep]
+                self._boxes = self._boxes[keep]
+                self._centers = self._centers[keep]
+                self._missed = self._missed[keep]
+                self._conf = self._conf[keep]
+                self._label_ids = self._label_ids[keep]
+                self._hist_dist = self._hist_dist[keep]
+                self._hist_t = self._hist_t[keep]
+                self._hist_head = self._hist_head[keep]
+                self._hist_count = self._hist_count[keep]
 
             # Create new tracks for unassigned detections
-            for idx, det in enumerate(valid_detections):
-                if idx in assigned:
-                    continue
-                track_id = self._next_track_id
-                self._tracks[track_id] = _TrackState(box=det)
-                self._next_track_id += 1
-                logger.debug(f"New track {track_id} created")
+            assigned = np.zeros(len(det_coords), dtype=bool)
+            assigned[det_idx] = True
+            new_idx = np.flatnonzero(~assigned)
+            if len(new_idx):
+                new_ids = np.arange(
+                    self._next_track_id, self._next_track_id + len(new_idx), dtype=np.int64
+                )
+                self._next_track_id += len(new_idx)
+                self._ids = np.concatenate((self._ids, new_ids))
+                self._boxes = np.concatenate((self._boxes, det_coords[new_idx]))
+                self._centers = np.concatenate((self._centers, det_centers[new_idx]))
+                self._missed = np.concatenate(
+                    (self._missed, np.zeros(len(new_idx), dtype=np.int32))
+                )
+                self._conf = np.concatenate((self._conf, det_conf[new_idx]))
+                self._label_ids = np.concatenate((self._label_ids, det_labels[new_idx]))
+                empty_hist = np.zeros((len(new_idx), self.history_len), dtype=np.float64)
+                self._hist_dist = np.concatenate((self._hist_dist, empty_hist))
+                self._hist_t = np.concatenate((self._hist_t, empty_hist))
+                self._hist_head = np.concatenate(
+                    (self._hist_head, np.zeros(len(new_idx), dtype=np.int64))
+                )
+                self._hist_count = np.concatenate(
+                    (self._hist_count, np.zeros(len(new_idx), dtype=np.int32))
+                )
+                if debug:
+                    for track_id in new_ids.tolist():
+                        logger.debug("New track %s created", track_id)
 
-            # Generate tracked objects output
-            tracked: list[TrackedObject] = []
-            for track_id, state in self._tracks.items():
-                try:
-                    distance_m = self._estimate_distance(state.box)
-                    tracked.append(
-                        TrackedObject(
-                            track_id=track_id,
-                            box=state.box,
-                            velocity_mps=0.0,  # TODO: Compute from track history
-                            distance_m=distance_m,
-                        )
+            # Generate tracked objects output; distances come from one vectorized
+            # pass and tracks whose estimate failed are masked out. Boolean
+            # indexing copies, so the output never aliases the mutable state.
+            distances = self._estimate_distances(self._boxes)
+            ok = np.isfinite(distances)
+            velocities = self._update_velocities(distances, ok)
+            if not ok.all():
+                for track_id in self._ids[~ok].tolist():
+                    logger.warning(
+                        "Track %s distance estimation failed: non-finite distance", track_id
                     )
-                except ValueError as e:
-                    logger.warning(f"Track {track_id} distance estimation failed: {e}")
+                distances = distances[ok]
+            
+            tracked = TrackedObjectArray(
+                track_ids=self._ids[ok],
+                coords=self._boxes[ok],
+                conf=self._conf[ok],
+                label_ids=self._label_ids[ok],
+                velocity_mps=velocities[ok],
+                distance_m=distances,
+            )
                     
-            logger.debug(f"Tracking {len(tracked)} objects")
+            self.distances = distances
+            self.nearest_index = int(distances.argmin()) if len(distances) else -1
+            logger.debug("Tracking %s objects", len(tracked))
             return tracked
             
         except Exception as e:
             raise TrackingError(f"Tracker update failed: {e}") from e
     
-    def _estimate_distance(self, box: BoundingBox) -> float:
-        """Estimate distance from bounding box height.
+    def _associate_by_class(
+        self, det_centers: np.ndarray, det_labels: np.ndarray, max_dist2: float
+    ) -> np.ndarray:
+        """Associate tracks to detections, one sub-problem per label.
+        
+        Splitting the cost matrix by label keeps a track from taking a
+        detection of another class and shrinks each assignment problem.
+        Scenes with a single label skip the split entirely.
         
         Args:
-            box: Bounding box
+            det_centers: Detection centers, shape (M, 2)
+            det_labels: Detection ``LabelId`` values, shape (M,)
+            max_dist2: Squared association threshold in pixels^2
             
         Returns:
-            Estimated distance in meters
-            
-        Raises:
-            ValueError: If estimation fails
+            Detection index per track (-1 if unmatched), shape (N,)
         """
-        box_height = box.y2 - box.y1
+        if not self.class_aware or len(np.union1d(self._label_ids, det_labels)) <= 1:
+            return self._associate(self._centers, det_centers, max_dist2)
         
-        # Ensure minimum height to avoid division issues
-        box_height = max(self.min_box_height_px, box_height)
+        assignment = np.full(len(self._ids), -1, dtype=np.int64)
+        for label in np.intersect1d(self._label_ids, det_labels).tolist():
+            rows = np.flatnonzero(self._label_ids == label)
+            cols = np.flatnonzero(det_labels == label)
+            local = self._associate(self._centers[rows], det_centers[cols], max_dist2)
+            hit = local >= 0
+            assignment[rows[hit]] = cols[local[hit]]
+        return assignment
+    
+    def _update_velocities(self, distances: np.ndarray, finite: np.ndarray) -> np.ndarray:
+        """Record this frame's distances and estimate each track's range rate.
         
-        distance_m = self.focal_length_px / box_height
+        Tracks observed this frame write one sample into their ring buffer;
+        coasting tracks keep their history. The rate is the finite difference
+        between the newest and oldest samples, so no per-track lists grow.
         
-        if not math.isfinite(distance_m):
-            raise ValueError("Distance calculation resulted in non-finite value")
+        Args:
+            distances: Distances of all live tracks in meters, shape (N,)
+            finite: Mask of the distances that are finite, shape (N,)
+            
+        Returns:
+            Range rate per track in m/s (negative when closing; 0.0 until a
+            track has two samples), shape (N,)
+        """
+        k = self.history_len
+        rows = np.flatnonzero((self._missed == 0) & finite)
+        head = self._hist_head[rows]
+        self._hist_dist[rows, head] = distances[rows]
+        self._hist_t[rows, head] = self._time_s
+        self._hist_head[rows] = (head + 1) % k
+        self._hist_count[rows] = np.minimum(self._hist_count[rows] + 1, k)
+        
+        # The oldest sample sits at the write slot once the ring has wrapped
+        all_rows = np.arange(len(self._ids))
+        newest = (self._hist_head - 1) % k
+        oldest = np.where(self._hist_count == k, self._hist_head, 0)
+        delta_d = self._hist_dist[all_rows, newest] - self._hist_dist[all_rows, oldest]
+        delta_t = self._hist_t[all_rows, newest] - self._hist_t[all_rows, oldest]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(delta_t > 0.0, delta_d / delta_t, 0.0)
+    
+    def _reset_history(self) -> None:
+        """Allocate empty velocity history buffers."""
+        self._hist_dist = np.empty((0, self.history_len), dtype=np.float64)
+        self._hist_t = np.empty((0, self.history_len), dtype=np.float64)
+        self._hist_head = np.empty(0, dtype=np.int64)
+        self._hist_count = np.empty(0, dtype=np.int32)
+        self._time_s = 0.0
+    
+    def _estimate_distances(self, boxes: np.ndarray) -> np.ndarray:
+        """Estimate distances from bounding box heights.
+        
+        Args:
+            boxes: Boxes as an (N, 4) x1, y1, x2, y2 array
+            
+        Returns:
+            Estimated distances in meters, shape (N,); non-finite where
+            estimation failed
+        """
+        # Ensure minimum height to avoid division issues
+        box_heights = np.maximum(boxes[:, 3] - boxes[:, 1], self.min_box_height_px)
         
-        # Clamp to maximum distance
-        distance_m = min(distance_m, self.max_distance_m)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            distances = self.focal_length_px / box_heights
         
-        return distance_m
+        # Clamp to maximum distance (NaN is preserved and reported by the caller)
+        return np.minimum(distances, self.max_distance_m)
     
     def reset(self) -> None:
         """Reset tracker state."""
         logger.info("Tracker reset")
-        self._tracks.clear()
+        self._ids = np.empty(0, dtype=np.int64)
+        self._boxes = np.empty((0, 4), dtype=np.float64)
+        self._centers = np.empty((0, 2), dtype=np.float64)
+        self._missed = np.empty(0, dtype=np.int32)
+        self._conf = np.empty(0, dtype=np.float64)
+        self._label_ids = np.empty(0, dtype=np.int8)
+        self._reset_history()
         self._next_track_id = 1
+        self.distances = np.empty(0, dtype=np.float64)
+        self.nearest_index = -1
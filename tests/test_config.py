@@ -0,0 +1,109 @@
+"""Tests for configuration loading."""
+
+import dataclasses
+import json
+import logging
+import os
+
+import pytest
+
+from adas.core.config import (
+    DEFAULT_CONFIG,
+    DetectorConfig,
+    load_config,
+    validated_construction,
+)
+from adas.core.exceptions import ConfigurationError, ValidationError
+
+
+def test_load_config_defaults():
+    """Test that no path returns the default configuration."""
+    assert load_config() is DEFAULT_CONFIG
+    
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        DEFAULT_CONFIG.planner.cruise_speed_mps = 0.0
+
+
+def test_load_config_from_file(tmp_path):
+    """Test loading overrides from a JSON file."""
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"fps": 30, "planner": {"cruise_speed_mps": 20}}))
+    
+    config = load_config(path)
+    
+    assert config.fps == 30
+    assert config.log_level_int == logging.INFO
+    assert config.planner.cruise_speed_mps == 20.0
+    assert isinstance(config.planner.cruise_speed_mps, float)
+    assert config.tracker == DEFAULT_CONFIG.tracker
+
+
+def test_load_config_cached_until_modified(tmp_path):
+    """Test that unchanged files are served from cache and edits are picked up."""
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"fps": 30}))
+    
+    first = load_config(path)
+    assert load_config(str(path)) is first
+    
+    path.write_text(json.dumps({"fps": 40}))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    
+    reloaded = load_config(path)
+    assert reloaded is not first
+    assert reloaded.fps == 40
+
+
+def test_load_config_reuses_identical_sections(tmp_path):
+    """Test that identical section payloads share one parsed section."""
+    first_path = tmp_path / "first.json"
+    second_path = tmp_path / "second.json"
+    first_path.write_text(json.dumps({"fps": 30, "planner": {"cruise_speed_mps": 18.0}}))
+    second_path.write_text(json.dumps({"fps": 40, "planner": {"cruise_speed_mps": 18.0}}))
+    
+    first = load_config(first_path)
+    second = load_config(second_path)
+    
+    assert first is not second
+    assert first.planner is second.planner
+
+
+def test_load_config_missing_file(tmp_path):
+    """Test that a missing file raises ConfigurationError."""
+    with pytest.raises(ConfigurationError, match="not found"):
+        load_config(tmp_path / "missing.json")
+
+
+def test_load_config_invalid_json(tmp_path):
+    """Test that malformed JSON raises ConfigurationError."""
+    path = tmp_path / "config.json"
+    path.write_text("{not json")
+    
+    with pytest.raises(ConfigurationError):
+        load_config(path)
+
+
+@pytest.mark.parametrize("value", ['"false"', '"0"', "0"])
+def test_load_config_rejects_non_bool_flag(tmp_path, value):
+    """Test that boolean fields are not cast from strings or numbers."""
+    path = tmp_path / "config.json"
+    path.write_text(f'{{"tracker": {{"class_aware": {value}}}}}')
+    
+    with pytest.raises(ConfigurationError, match="class_aware"):
+        load_config(path)
+    
+    path.write_text('{"tracker": {"class_aware": false}}')
+    assert load_config(path).tracker.class_aware is False
+
+
+def test_config_defaults_pass_validation():
+    """Test that defaults trusted at import are valid when checked explicitly."""
+    assert DetectorConfig() == DEFAULT_CONFIG.detector
+    
+    with pytest.raises(ValidationError):
+        DetectorConfig(confidence_threshold=5.0)
+    
+    with validated_construction():
+        trusted = DetectorConfig(confidence_threshold=5.0)
+    assert trusted.confidence_threshold == 5.0
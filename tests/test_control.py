@@ -1,7 +1,11 @@
 """Tests for controller."""
 
+import logging
 
-from adas.control import PIDLikeLongitudinalController
+import pytest
+
+from adas.control import CommandBuffer, PIDLikeLongitudinalController
+from adas.core.exceptions import ControlError
 from adas.core.models import MotionPlan
 
 
@@ -78,3 +82,96 @@ def test_controller_limits_throttle():
     
     assert cmd.throttle <= 1.0
     assert cmd.throttle >= 0.0
+
+
+def test_controller_writes_into_command_buffer():
+    """Test buffered control path matches to_command."""
+    controller = PIDLikeLongitudinalController(kp_speed=0.15)
+    buffer = CommandBuffer(capacity=4)
+    
+    plan = MotionPlan(target_speed_mps=20.0, steering_angle_deg=10.0, reason="test")
+    idx = controller.write_command(plan, current_speed_mps=10.0, buffer=buffer)
+    
+    expected = controller.to_command(plan, current_speed_mps=10.0)
+    latest = buffer.latest()
+    
+    assert idx == 0
+    assert len(buffer) == 1
+    assert latest.throttle == pytest.approx(expected.throttle)
+    assert latest.brake == pytest.approx(expected.brake)
+    assert latest.steering == pytest.approx(expected.steering)
+
+
+def test_command_buffer_wraps_around():
+    """Test that the ring buffer overwrites the oldest slot when full."""
+    buffer = CommandBuffer(capacity=2)
+    
+    assert buffer.latest() is None
+    
+    for i in range(3):
+        buffer.append(throttle=0.1 * i, brake=0.0, steering=0.0)
+    
+    assert len(buffer) == 2
+    assert buffer.total_written == 3
+    assert buffer.throttle[0] == pytest.approx(0.2)
+    assert buffer.latest().throttle == pytest.approx(0.2)
+
+
+def test_controller_trusted_inputs_still_check_speed():
+    """Test trusted fast path matches default output and still validates speed."""
+    trusted = PIDLikeLongitudinalController(trust_inputs=True)
+    checked = PIDLikeLongitudinalController()
+    
+    plan = MotionPlan(target_speed_mps=20.0, steering_angle_deg=5.0, reason="test")
+    assert trusted.to_command(plan, 15.0) == checked.to_command(plan, 15.0)
+    
+    with pytest.raises(ControlError):
+        trusted.to_command(plan, current_speed_mps=-1.0)
+
+
+def test_controller_batch_matches_single_frame():
+    """Test batched control matches per-frame to_command."""
+    controller = PIDLikeLongitudinalController()
+    
+    target = [20.0, 10.0, 15.0, 0.0]
+    current = [15.0, 15.0, 15.0, 5.0]
+    steer = [10.0, -30.0, 0.3, 0.0]
+    throttle, brake, steering = controller.to_commands(target, current, steer)
+    
+    for i in range(len(target)):
+        plan = MotionPlan(target_speed_mps=target[i], steering_angle_deg=steer[i], reason="test")
+        cmd = controller.to_command(plan, current[i])
+        assert throttle[i] == pytest.approx(cmd.throttle, abs=1e-6)
+        assert brake[i] == pytest.approx(cmd.brake, abs=1e-6)
+        assert steering[i] == pytest.approx(cmd.steering, abs=1e-6)
+    
+    with pytest.raises(ControlError):
+        controller.to_commands([float("nan")], [0.0], [0.0])
+
+
+def test_controller_refresh_log_level():
+    """Test that the cached debug gate follows the logger level."""
+    controller = PIDLikeLongitudinalController()
+    control_logger = logging.getLogger("adas.control.controller")
+    previous = control_logger.level
+    
+    try:
+        control_logger.setLevel(logging.DEBUG)
+        controller.refresh_log_level()
+        assert controller._debug
+        
+        control_logger.setLevel(logging.INFO)
+        controller.refresh_log_level()
+        assert not controller._debug
+    finally:
+        control_logger.setLevel(previous)
+
+
+@pytest.mark.parametrize("speed", [-1.0, float("nan"), float("inf")])
+def test_controller_rejects_invalid_current_speed(speed):
+    """Test that negative and non-finite speeds are rejected."""
+    controller = PIDLikeLongitudinalController()
+    plan = MotionPlan(target_speed_mps=10.0, steering_angle_deg=0.0, reason="test")
+    
+    with pytest.raises(ControlError):
+        controller.to_command(plan, current_speed_mps=speed)
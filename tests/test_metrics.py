@@ -0,0 +1,41 @@
+"""Tests for performance metrics."""
+
+import time
+
+import pytest
+
+from adas.core.exceptions import ValidationError
+from adas.core.metrics import PerformanceMetrics, SystemHealthMonitor
+
+
+def test_metrics_frame_time_history():
+    """Test frame time statistics over the ring buffer history."""
+    metrics = PerformanceMetrics(history_size=3)
+    assert metrics.min_frame_time == 0.0
+    
+    for frame_time_ns in [10_000_000, 20_000_000, 30_000_000, 5_000_000]:
+        metrics.update_frame(frame_time_ns, num_detections=2, num_tracks=1, has_lane=True)
+    
+    assert metrics.total_frames == 4
+    assert metrics.total_processing_ns == 65_000_000
+    assert len(metrics.frame_times_ns) == 3
+    assert metrics.min_frame_time == pytest.approx(0.005)
+    assert metrics.max_frame_time == pytest.approx(0.030)
+    assert metrics.avg_frame_time == pytest.approx(0.01625)
+    assert "Frames: 4" in metrics.summary()
+
+
+def test_heartbeat_samples_clock(monkeypatch):
+    """Test heartbeat reads the clock only on sampled calls."""
+    monitor = SystemHealthMonitor(heartbeat_interval=0.0, sample_every=4)
+    reads = []
+    monkeypatch.setattr(time, "monotonic_ns", lambda: reads.append(1) or 2**62)
+    
+    for _ in range(8):
+        monitor.heartbeat()
+    
+    assert len(reads) == 2
+    assert monitor.last_heartbeat_ns == 2**62
+    
+    with pytest.raises(ValidationError):
+        SystemHealthMonitor(sample_every=3)
@@ -0,0 +1,87 @@
+"""Tests for core data models."""
+
+import dataclasses
+import json
+
+import numpy as np
+import pytest
+
+from adas.core.models import LABEL_NAMES, BoundingBox, BoundingBoxArray, LabelId, MotionPlan
+from adas.perception.detection import ObjectDetector
+from adas.perception.lane import LaneEstimator
+
+
+def test_bounding_box_array_round_trip():
+    """Test packing boxes into columns and reading them back."""
+    boxes = [
+        BoundingBox(x1=10, y1=20, x2=30, y2=40, confidence=0.5, label="car"),
+        BoundingBox(x1=0, y1=0, x2=10, y2=10, confidence=0.9, label="forklift"),
+    ]
+    
+    arr = BoundingBoxArray.from_boxes(boxes)
+    
+    assert len(arr) == 2
+    assert arr.coords.dtype == np.float32
+    assert arr.label_ids.tolist() == [LabelId.CAR, LabelId.UNKNOWN]
+    assert arr[0] == boxes[0]
+    assert arr[1].label is LABEL_NAMES[LabelId.UNKNOWN]
+    assert [b.x2 for b in arr] == [30.0, 10.0]
+    np.testing.assert_allclose(arr.areas(), [400.0, 100.0])
+
+
+def test_bounding_box_array_iou():
+    """Test vectorized pairwise IoU."""
+    a = BoundingBoxArray.from_boxes([BoundingBox(0, 0, 10, 10, 0.9, "car")])
+    b = BoundingBoxArray.from_boxes([
+        BoundingBox(0, 0, 10, 10, 0.9, "car"),
+        BoundingBox(5, 0, 15, 10, 0.9, "car"),
+        BoundingBox(20, 20, 30, 30, 0.9, "car"),
+    ])
+    
+    iou = a.iou(b)
+    
+    assert iou.shape == (1, 3)
+    assert iou[0] == pytest.approx([1.0, 1.0 / 3.0, 0.0])
+    assert len(a.iou(BoundingBoxArray.empty())[0]) == 0
+
+
+def test_detector_returns_box_array():
+    """Test that the detector emits a read-only SoA batch built once per size."""
+    detections = ObjectDetector().infer(None, 1280, 720)
+    
+    assert isinstance(detections, BoundingBoxArray)
+    assert len(detections) == 1
+    assert detections[0].label == "vehicle"
+    assert ObjectDetector().infer(None, 1280, 720) is detections
+    assert not detections.coords.flags.writeable
+
+
+def test_lane_estimator_reuses_frozen_model():
+    """Test that lane geometry is built once per image size."""
+    estimator = LaneEstimator()
+    
+    lane = estimator.estimate(None, 1280, 720)
+    
+    assert estimator.estimate(None, 1280, 720) is lane
+    assert lane.lane_center_px == 640.0
+    assert lane.lateral_offset_m == pytest.approx(0.0)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        lane.lane_center_px = 0.0
+
+
+def test_deferred_plan_reason_formats_once_on_use():
+    """Test a deferred plan reason is formatted on first read and cached as str."""
+    calls = []
+    
+    def fmt(distance):
+        calls.append(distance)
+        return f"follow_{distance:.1f}m"
+    
+    plan = MotionPlan.deferred(8.0, 0.0, fmt, 20.0)
+    assert calls == []
+    
+    assert type(plan.reason) is str
+    assert plan.reason == "follow_20.0m"
+    assert plan == MotionPlan(8.0, 0.0, "follow_20.0m")
+    assert json.dumps(plan.reason) == '"follow_20.0m"'
+    assert calls == [20.0]
@@ -3,19 +3,20 @@ from __future__ import annotations
 import time
 
 from adas.cli import build_pipeline
-from adas.core.models import BoundingBox, PerceptionFrame, TrackedObject
-from adas.runtime import synthetic_frame
+from adas.core.models import BoundingBox, MotionPlan, PerceptionFrame, TrackedObject
+from adas.planning import BehaviorPlanner
+from adas.runtime import PipelineRunner, PlanRing, synthetic_frame
 
 
 def test_pipeline_synthetic_smoke() -> None:
-    pipeline, fps = build_pipeline()
+    pipeline, _fps = build_pipeline()
     frame = synthetic_frame()
     perception = PerceptionFrame(
         frame_id=1,
         timestamp_s=time.time(),
         rgb=frame,
-        width=frame["width"],
-        height=frame["height"],
+        width=frame.shape[1],
+        height=frame.shape[0],
     )
 
     plan, command = pipeline.step(perception, current_speed_mps=10.0)
@@ -28,7 +29,7 @@ def test_pipeline_synthetic_smoke() -> None:
 
 
 def test_planner_slows_for_close_vehicle() -> None:
-    pipeline, fps = build_pipeline()
+    pipeline, _fps = build_pipeline()
     close_obj = TrackedObject(
         track_id=1,
         box=BoundingBox(0, 0, 100, 100, 0.9, "vehicle"),
@@ -39,3 +40,195 @@ def test_planner_slows_for_close_vehicle() -> None:
     plan = pipeline.planner.plan(frame_width_px=1280, lane_center_px=640.0, objects=[close_obj])
     assert plan.target_speed_mps < pipeline.planner.cruise_speed_mps
     assert "follow" in plan.reason
+
+
+def test_pipeline_with_async_safety() -> None:
+    pipeline, _fps = build_pipeline(async_safety=True)
+    frame = synthetic_frame()
+    perception = PerceptionFrame(
+        frame_id=1,
+        timestamp_s=time.time(),
+        rgb=frame,
+        width=frame.shape[1],
+        height=frame.shape[0],
+    )
+
+    try:
+        _plan, command = pipeline.step(perception, current_speed_mps=10.0)
+    finally:
+        pipeline.close()
+
+    assert not pipeline.safety_thread.is_running
+    assert 0.0 <= command.throttle <= 1.0
+
+
+def test_plan_ring_returns_latest_plan() -> None:
+    ring = PlanRing(capacity=4)
+    assert ring.read_latest() is None
+
+    for i in range(10):
+        ring.try_publish(MotionPlan(target_speed_mps=float(i), steering_angle_deg=1.0, reason=f"p{i}"))
+
+    seq, plan = ring.read_latest()
+    assert seq == 9
+    assert plan == MotionPlan(target_speed_mps=9.0, steering_angle_deg=1.0, reason="p9")
+
+
+def test_pipeline_with_threaded_planner() -> None:
+    pipeline, _fps = build_pipeline(threaded_planner=True)
+    frame = synthetic_frame()
+
+    try:
+        for frame_id in range(20):
+            perception = PerceptionFrame(
+                frame_id=frame_id,
+                timestamp_s=time.time(),
+                rgb=frame,
+                width=frame.shape[1],
+                height=frame.shape[0],
+            )
+            plan, command = pipeline.step(perception, current_speed_mps=10.0)
+            if plan.reason != "awaiting_plan":
+                break
+            time.sleep(0.01)
+    finally:
+        pipeline.close()
+
+    assert not pipeline.planner_thread.is_running
+    assert pipeline.planner_thread.ring.published >= 1
+    assert plan.reason != "awaiting_plan"
+    assert 0.0 <= command.brake <= 1.0
+
+
+def _threaded_steps(pipeline, num_frames: int):
+    frame = synthetic_frame()
+    command = None
+    for frame_id in range(num_frames):
+        perception = PerceptionFrame(
+            frame_id=frame_id,
+            timestamp_s=time.time(),
+            rgb=frame,
+            width=frame.shape[1],
+            height=frame.shape[0],
+        )
+        _, command = pipeline.step(perception, current_speed_mps=10.0)
+        time.sleep(0.005)
+    return command
+
+
+def test_pipeline_fails_safe_when_planner_thread_dies() -> None:
+    pipeline, _ = build_pipeline(threaded_planner=True)
+    try:
+        _threaded_steps(pipeline, 5)
+        pipeline.planner_thread.stop()  # Planner is gone; its last plan stays in the ring
+        command = _threaded_steps(pipeline, 1)
+    finally:
+        pipeline.close()
+
+    assert command.throttle == 0.0
+    assert command.brake == 1.0
+
+
+def test_pipeline_fails_safe_when_planner_keeps_failing(monkeypatch) -> None:
+    pipeline, _ = build_pipeline(threaded_planner=True)
+
+    def failing_plan(*args, **kwargs):
+        raise RuntimeError("planner crashed")
+
+    monkeypatch.setattr(BehaviorPlanner, "plan", failing_plan)
+    try:
+        for _ in range(100):
+            command = _threaded_steps(pipeline, 1)
+            if pipeline.planner_thread.failed_plans >= pipeline.max_failed_plans:
+                break
+        command = _threaded_steps(pipeline, 1)
+    finally:
+        pipeline.close()
+
+    assert pipeline.planner_thread.failed_plans >= pipeline.max_failed_plans
+    assert command.throttle == 0.0
+    assert command.brake == 1.0
+
+
+def test_planner_thread_counts_failures() -> None:
+    pipeline, _ = build_pipeline(threaded_planner=True)
+    planner_thread = pipeline.planner_thread
+    try:
+        planner_thread.submit(0, None, [])  # Zero width cannot be planned
+        for _ in range(100):
+            if planner_thread.failed_plans:
+                break
+            time.sleep(0.01)
+    finally:
+        pipeline.close()
+
+    assert planner_thread.failed_plans == 1
+    assert planner_thread.last_error
+    assert planner_thread.ring.published == 0
+
+
+def test_runner_pipelined_processes_every_frame() -> None:
+    pipeline, _ = build_pipeline()
+    runner = PipelineRunner(pipeline, target_fps=1000.0)
+
+    try:
+        runner.run_pipelined(max_frames=5)
+    finally:
+        pipeline.close()
+
+    assert runner.metrics.total_frames == 5
+    assert runner.metrics.min_frame_time > 0.0
+
+
+def test_parallel_perception_matches_sequential() -> None:
+    pipeline, _ = build_pipeline()
+    frame = synthetic_frame()
+    parallel, sequential = (
+        PerceptionFrame(
+            frame_id=1,
+            timestamp_s=time.time(),
+            rgb=frame,
+            width=frame.shape[1],
+            height=frame.shape[0],
+        )
+        for _ in range(2)
+    )
+
+    pipeline.parallel_perception = True
+    try:
+        pipeline.perceive(parallel)
+    finally:
+        pipeline.close()
+    pipeline.parallel_perception = False
+    pipeline.perceive(sequential)
+
+    assert list(parallel.detections) == list(sequential.detections)
+    assert parallel.lane == sequential.lane
+
+
+def test_pipeline_step_overlapped_lags_one_frame() -> None:
+    pipeline, _ = build_pipeline()
+    frame = synthetic_frame()
+    frames = [
+        PerceptionFrame(
+            frame_id=frame_id,
+            timestamp_s=time.time(),
+            rgb=frame,
+            width=frame.shape[1],
+            height=frame.shape[0],
+        )
+        for frame_id in range(3)
+    ]
+
+    try:
+        first_plan, first_command = pipeline.step_overlapped(frames[0], current_speed_mps=10.0)
+        plan, _ = pipeline.step_overlapped(frames[1], current_speed_mps=10.0)
+    finally:
+        pipeline.close()
+
+    assert first_plan.reason == "awaiting_perception"
+    assert first_plan.target_speed_mps == 10.0
+    assert 0.0 <= first_command.throttle <= 1.0
+    assert plan.reason != "awaiting_perception"
+    assert len(frames[1].detections) == 1  # Perceived during the second call
+    assert pipeline.tracker.num_tracks == 1  # Only frame 0 reached the tracker
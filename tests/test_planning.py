@@ -1,5 +1,6 @@
 """Tests for behavior planner."""
 
+import numpy as np
 
 from adas.core.models import BoundingBox, TrackedObject
 from adas.planning import BehaviorPlanner
@@ -90,3 +91,27 @@ def test_planner_steering_limits():
     
     # Should be clamped to max
     assert abs(plan.steering_angle_deg) <= 22.0
+
+
+def test_planner_reasons_follow_nearest_object():
+    """Test that the nearest of several objects drives the speed decision."""
+    planner = BehaviorPlanner(cruise_speed_mps=15.0, min_follow_distance_m=12.0, time_gap_s=2.0)
+    box = BoundingBox(x1=100, y1=100, x2=200, y2=200, confidence=0.9, label="car")
+    objects = [
+        TrackedObject(track_id=i, box=box, velocity_mps=0.0, distance_m=d)
+        for i, d in enumerate([80.0, 20.0, 45.0])
+    ]
+    
+    plan = planner.plan(frame_width_px=1280, lane_center_px=2000.0, objects=objects)
+    
+    assert plan.target_speed_mps == 15.0 * 20.0 / 30.0
+    assert plan.reason == "follow_20.0m|invalid_lane"
+    
+    distances = np.array([obj.distance_m for obj in objects])
+    assert planner.plan(1280, 2000.0, objects, distances=distances) == plan
+    
+    objects.append(TrackedObject(track_id=9, box=box, velocity_mps=0.0, distance_m=float("nan")))
+    plan = planner.plan(frame_width_px=1280, lane_center_px=640.0, objects=objects)
+    
+    assert plan.target_speed_mps == 15.0
+    assert plan.reason.startswith("invalid_distance|")
@@ -1,8 +1,11 @@
 """Tests for safety monitor."""
 
+import threading
+
+import numpy as np
 import pytest
 
-from adas.control import SafetyMonitor
+from adas.control import CommandBuffer, SafetyMonitor, SafetyThread
 from adas.core.exceptions import SafetyViolation
 from adas.core.models import ControlCommand, MotionPlan, TrackedObject, BoundingBox
 
@@ -25,6 +28,7 @@ def test_safety_monitor_speed_limit():
 def test_safety_monitor_steering_limit():
     """Test that excessive steering is detected."""
     monitor = SafetyMonitor()
+    assert monitor.limits.max_steering_angle_deg == pytest.approx(29.79, abs=0.01)
     
     # Plan with excessive steering (>30 degrees = 0.52 rad)
     plan = MotionPlan(
@@ -82,3 +86,92 @@ def test_safety_valid_plan():
     
     # Should not raise
     monitor.check_motion_plan(plan, current_speed_mps=10.0)
+
+
+def test_safety_batch_sanitization():
+    """Test that a window of buffered commands is clamped in place."""
+    monitor = SafetyMonitor()
+    buffer = CommandBuffer(capacity=4)
+    buffer.append(throttle=0.5, brake=0.0, steering=0.1)
+    buffer.append(throttle=1.5, brake=-0.5, steering=-2.0)
+    
+    throttle, brake, steering = buffer.window(0, 2)
+    num_clamped = monitor.sanitize_batch(throttle, brake, steering)
+    
+    assert num_clamped == 1
+    assert buffer.throttle[0] == pytest.approx(0.5)
+    assert buffer.throttle[1] == 1.0
+    assert buffer.brake[1] == 0.0
+    assert buffer.steering[1] == -1.0
+
+
+def test_safety_batch_sanitization_clamps_nan():
+    """Test that NaN commands are clamped like the per-frame sanitizer does."""
+    monitor = SafetyMonitor()
+    throttle = np.array([np.nan, 0.5])
+    brake = np.array([0.0, np.nan])
+    steering = np.array([0.0, 0.0])
+    
+    num_clamped = monitor.sanitize_batch(throttle, brake, steering)
+    
+    scalar = monitor.sanitize_control_command(
+        ControlCommand(throttle=float("nan"), brake=float("nan"), steering=0.0)
+    )
+    assert num_clamped == 2
+    assert throttle.tolist() == [scalar.throttle, 0.5]
+    assert brake.tolist() == [0.0, scalar.brake]
+
+
+def test_safety_thread_vetoes_violation():
+    """Test that the safety thread latches a veto on violation."""
+    thread = SafetyThread()
+    thread.start()
+    
+    plan = MotionPlan(target_speed_mps=50.0, steering_angle_deg=0.0, reason="test")
+    cmd = ControlCommand(throttle=0.5, brake=0.0, steering=0.2)
+    thread.submit(plan, cmd, current_speed_mps=10.0)
+    thread.stop()
+    
+    assert thread.vetoed
+    assert "exceeds limit" in thread.last_violation
+    
+    fail_safe = thread.fail_safe_command(cmd)
+    assert fail_safe.throttle == 0.0
+    assert fail_safe.brake == 1.0
+    assert fail_safe.steering == 0.2
+
+
+def test_safety_thread_vetoes_failed_check():
+    """Test that a check raising an unexpected error fails closed."""
+    thread = SafetyThread()
+    thread.start()
+    
+    cmd = ControlCommand(throttle=0.5, brake=0.0, steering=0.2)
+    thread.submit(None, cmd, current_speed_mps=10.0)  # Malformed plan
+    thread.stop()
+    
+    assert thread.vetoed
+    assert thread.last_violation.startswith("Safety check failed")
+    
+    thread.clear_veto()
+    assert not thread.vetoed
+
+
+def test_safety_thread_keeps_handle_when_stop_times_out():
+    """Test that a worker still running after stop is not forgotten."""
+    release = threading.Event()
+    monitor = SafetyMonitor()
+    monitor.check_motion_plan = lambda plan, speed: release.wait()
+    thread = SafetyThread(monitor)
+    thread.start()
+    
+    plan = MotionPlan(target_speed_mps=10.0, steering_angle_deg=0.0, reason="test")
+    cmd = ControlCommand(throttle=0.1, brake=0.0, steering=0.0)
+    thread.submit(plan, cmd, current_speed_mps=10.0)
+    thread.stop(timeout=0.05)
+    
+    assert thread.is_running
+    
+    release.set()
+    thread.stop()
+    assert not thread.is_running
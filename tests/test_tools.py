@@ -0,0 +1,151 @@
+"""Tests for recording and replay tools."""
+
+import time
+
+import numpy as np
+
+from adas.cli import build_pipeline
+from adas.core.models import PerceptionFrame
+from adas.core.validation import validate_lane_model
+from adas.runtime import synthetic_frame
+from adas.tools.recorder import DataRecorder, RecordingConfig, RecordingPipeline
+from adas.tools.replayer import DataReplayer, ReplayConfig
+
+
+def test_record_and_replay_round_trip(tmp_path):
+    """Test that recorded frames replay with detections and lane intact."""
+    pipeline, _fps = build_pipeline()
+    recorder = DataRecorder(RecordingConfig(output_dir=str(tmp_path), recording_name="run"))
+    recording = RecordingPipeline(pipeline, recorder)
+    
+    recorder.start_recording()
+    frame = synthetic_frame()
+    for frame_id in range(3):
+        perception = PerceptionFrame(
+            frame_id=frame_id,
+            timestamp_s=time.time(),
+            rgb=frame,
+            width=frame.shape[1],
+            height=frame.shape[0],
+        )
+        recording.step(perception, current_speed_mps=10.0)
+    recorder.stop_recording()
+    
+    replayer = DataReplayer(ReplayConfig(recording_dir=str(tmp_path / "run")))
+    replayed = replayer.get_perception_frame(1)
+    
+    assert len(replayer.frames) == 3
+    assert replayed.frame_id == 1
+    assert replayed.detections[0].label == "vehicle"
+    assert replayed.lane == perception.lane
+    validate_lane_model(replayed.lane)
+
+
+def test_recorder_streams_pickle_records(tmp_path):
+    """Test that pickle recordings are written per frame and replay in order."""
+    recorder = DataRecorder(
+        RecordingConfig(output_dir=str(tmp_path), recording_name="run", format="pickle")
+    )
+    
+    recorder.start_recording()
+    for frame_id in range(4):
+        recorder.record_frame(
+            PerceptionFrame(frame_id=frame_id, timestamp_s=float(frame_id), rgb=None,
+                            width=1280, height=720)
+        )
+    recorder.stop_recording()
+    
+    replayer = DataReplayer(ReplayConfig(recording_dir=str(tmp_path / "run")))
+    
+    assert recorder.get_stats()["total_frames"] == 4
+    assert [frame["frame_id"] for frame in replayer.frames] == [0, 1, 2, 3]
+
+
+def test_replayer_maps_recorded_images(tmp_path):
+    """Test that recorded images replay as read-only views of frames.bin."""
+    recorder = DataRecorder(
+        RecordingConfig(output_dir=str(tmp_path), recording_name="run", record_images=True)
+    )
+    image = np.arange(2 * 4 * 3, dtype=np.uint8).reshape(2, 4, 3)
+    
+    recorder.start_recording()
+    for frame_id in range(2):
+        recorder.record_frame(
+            PerceptionFrame(frame_id=frame_id, timestamp_s=float(frame_id), rgb=image + frame_id,
+                            width=4, height=2)
+        )
+    recorder.stop_recording()
+    
+    replayer = DataReplayer(ReplayConfig(recording_dir=str(tmp_path / "run")))
+    replayed = replayer.get_perception_frame(1)
+    
+    np.testing.assert_array_equal(replayed.rgb, image + 1)
+    assert not replayed.rgb.flags.writeable
+    assert not replayed.rgb.flags.owndata
+
+
+def test_replay_iterator_follows_recorded_timing(tmp_path):
+    """Test that playback waits for the recorded (scaled) frame spacing."""
+    recorder = DataRecorder(RecordingConfig(output_dir=str(tmp_path), recording_name="run"))
+    recorder.start_recording()
+    for frame_id, timestamp_s in enumerate([0.0, 0.05, 0.04, 0.1]):
+        recorder.record_frame(
+            PerceptionFrame(frame_id=frame_id, timestamp_s=timestamp_s, rgb=None,
+                            width=1280, height=720)
+        )
+    recorder.stop_recording()
+    
+    replayer = DataReplayer(ReplayConfig(recording_dir=str(tmp_path / "run"), playback_speed=2.0))
+    start = time.perf_counter()
+    frame_ids = [frame["frame_id"] for frame in replayer.replay_iterator()]
+    elapsed = time.perf_counter() - start
+    
+    # Positive gaps 0.05 + 0.06 at 2x speed; the backward jump adds no delay
+    assert frame_ids == [0, 1, 2, 3]
+    assert 0.05 <= elapsed < 0.5
+
+
+def test_recorder_omits_disabled_sections(tmp_path):
+    """Test that record_* flags decide which sections are written."""
+    config = RecordingConfig(
+        output_dir=str(tmp_path), recording_name="run", record_plans=False, record_commands=False
+    )
+    recorder = DataRecorder(config)
+    pipeline, _ = build_pipeline()
+    frame = synthetic_frame()
+    perception = PerceptionFrame(
+        frame_id=0, timestamp_s=0.0, rgb=frame, width=frame.shape[1], height=frame.shape[0]
+    )
+    
+    recorder.start_recording()
+    RecordingPipeline(pipeline, recorder).step(perception, current_speed_mps=10.0)
+    recorder.stop_recording()
+    pipeline.close()
+    
+    record = DataReplayer(ReplayConfig(recording_dir=str(tmp_path / "run"))).frames[0]
+    assert "detections" in record and "lane" in record and "timing" in record
+    assert "plan" not in record and "command" not in record
+
+
+def test_replayer_reuses_decoded_perception(tmp_path):
+    """Test that replay decodes each frame's detections and lane once."""
+    pipeline, _ = build_pipeline()
+    recorder = DataRecorder(RecordingConfig(output_dir=str(tmp_path), recording_name="run"))
+    frame = synthetic_frame()
+    
+    recorder.start_recording()
+    RecordingPipeline(pipeline, recorder).step(
+        PerceptionFrame(frame_id=0, timestamp_s=0.0, rgb=frame,
+                        width=frame.shape[1], height=frame.shape[0]),
+        current_speed_mps=10.0,
+    )
+    recorder.stop_recording()
+    pipeline.close()
+    
+    replayer = DataReplayer(ReplayConfig(recording_dir=str(tmp_path / "run")))
+    first = replayer.get_perception_frame(0)
+    second = replayer.get_perception_frame(0)
+    
+    assert first is not second
+    assert first.lane is second.lane
+    assert first.detections[0] is second.detections[0]
@@ -1,8 +1,11 @@
 """Tests for multi-object tracker."""
 
+import pytest
 
-from adas.core.models import BoundingBox
+from adas.core.exceptions import ConfigurationError
+from adas.core.models import BoundingBox, BoundingBoxArray, TrackedObject, TrackedObjectArray
 from adas.tracking import MultiObjectTracker
+from adas.tracking import tracker as tracker_module
 
 
 def test_tracker_creates_new_track():
@@ -54,6 +57,9 @@ def test_tracker_creates_multiple_tracks():
     
     assert len(tracked) == 2
     assert tracked[0].track_id != tracked[1].track_id
+    assert tracker.distances.tolist() == [obj.distance_m for obj in tracked]
+    nearest = min(tracked, key=lambda obj: obj.distance_m)
+    assert tracked[tracker.nearest_index].track_id == nearest.track_id
 
 
 def test_tracker_deletes_lost_tracks():
@@ -71,7 +77,7 @@ def test_tracker_deletes_lost_tracks():
         tracker.update([])
     
     # Track should be gone
-    assert len(tracker._tracks) == 0
+    assert tracker.num_tracks == 0
 
 
 def test_tracker_distance_estimation():
@@ -101,5 +107,151 @@ def test_tracker_reset():
     
     tracker.reset()
     
-    assert len(tracker._tracks) == 0
+    assert tracker.num_tracks == 0
     assert tracker._next_track_id == 1
+
+
+def test_tracker_associates_nearest_within_threshold():
+    """Test that each track keeps the nearest detection inside the threshold."""
+    tracker = MultiObjectTracker(association_threshold_px=50.0)
+    
+    tracker.update([
+        BoundingBox(x1=100, y1=100, x2=200, y2=200, confidence=0.9, label="car"),
+        BoundingBox(x1=400, y1=100, x2=500, y2=200, confidence=0.9, label="car"),
+    ])
+    
+    # Second track moved beyond the threshold; a new object appears near the first
+    tracked = tracker.update([
+        BoundingBox(x1=470, y1=100, x2=570, y2=200, confidence=0.9, label="car"),
+        BoundingBox(x1=130, y1=100, x2=230, y2=200, confidence=0.9, label="car"),
+        BoundingBox(x1=110, y1=100, x2=210, y2=200, confidence=0.9, label="car"),
+    ])
+    
+    boxes = {obj.track_id: obj.box.x1 for obj in tracked}
+    assert boxes[1] == 110
+    assert boxes[2] == 400  # Missed this frame, box kept
+    assert sorted(boxes.values()) == [110, 130, 400, 470]
+
+
+def test_tracker_returns_batch_with_object_view():
+    """Test that the tracked batch converts to the equivalent dataclasses."""
+    tracker = MultiObjectTracker()
+    
+    detections = BoundingBoxArray.from_boxes([
+        BoundingBox(x1=100, y1=100, x2=200, y2=200, confidence=0.5, label="truck"),
+        BoundingBox(x1=400, y1=100, x2=500, y2=150, confidence=0.9, label="pedestrian"),
+    ])
+    
+    tracked = tracker.update(detections)
+    objects = tracked.as_objects()
+    
+    assert isinstance(tracked, TrackedObjectArray)
+    assert all(isinstance(obj, TrackedObject) for obj in objects)
+    assert [obj.track_id for obj in objects] == tracked.track_ids.tolist() == [1, 2]
+    assert [obj.box.label for obj in objects] == ["truck", "pedestrian"]
+    assert objects[0].box.confidence == pytest.approx(0.5)
+    assert tracked.distance_m.tolist() == [obj.distance_m for obj in objects]
+    
+    # The batch is a snapshot: later updates do not modify it
+    tracker.update([BoundingBox(x1=110, y1=100, x2=210, y2=200, confidence=0.9, label="car")])
+    assert tracked.coords[0].tolist() == [100.0, 100.0, 200.0, 200.0]
+
+
+def test_tracker_optimal_association_avoids_greedy_steal():
+    """Test that optimal association matches both tracks where greedy drops one."""
+    pytest.importorskip("scipy")
+    
+    def run(association):
+        tracker = MultiObjectTracker(association_threshold_px=100.0, association=association)
+        tracker.update([
+            BoundingBox(x1=150, y1=0, x2=250, y2=100, confidence=0.9, label="car"),
+            BoundingBox(x1=200, y1=0, x2=300, y2=100, confidence=0.9, label="car"),
+        ])
+        # Track 1 is nearest to the first detection, which track 2 needs more
+        tracked = tracker.update([
+            BoundingBox(x1=190, y1=0, x2=290, y2=100, confidence=0.9, label="car"),
+            BoundingBox(x1=90, y1=0, x2=190, y2=100, confidence=0.9, label="car"),
+        ])
+        return {obj.track_id: obj.box.x1 for obj in tracked}
+    
+    assert run("optimal") == {1: 90, 2: 190}
+    assert run("greedy") == {1: 190, 2: 200, 3: 90}
+
+
+def test_tracker_warns_once_when_optimal_falls_back(monkeypatch):
+    """Test that a missing SciPy is reported once instead of silently going greedy."""
+    warnings = []
+    monkeypatch.setattr(tracker_module, "SCIPY_AVAILABLE", False)
+    monkeypatch.setattr(tracker_module, "_warned_no_scipy", False)
+    monkeypatch.setattr(tracker_module.logger, "warning", lambda *args: warnings.append(args))
+    
+    MultiObjectTracker(association="optimal")
+    MultiObjectTracker(association="optimal")
+    MultiObjectTracker(association="greedy")
+    
+    assert len(warnings) == 1
+    assert "SciPy" in warnings[0][0]
+
+
+def test_tracker_rejects_unknown_association():
+    """Test that an unknown association method is a configuration error."""
+    with pytest.raises(ConfigurationError):
+        MultiObjectTracker(association="nearest")
+
+
+def test_tracker_associates_within_class():
+    """Test that class-aware tracking never matches across labels."""
+    first = [
+        BoundingBox(x1=100, y1=100, x2=200, y2=200, confidence=0.9, label="car"),
+        BoundingBox(x1=400, y1=100, x2=450, y2=200, confidence=0.9, label="pedestrian"),
+    ]
+    # The pedestrian moved next to the car's old position, the car moved right
+    second = [
+        BoundingBox(x1=110, y1=100, x2=160, y2=200, confidence=0.9, label="pedestrian"),
+        BoundingBox(x1=190, y1=100, x2=290, y2=200, confidence=0.9, label="car"),
+    ]
+    
+    tracker = MultiObjectTracker(association_threshold_px=400.0)
+    tracker.update(first)
+    tracked = tracker.update(second)
+    assert {obj.track_id: obj.box.label for obj in tracked} == {1: "car", 2: "pedestrian"}
+    assert {obj.track_id: obj.box.x1 for obj in tracked} == {1: 190, 2: 110}
+    
+    tracker = MultiObjectTracker(association_threshold_px=400.0, class_aware=False)
+    tracker.update(first)
+    tracked = tracker.update(second)
+    assert {obj.track_id: obj.box.label for obj in tracked}[1] == "pedestrian"
+
+
+def test_tracker_skips_invalid_list_detections():
+    """Test that invalid boxes in a list are dropped by the batch validation."""
+    tracker = MultiObjectTracker()
+    
+    tracked = tracker.update([
+        BoundingBox(x1=200, y1=100, x2=100, y2=200, confidence=0.9, label="car"),  # x2 < x1
+        BoundingBox(x1=100, y1=100, x2=200, y2=200, confidence=1.5, label="car"),
+        BoundingBox(x1=float("nan"), y1=100, x2=200, y2=200, confidence=0.9, label="car"),
+        BoundingBox(x1=300, y1=100, x2=400, y2=200, confidence=0.9, label="car"),
+    ])
+    
+    assert [obj.box.x1 for obj in tracked] == [300]
+
+
+def test_tracker_estimates_range_rate_from_history():
+    """Test velocity as the distance change over the history window."""
+    def box(height):
+        return [BoundingBox(x1=100, y1=100, x2=200, y2=100 + height, confidence=0.9, label="car")]
+    
+    tracker = MultiObjectTracker(focal_length_px=1000.0, history_len=3)
+    assert tracker.update(box(100), timestamp_s=0.0)[0].velocity_mps == 0.0  # 10 m
+    tracker.update(box(125), timestamp_s=0.5)  # 8 m
+    assert tracker.update(box(200), timestamp_s=1.0)[0].velocity_mps == pytest.approx(-5.0)
+    
+    # The ring keeps only the last three samples: 8 m -> 5 m -> 4 m over 1 s
+    tracked = tracker.update(box(250), timestamp_s=1.5)
+    assert tracked[0].velocity_mps == pytest.approx(-4.0)
+    
+    # Without timestamps the tracker advances by default_dt_s per update
+    tracker = MultiObjectTracker(focal_length_px=1000.0, default_dt_s=0.1)
+    tracker.update(box(100))
+    assert tracker.update(box(125))[0].velocity_mps == pytest.approx(-20.0)
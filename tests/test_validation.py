@@ -1,11 +1,14 @@
 """Tests for validation module."""
 
+import numpy as np
 import pytest
 
 from adas.core.exceptions import ValidationError
-from adas.core.models import BoundingBox, ControlCommand, MotionPlan
+from adas.core.models import BoundingBox, BoundingBoxArray, ControlCommand, MotionPlan
 from adas.core.validation import (
     validate_bounding_box,
+    validate_bounding_box_array,
+    validate_config_value,
     validate_control_command,
     validate_motion_plan,
 )
@@ -61,3 +64,35 @@ def test_validate_control_command_invalid_throttle():
     
     with pytest.raises(ValidationError, match="Throttle must be"):
         validate_control_command(cmd)
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["0.5", None, float("nan"), float("inf"), -float("inf"), 2.0, 0.5j, np.array([0.5, 0.6])],
+)
+def test_validate_config_value_rejects_invalid(value):
+    """Test that non-numeric, non-finite and out-of-range values are rejected."""
+    with pytest.raises(ValidationError):
+        validate_config_value("gain", value, 0.0, 1.0)
+
+
+def test_validate_config_value_accepts_numbers():
+    """Test that ints and floats within range are accepted."""
+    validate_config_value("count", 3, 1, 10)
+    validate_config_value("gain", 0.5, 0.0, 1.0)
+
+
+def test_validate_bounding_box_array():
+    """Test batch validation reports the first invalid box."""
+    boxes = BoundingBoxArray.from_boxes([
+        BoundingBox(x1=10, y1=20, x2=30, y2=40, confidence=0.8, label="car"),
+        BoundingBox(x1=30, y1=20, x2=10, y2=40, confidence=0.8, label="car"),
+    ])
+    validate_bounding_box_array(BoundingBoxArray.from_boxes([boxes[0]]))
+    
+    with pytest.raises(ValidationError, match="Box 1: Invalid box width"):
+        validate_bounding_box_array(boxes)
+    
+    boxes.coords[0, 0] = float("nan")
+    with pytest.raises(ValidationError, match="Box 0: non-finite"):
+        validate_bounding_box_array(boxes)